@@ -39,7 +39,8 @@ from pathpy.algorithms.components import (
     largest_component_size,
     mean_component_size,
     largest_connected_component,
-    is_connected)
+    is_connected,
+    IncrementalComponents)
 
 from pathpy.algorithms.trees import (
     tree_size,
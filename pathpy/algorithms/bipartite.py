@@ -23,24 +23,26 @@ def one_mode_projection(bipartite_net, partition='partition', projection=0, type
         other_partition = 1
     else:
         other_partition = 0
+    # select the nodes of the other partition via the attribute columns
+    inverse = bipartite_net.nodes.inverse_index
+    nodes = [bipartite_net.nodes[inverse[i]] for i in
+             bipartite_net.nodes.where(**{partition: other_partition})]
+
     if type == 'dyadic':
-        nodes = [v for v in bipartite_net.nodes if v[partition] == other_partition]
         # connect pairs of nodes in projected partition that have a common neighbour in other partition
         if temporal == False:
             n = Network(directed=False, multiedges=True)
         else:
             n = TemporalNetwork(directed=False, multiedges=True)
-        for v in bipartite_net.nodes:
-            if v[partition] == projection:
-                n.add_node(v.uid, **v.attributes)
+        for i in bipartite_net.nodes.where(**{partition: projection}):
+            v = bipartite_net.nodes[inverse[i]]
+            n.add_node(v.uid, **v.attributes)
         for v in nodes:
             # connect pairs of nodes in projection partition that have common neighbour in other partition
             neighbors = set([x.uid for x in bipartite_net.predecessors[v.uid]])
             for i, j in combinations(neighbors, 2):
                 n.add_edge(i, j, uid='{0}-{1}[{2}]'.format(i,j,v.uid), node=v.uid, **v.attributes)                
     elif type == 'hypergraph' or type == 'polyadic':
-        # collect nodes in other partition
-        nodes = [v for v in bipartite_net.nodes if v[partition] == other_partition]
         n = HyperGraph()
         for v in nodes:
             # connect sets of nodes in projection partition that have common neighbour in other partition
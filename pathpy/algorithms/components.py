@@ -9,9 +9,11 @@
 # Copyright (c) 2016-2020 Pathpy Developers
 # =============================================================================
 from __future__ import annotations
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Set
 from collections import defaultdict
 
+import numpy as np
+
 from pathpy import logger, tqdm
 
 # pseudo load class for type checking
@@ -99,7 +101,7 @@ def mean_component_size(network: Network) -> float:
     """
     components = find_connected_components(network)
     component_sizes = [len(nodes) for comp, nodes in components.items()]
-    return np.mean(component_sizes)
+    return float(np.mean(component_sizes))
 
 
 def largest_connected_component(network: Network) -> Network:
@@ -115,14 +117,9 @@ def largest_connected_component(network: Network) -> Network:
             max_size = len(components[i])
             max_comp = components[i]
 
-    LOG.debug('Copying network')
-    lcc = network.copy()
-
-    LOG.debug('Removing nodes outside largest component')
-    for v in list(lcc.nodes.keys()):
-        if v not in max_comp:
-            lcc.remove_node(v)
-    return lcc
+    LOG.debug('Creating network of the largest component')
+    return network.subgraph(max_comp).materialize(uid=network.uid,
+                                                  copy=True)
 
 
 @property
@@ -140,3 +137,136 @@ def largest_component_size(network: Network) -> int:
         return max(map(len, components.values()))
     else:
         return 0
+
+
+class IncrementalComponents:
+    """Weakly connected components of a network updated incrementally.
+
+    The components are stored in a union-find structure which subscribes to
+    the changes of the network (see :py:meth:`Network.subscribe`). Added
+    nodes and edges are merged in almost constant time. Since union-find
+    structures cannot be split, removals only mark the components as
+    outdated and they are rebuilt once on the next access.
+
+    .. note::
+
+        For directed networks the components are weakly connected, i.e. the
+        directions of the edges are ignored.
+
+    Parameters
+    ----------
+    network : Network
+
+        The network whose components are tracked.
+
+    Examples
+    --------
+    >>> import pathpy as pp
+    >>> net = pp.Network(directed=False)
+    >>> components = pp.algorithms.IncrementalComponents(net)
+    >>> net.add_edges(('a', 'b'), ('c', 'd'))
+    >>> components.number_of_components()
+    2
+    >>> net.add_edge('b', 'c')
+    >>> components.largest_component_size()
+    4
+
+    """
+
+    def __init__(self, network: Network) -> None:
+        """Initialize the components and subscribe to the network."""
+        self.network: Network = network
+
+        # parent and size of the sets {uid: uid} and {root: size}
+        self._parent: Dict[str, str] = {}
+        self._size: Dict[str, int] = {}
+
+        # indicator if the sets have to be rebuilt (i.e. after removals)
+        self._dirty: bool = True
+
+        self._callbacks: Dict[str, Any] = {
+            'add_node': lambda _, node: self._add(node.uid),
+            'add_edge': lambda _, edge: self._union(edge.v.uid, edge.w.uid),
+            'remove_node': self._invalidate,
+            'remove_edge': self._invalidate,
+        }
+        for event, callback in self._callbacks.items():
+            network.subscribe(event, callback)
+
+    def close(self) -> None:
+        """Unsubscribe from the network."""
+        for event, callback in self._callbacks.items():
+            self.network.unsubscribe(event, callback)
+
+    def component(self, uid: str) -> str:
+        """Returns the uid of the representative node of a component."""
+        self._rebuild()
+        return self._find(uid)
+
+    def components(self) -> Dict[int, Set[str]]:
+        """Returns the components as dict {integer id: set of node uids}."""
+        self._rebuild()
+        components: dict = defaultdict(set)
+        for uid in self._parent:
+            components[self._find(uid)].add(uid)
+        return dict(enumerate(components.values()))
+
+    def component_sizes(self) -> List[int]:
+        """Returns the sizes of the components."""
+        self._rebuild()
+        return list(self._size.values())
+
+    def number_of_components(self) -> int:
+        """Returns the number of components."""
+        self._rebuild()
+        return len(self._size)
+
+    def largest_component_size(self) -> int:
+        """Returns the size of the largest component."""
+        self._rebuild()
+        return max(self._size.values(), default=0)
+
+    def _add(self, uid: str) -> None:
+        """Helper function to add a node as new set."""
+        if uid not in self._parent:
+            self._parent[uid] = uid
+            self._size[uid] = 1
+
+    def _find(self, uid: str) -> str:
+        """Helper function to find the root of a set (path halving)."""
+        parent = self._parent
+        while parent[uid] != uid:
+            parent[uid] = parent[parent[uid]]
+            uid = parent[uid]
+        return uid
+
+    def _union(self, v: str, w: str) -> None:
+        """Helper function to merge the sets of two nodes (union by size)."""
+        if self._dirty:
+            return
+
+        self._add(v)
+        self._add(w)
+        v, w = self._find(v), self._find(w)
+        if v == w:
+            return
+
+        if self._size[v] < self._size[w]:
+            v, w = w, v
+        self._parent[w] = v
+        self._size[v] += self._size.pop(w)
+
+    def _invalidate(self, *_: Any) -> None:
+        """Helper function to mark the components as outdated."""
+        self._dirty = True
+
+    def _rebuild(self) -> None:
+        """Helper function to rebuild the sets from the network."""
+        if not self._dirty:
+            return
+
+        self._parent, self._size, self._dirty = {}, {}, False
+        for uid in self.network.nodes.keys():
+            self._add(uid)
+        for edge in self.network.edges:
+            self._union(edge.v.uid, edge.w.uid)
@@ -9,7 +9,7 @@
 # Copyright (c) 2016-2019 Pathpy Developers
 # =============================================================================
 from __future__ import annotations
-from typing import Any, List, Union, Optional, Dict
+from typing import Any, Union, Optional
 from functools import singledispatch
 
 import numpy as np
@@ -87,32 +87,30 @@ def _network(self, weight: Optional[str] = None,
              **kwargs: Any) -> sparse.csr_matrix:
     """Returns a sparse adjacency matrix of the network."""
 
-    # initializing variables
-    rows: List[int] = list()
-    cols: List[int] = list()
-    entries: List[float] = list()
-    index: Dict[str, int] = self.nodes.index
+    # get the compiled version of the network
+    csr = self.compile()
 
     # get number of nodes
     n = self.number_of_nodes()
 
-    # iterate over the edges of the network
-    for e in self.edges.values():
-
-        # directed network
-        rows.append(index[e.v.uid])
-        cols.append(index[e.w.uid])
-        if count:
-            entries.append(self.edges.counter[e.uid])
-        else:
-            entries.append(e.weight(weight))
-
-        # add additional nodes if not directed
-        if directed is False or not self.directed:
-            if e.v.uid != e.w.uid or loops == 2:
-                rows.append(index[e.w.uid])
-                cols.append(index[e.v.uid])
-                entries.append(e.weight(weight))
+    # get the entries of the edges
+    if count:
+        entries = csr.count
+    elif not weight:
+        entries = np.ones(len(csr.v))
+    elif weight is True or weight == 'weight':
+        entries = csr.weight
+    else:
+        entries = self.edges.weights(weight)
+
+    rows, cols = csr.v, csr.w
+
+    # add additional entries if not directed
+    if directed is False or not self.directed:
+        mask = np.ones(len(rows), dtype=bool) if loops == 2 else rows != cols
+        rows, cols = (np.concatenate((rows, cols[mask])),
+                      np.concatenate((cols, rows[mask])))
+        entries = np.concatenate((entries, entries[mask]))
 
     A = sparse.csr_matrix((entries, (rows, cols)), shape=(n, n))
     if transposed:
@@ -177,7 +177,7 @@ def all_paths_from_dag(dag: ABCDirectedAcyclicGraph, node_mapping=None, max_subp
                     if repetitions:
                         path = tuple([x for x in p])
                     else:
-                        path = tuple(set([x for x in p]))
+                        path = tuple(dict.fromkeys(p))
                     if unique:
                         paths.add(list(path), count=1, uid='-'.join(x.uid for x in path))
                     else:
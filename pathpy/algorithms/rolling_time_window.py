@@ -8,18 +8,41 @@
 #
 # Copyright (c) 2016-2020 Pathpy Developers
 # =============================================================================
+from collections import Counter
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+from pathpy.core.temporal import EventWindow, _item
 from pathpy.models.temporal_network import TemporalNetwork
 from pathpy.models.network import Network
+from pathpy.models.compiled_network import CompiledNetwork
 
-from typing import Union, Tuple, List, Optional
 
 class RollingTimeWindow:
     """
     An iterable rolling time window that can be used to perform time slice
     analyses of temporal networks.
+
+    The time-slice network is updated incrementally: in each step the events
+    entering the window are added and the events leaving the window are
+    evicted. The edge counts are the numbers of events of the edges within
+    the current window. The events and their attributes are read once from
+    the arrays of the event windows of the temporal network.
+
+    In each step a read-only snapshot of the network is returned (see
+    :py:meth:`Network.snapshot`), i.e. the returned networks are not changed
+    by later steps. Since a snapshot shares the node and edge stores with
+    the time-slice network, the first change in the next step clones them.
+    Hence, a step costs O(n + m) in the size of the current time-slice
+    network in addition to the entering and leaving events. If the returned
+    networks are not kept, ``compiled=True`` returns the compiled arrays
+    without cloning the stores.
     """
 
-    def __init__(self, temporal_net: TemporalNetwork, window_size: int, step_size: int=1, return_window: bool=False):
+    def __init__(self, temporal_net: TemporalNetwork, window_size: int,
+                 step_size: int = 1, return_window: bool = False,
+                 compiled: bool = False):
         """
         Initialises a RollingTimeWindow instance that can be used to
         iterate through a sequence of time-slice networks for a given
@@ -36,12 +59,13 @@ class RollingTimeWindow:
         step_size:      int
             The step size in time units by which the starting time of the rolling
             window will be incremented on each iteration. Default is 1.
-        directed:       bool
-            Whether or not the generated time-slice networks should be directed.
-            Default is true.
         return_window: bool
             Whether or not the iterator shall return the current time window
             as a second return value. Default is False.
+        compiled: bool
+            Whether or not the iterator shall return an immutable
+            CompiledNetwork of the time-slice network instead of a snapshot
+            of the network. Default is False.
 
         Returns
         -------
@@ -58,6 +82,9 @@ class RollingTimeWindow:
             >>> for n, w in pathpy.RollingTimeWindow(t, window_size=100, step_size=10, return_window=True):
             >>>     print('Time window starting at {0} and ending at {1}'.format(w[0], w[1]))
             >>>     print(network)
+            >>>
+            >>> for c in pathpy.RollingTimeWindow(t, window_size=100, compiled=True):
+            >>>     print(c.count)
         """
         self.temporal_network = temporal_net
         self.window_size = window_size
@@ -66,20 +93,154 @@ class RollingTimeWindow:
         self.max_time = temporal_net.end
         self.directed = temporal_net.directed
         self.return_window = return_window
+        self.compiled = compiled
+
+        # time-slice network which is updated in each step
+        self.network = Network(directed=self.directed)
+
+        # events of the nodes and edges sorted by their start and end times
+        edges = temporal_net.edges.window()
+        self._events = [_Events(temporal_net.nodes.window()), _Events(edges)]
+
+        # uids of the source and target nodes of the edge events
+        self._v: List[str] = edges.v.tolist()
+        self._w: List[str] = edges.w.tolist()
+
+        # number of events (incl. edge events) per node in the window
+        self._nodes: Counter = Counter()
+
+        # uids of the edges in the network per (sorted) node pair
+        self._edges: Dict[tuple, str] = {}
 
     def __iter__(self):
         return self
 
-    def __next__(self) -> Union[Network, Tuple[Network, List]]:
+    def __next__(self) -> Union[Network, CompiledNetwork,
+                                Tuple[Union[Network, CompiledNetwork], List]]:
         if self.current_time+self.window_size <= self.max_time:
             time_window = [self.current_time, self.current_time+self.window_size]
-            n = Network.from_temporal_network(self.temporal_network, min_time=self.current_time,
-                                              max_time=self.current_time+self.window_size,
-                                              directed=self.directed)
+            self._update(*time_window)
             self.current_time += self.step_size
+
+            n = self.network.compile() if self.compiled \
+                else self.network.snapshot()
             if self.return_window:
                 return n, time_window
             else:
                 return n
         else:
             raise StopIteration()
+
+    def _update(self, start: Any, end: Any) -> None:
+        """Helper function to move the network to the window [start, end]."""
+        nodes, edges = self._events
+        v, w = self._v, self._w
+
+        # add the events which start before the end of the window
+        for i in nodes.enter(end):
+            self._add_node(nodes.uids[i], nodes.data(i))
+        for i in edges.enter(end):
+            self._add_edge(edges.uids[i], v[i], w[i], edges.data(i))
+
+        # evict the events which ended before the start of the window
+        for i in edges.evict(start):
+            self._remove_edge(v[i], w[i])
+        for i in nodes.evict(start):
+            self._remove_node(nodes.uids[i])
+
+    def _key(self, v: str, w: str) -> tuple:
+        """Helper function to return the key of a node pair."""
+        return (v, w) if self.directed or v <= w else (w, v)
+
+    def _add_node(self, uid: str, attributes: Dict[str, Any]) -> None:
+        """Helper function to add a node event."""
+        self._nodes[uid] += 1
+        if self._nodes[uid] == 1:
+            self.network.add_node(uid, **attributes)
+
+    def _remove_node(self, uid: str) -> None:
+        """Helper function to evict a node event."""
+        self._nodes[uid] -= 1
+        if self._nodes[uid] == 0:
+            del self._nodes[uid]
+            self.network.remove_node(uid)
+
+    def _add_edge(self, uid: str, v: str, w: str,
+                  attributes: Dict[str, Any]) -> None:
+        """Helper function to add an edge event."""
+        for node in (v, w):
+            self._add_node(node, {})
+
+        key = self._key(v, w)
+        if key in self._edges:
+            self.network.edges.counter[self._edges[key]] += 1
+        else:
+            self._edges[key] = uid
+            self.network.add_edge(v, w, uid=uid, **attributes)
+
+    def _remove_edge(self, v: str, w: str) -> None:
+        """Helper function to evict an edge event."""
+        key = self._key(v, w)
+        uid = self._edges[key]
+        counter = self.network.edges.counter
+        counter[uid] -= 1
+        if counter[uid] == 0:
+            del self._edges[key]
+            self.network.remove_edge(uid)
+
+        for uid in (v, w):
+            self._remove_node(uid)
+
+
+class _Events:
+    """Events of a temporal collection sorted by their start and end times."""
+
+    def __init__(self, window: EventWindow) -> None:
+        self.uids: List[str] = window.uids.tolist()
+        self.start: np.ndarray = window.start
+        self.end: np.ndarray = window.end
+
+        # attribute columns of the events (None marks missing values)
+        self.columns: Dict[str, list] = {
+            key: window[key].tolist() for key in window.keys()}
+
+        # order of the events by their end times
+        self.order: np.ndarray = np.argsort(self.end, kind='stable')
+        self.sorted_end: np.ndarray = self.end[self.order]
+
+        # number of added and evicted events
+        self.added = 0
+        self.evicted = 0
+
+    def enter(self, end: Any) -> List[int]:
+        """Return the events which start before the end of the window."""
+        added = int(np.searchsorted(self.start, end, side='left'))
+        events = list(range(self.added, max(added, self.added)))
+        self.added = max(added, self.added)
+        return events
+
+    def evict(self, start: Any) -> List[int]:
+        """Return the events which end before the start of the window."""
+        evicted = int(np.searchsorted(self.sorted_end, start, side='right'))
+        events = self.order[self.evicted:evicted].tolist()
+        self.evicted = max(evicted, self.evicted)
+        return events
+
+    def data(self, i: int) -> Dict[str, Any]:
+        """Return the attributes of an event."""
+        data = {'start': _item(self.start[i]), 'end': _item(self.end[i])}
+        for key, column in self.columns.items():
+            if column[i] is not None:
+                data[key] = column[i]
+        return data
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
@@ -8,20 +8,70 @@
 #
 # Copyright (c) 2016-2021 Pathpy Developers
 # =============================================================================
-from typing import Any, Optional, Union, Dict
-from copy import deepcopy
+from typing import (Any, Optional, Union, Iterable, Mapping, Sequence,
+                    Hashable, Dict, TypeVar)
+from copy import copy, deepcopy
 from collections import defaultdict, Counter
+from collections.abc import Mapping as ABCMapping, Sequence as ABCSequence
+import operator
+import weakref
+from types import MappingProxyType
+import numpy as np
 from singledispatchmethod import singledispatchmethod  # NOTE: not needed at 3.9
 from pathpy import logger
+from pathpy.utils.memory import sizeof
 
 
 # create logger for the Path class
 LOG = logger(__name__)
 
+# type of the collection returned by _snapshot and the object of _clone
+_Collection = TypeVar('_Collection', bound='PathPyCollection')
+_Object = TypeVar('_Object', bound='PathPyObject')
+
+
+class AttributeLog:
+    """Bounded log of the attribute changes of the objects of a collection.
+
+    Each entry is a tuple ``(obj, key, present)``, where ``present`` states
+    whether the object had the attribute before the change. Caches (e.g.
+    attribute columns or weighted degrees) remember the :py:attr:`position`
+    they are in sync with and apply the subsequent entries. If more than
+    ``size`` entries are logged the oldest half is dropped; caches which
+    missed dropped entries have to be rebuilt.
+    """
+
+    def __init__(self, size: int = 2**16) -> None:
+        self._entries: list = []
+        self._offset: int = 0
+        self._size: int = size
+
+    @property
+    def position(self) -> int:
+        """Return the number of logged changes."""
+        return self._offset + len(self._entries)
+
+    def append(self, obj: Any, key: Any, present: bool) -> None:
+        """Log the change of an attribute of an object."""
+        self._entries.append((obj, key, present))
+        if len(self._entries) > self._size:
+            half = len(self._entries) // 2
+            del self._entries[:half]
+            self._offset += half
+
+    def since(self, position: int) -> Optional[list]:
+        """Return the changes after a position or None if they were dropped."""
+        if position < self._offset:
+            return None
+        return self._entries[position - self._offset:]
+
 
 class PathPyObject:
     """Base class for all pathpy core objects."""
 
+    # slots reduce the memory of the (many) node and edge objects
+    __slots__ = ('_uid', '_has_python_uid', '_attributes', '_logs')
+
     def __init__(self, uid: Optional[str] = None, **kwargs: Any) -> None:
         """Initialize the base class."""
 
@@ -30,6 +80,9 @@ class PathPyObject:
         self._has_python_uid: bool
         self._attributes: Any
 
+        # weak refs to the logs of the observing collections (see _observe)
+        self._logs: Optional[tuple] = None
+
         # assign node identifier
         if uid is not None:
             self._uid = uid
@@ -38,8 +91,8 @@ class PathPyObject:
             self._uid = hex(id(self))
             self._has_python_uid = True
 
-        # update attributes
-        self._attributes = kwargs
+        # update attributes (the dict is only allocated if needed)
+        self._attributes = kwargs if kwargs else None
 
     def __setitem__(self, key: Any, value: Any) -> None:
         """Add a specific attribute to the object.
@@ -69,7 +122,10 @@ class PathPyObject:
 
         """
 
-        self._attributes[key] = value
+        attributes = self._own_attributes()
+        if self._logs is not None:
+            self._log((key,), attributes)
+        dict.__setitem__(attributes, key, value)
 
     def __getitem__(self, key: Any) -> Any:
         """Returns a specific attribute of the object.
@@ -104,6 +160,8 @@ class PathPyObject:
         'blue'
 
         """
+        if self._attributes is None:
+            return None
         return self._attributes.get(key, None)
 
     def __repr__(self) -> str:
@@ -170,6 +228,9 @@ class PathPyObject:
     def attributes(self) -> dict:
         """Return the attributes of the object as a dict.
 
+        Changes of the returned dict are logged like changes via
+        :py:meth:`__setitem__` and :py:meth:`update`.
+
         Returns
         -------
         dict
@@ -186,7 +247,14 @@ class PathPyObject:
         'red'
 
         """
-        return self._attributes
+        attributes = self._attributes
+        if attributes is None:
+            # the dict is only stored on the first write
+            return AttributeDict(self)
+        if type(attributes) is not AttributeDict or \
+                attributes._owner is not self:
+            attributes = self._attributes = AttributeDict(self, attributes)
+        return attributes
 
     def update(self, **kwargs: Any) -> None:
         """Update the attributes of the object.
@@ -214,7 +282,104 @@ class PathPyObject:
 
         """
 
-        self._attributes.update(**kwargs)
+        if not kwargs:
+            return
+
+        attributes = self._own_attributes()
+        if self._logs is not None:
+            self._log(kwargs, attributes)
+        dict.update(attributes, kwargs)
+
+    def _own_attributes(self) -> dict:
+        """Helper function to return the attribute dict for a write.
+
+        The dict is allocated on the first write. Attributes shared with a
+        clone (see :py:meth:`_clone`) are copied before they are changed.
+        """
+        attributes = self._attributes
+        if attributes is None:
+            attributes = self._attributes = {}
+        elif type(attributes) is MappingProxyType:
+            attributes = self._attributes = dict(attributes)
+        return attributes
+
+    def _clone(self: _Object, objects: dict) -> _Object:
+        """Helper function to return a shallow clone of the object.
+
+        The attributes are shared as read-only proxy by the object and the
+        clone and copied on the first write of either of them. A dict
+        returned by :py:attr:`attributes` stays with the object, i.e. the
+        clone gets a copy. The clone is not observed by any log.
+        """
+        other = object.__new__(type(self))
+        data = getattr(self, '__dict__', None)
+        if data:
+            other.__dict__.update(data)
+        for slot in _slots(type(self)):
+            try:
+                setattr(other, slot, getattr(self, slot))
+            except AttributeError:
+                pass
+        other._logs = None
+
+        attributes = self._attributes
+        if type(attributes) is AttributeDict:
+            other._attributes = dict(attributes)
+        elif attributes is not None:
+            if type(attributes) is not MappingProxyType:
+                attributes = self._attributes = MappingProxyType(attributes)
+            other._attributes = attributes
+        return other
+
+    def _replace_attributes(self, attributes: Optional[dict]) -> None:
+        """Helper function to replace all attributes and log the changes."""
+        if self._logs is not None:
+            old = self._attributes or {}
+            self._log(dict.fromkeys((*old, *(attributes or {}))), old)
+        self._attributes = attributes
+
+    def _log(self, keys: Iterable, attributes: dict) -> None:
+        """Helper function to log changes of keys to the observing logs.
+
+        The attributes before the change state whether the keys were present.
+        Refs to logs of deleted collections are dropped.
+        """
+        refs = self._logs or ()
+        logs = [log for log in (ref() for ref in refs) if log is not None]
+        if len(logs) < len(refs):
+            self._logs = tuple(weakref.ref(log) for log in logs) or None
+        for log in logs:
+            for key in keys:
+                log.append(self, key, key in attributes)
+
+    def _observe(self, ref: weakref.ref) -> None:
+        """Helper function to log the attribute changes to a (weak) log."""
+        if self._logs is None:
+            self._logs = (ref,)
+        elif ref not in self._logs:
+            self._logs += (ref,)
+
+    def _unobserve(self, ref: weakref.ref) -> None:
+        """Helper function to stop logging the changes to a (weak) log."""
+        if self._logs is not None:
+            self._logs = tuple(r for r in self._logs if r is not ref) or None
+
+    def __getstate__(self) -> tuple:
+        """Return the state of the object without the refs to the logs."""
+        slots = {slot: getattr(self, slot) for slot in _slots(type(self))
+                 if hasattr(self, slot)}
+        if type(slots.get('_attributes', None)) is MappingProxyType:
+            slots['_attributes'] = dict(slots['_attributes'])
+        return getattr(self, '__dict__', None), slots
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restore the object, which is not observed by any log."""
+        data, slots = state
+        if data:
+            self.__dict__.update(data)
+        for slot, value in slots.items():
+            setattr(self, slot, value)
+        self._logs = None
 
     def copy(self):
         """Return a copy of the node.
@@ -234,7 +399,8 @@ class PathPyObject:
         """
         return deepcopy(self)
 
-    def weight(self, weight: str = 'weight', default: float = 1.0) -> float:
+    def weight(self, weight: Union[str, bool, None] = 'weight',
+               default: float = 1.0) -> float:
         """Returns the weight of the object.
 
         Per default the attribute with the key 'weight' is used as
@@ -310,18 +476,107 @@ class PathPyObject:
         """
         value: float
         weight = False if weight is None else weight
+        attributes = self._attributes or {}
 
         if not weight:
             value = default
         elif isinstance(weight, str) and weight != 'weight':
-            value = float(self.attributes.get(weight, 0.0))
+            value = float(attributes.get(weight, 0.0))
         else:
-            value = float(self.attributes.get('weight', default))
+            value = float(attributes.get('weight', default))
         return value
 
 
+class AttributeDict(dict):
+    """Attribute dict of an object which logs its changes.
+
+    The dict is returned by :py:attr:`PathPyObject.attributes`, i.e. direct
+    writes such as ``edge.attributes['weight'] = 2`` are seen by the caches
+    of the collections and networks storing the object. Objects without
+    attributes return a new empty dict, which is only attached to the
+    object on the first write. Copies and pickles are plain dicts.
+    """
+    __slots__ = ('_owner',)
+
+    def __init__(self, owner: PathPyObject, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._owner = owner
+
+    def __reduce_ex__(self, protocol: Any) -> tuple:
+        return dict, (dict(self),)
+
+    def _log(self, keys: Iterable) -> None:
+        """Helper function to log the changes of keys."""
+        owner = self._owner
+        if owner._attributes is None:
+            owner._attributes = self
+        if owner._logs is not None:
+            owner._log(keys, self)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._log((key,))
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._log((key,))
+        super().__delitem__(key)
+
+    def __or__(self, other: Any) -> dict:
+        values = dict(self)
+        values.update(other)
+        return values
+
+    def __ior__(self, other: Any) -> 'AttributeDict':
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        values = dict(*args, **kwargs)
+        self._log(values)
+        super().update(values)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self._log((key,))
+        return super().setdefault(key, default)
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        if key in self:
+            self._log((key,))
+        return super().pop(key, *args)
+
+    def popitem(self) -> tuple:
+        if self:
+            self._log((next(reversed(self)),))
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._log(self)
+        super().clear()
+
+
+# placeholder of a removed key in the inverse index of a collection
+_REMOVED = object()
+
+# slots of the classes without the logs {class: slots}
+_SLOTS: Dict[type, tuple] = {}
+
+
+def _slots(cls: type) -> tuple:
+    """Helper function to return the (cached) slots of a class."""
+    slots = _SLOTS.get(cls, None)
+    if slots is None:
+        slots = _SLOTS[cls] = tuple(
+            slot for klass in cls.__mro__
+            for slot in klass.__dict__.get('__slots__', ())
+            if slot != '_logs')
+    return slots
+
+
 class PathPySet(frozenset):
     """Class to store unordered relationships between objects."""
+    __slots__ = ()
+
     def __new__(cls, args, **kwargs):
         """Create a new PathPySet object."""
         # pylint: disable=unused-argument
@@ -333,27 +588,30 @@ class PathPySet(frozenset):
 
 class PathPyTuple(tuple):
     """Class to store un/directed and ordered relationships between objects."""
+    # the direction is given by the class, i.e. no instance dict is needed
+    __slots__ = ()
+    directed: bool = True
+
     def __new__(cls, args, directed=True):
         """Create a new PathPyTuple object."""
-        # pylint: disable=unused-argument
+        if not directed:
+            cls = UndirectedPathPyTuple
         return super(PathPyTuple, cls).__new__(cls, args)
 
-    def __init__(self, _, directed=True):
-        """ Initialize the new tuple class."""
-        # pylint: disable=super-init-not-called
-        # self._reversed = self[::-1]
-        self.directed = directed
+
+class UndirectedPathPyTuple(PathPyTuple):
+    """Class to store undirected and ordered relationships between objects."""
+    __slots__ = ()
+    directed: bool = False
 
     def __hash__(self):
-        return super().__hash__() if self.directed else super().__hash__() \
-            + hash(self[::-1])
+        return hash(PathPyRelation.key(self, directed=False))
 
     def __eq__(self, other):
-        return super().__eq__(other) if self.directed else super().__eq__(other) \
-            or self[::-1] == other
+        return super().__eq__(other) or self[::-1] == other
 
     def __repr__(self):
-        return super().__repr__() if self.directed else '|'+super().__repr__()[1:-1]+'|'
+        return '|'+super().__repr__()[1:-1]+'|'
 
 
 class PathPyRelation(tuple):
@@ -370,15 +628,41 @@ class PathPyRelation(tuple):
         self.directed = directed
         self.ordered = ordered
 
+    @staticmethod
+    def key(args: Iterable, directed: bool = True,
+            ordered: bool = True) -> Hashable:
+        """Return the canonical key of a relation.
+
+        Directed relations are mapped to plain tuples, undirected relations to
+        the smaller of the tuple and its reverse and unordered relations to
+        frozensets. Hence, equal relations have equal keys and the keys can be
+        hashed and compared without further transformations.
+        """
+        if not ordered:
+            return frozenset(args)
+
+        key = tuple(args)
+        if directed:
+            return key
+
+        reverse = key[::-1]
+        try:
+            return key if key <= reverse else reverse
+        except TypeError:
+            return key if repr(key) <= repr(reverse) else reverse
+
 
 class PathPyCounter(Counter):
     """A counter object for pathpy objects"""
 
-    def __init__(self, iterable=None, relations=None,
+    def __init__(self, iterable=None, relations=None, keys=None,
                  directed=True, ordered=True, **kwargs):
         self._relations = relations
+        self._keys = keys if keys is not None else {}
         self._directed = directed
         self._ordered = ordered
+        # number of changes of the counter (used to invalidate caches)
+        self._version = 0
         super().__init__(iterable, **kwargs)
 
     def __getitem__(self, key):
@@ -389,14 +673,19 @@ class PathPyCounter(Counter):
     def __setitem__(self, key, value):
         if isinstance(key, tuple) and self._relations is not None:
             key = self._map_key(key)
+        self._version += 1
         super().__setitem__(key, value)
 
+    def __delitem__(self, key):
+        self._version += 1
+        super().__delitem__(key)
+
     def _map_key(self, key):
         """Helper function to map a tuple to a key"""
-        obj = tuple(k.uid if isinstance(k, PathPyObject) else k for k in key)
-        new = PathPyRelation(obj, directed=self._directed,
-                             ordered=self._ordered)
-        keys = self._relations[new]
+        new = PathPyRelation.key(
+            (k.uid if isinstance(k, PathPyObject) else k for k in key),
+            directed=self._directed, ordered=self._ordered)
+        keys = self._relations.get(self._keys.get(new, None), ())
         if len(keys) == 1:
             key = next(iter(keys))
         else:
@@ -405,6 +694,71 @@ class PathPyCounter(Counter):
         return key
 
 
+class IndexView(ABCMapping):
+    """Read-only view of the index {uid: index} of a collection."""
+
+    def __init__(self, collection: 'PathPyCollection') -> None:
+        self._collection = collection
+
+    def __getitem__(self, key):
+        return self._collection._get_index()[0][key]
+
+    def __iter__(self):
+        return iter(self._collection._get_index()[1])
+
+    def __len__(self) -> int:
+        return len(self._collection._get_index()[0])
+
+    def __repr__(self) -> str:
+        return self._collection._get_index()[0].__repr__()
+
+
+class InverseIndexView(ABCSequence):
+    """Read-only view of the inverse index [uid] of a collection."""
+
+    def __init__(self, collection: 'PathPyCollection') -> None:
+        self._collection = collection
+
+    def __getitem__(self, key):
+        return self._collection._get_index()[1][key]
+
+    def __len__(self) -> int:
+        return len(self._collection._get_index()[1])
+
+    def __repr__(self) -> str:
+        return self._collection._get_index()[1].__repr__()
+
+
+class AttributeView(ABCMapping):
+    """Columnar view of the attributes of a collection {key: np.ndarray}.
+
+    The columns follow the order of the index of the collection. Missing
+    values are ``nan`` in numeric columns and ``None`` in object columns.
+    Assigning a column sets the attribute of all objects.
+    """
+
+    def __init__(self, collection: 'PathPyCollection') -> None:
+        self._collection = collection
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self._collection._column(key)
+
+    def __setitem__(self, key: str, values: Iterable) -> None:
+        self._collection._set_column(key, values)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._collection._attribute_counts()
+
+    def __iter__(self):
+        return iter(list(self._collection._attribute_counts()))
+
+    def __len__(self) -> int:
+        return len(self._collection._attribute_counts())
+
+    def __repr__(self) -> str:
+        return list(iter(self)).__repr__()
+
+
 class PathPyEmpty(str):
     """Empty element"""
 
@@ -423,6 +777,7 @@ class PathPyEmpty(str):
 
 class PathPyPath(PathPyObject):
     """Base class for a path."""
+    __slots__ = ('_directed', '_ordered', '_relations', '_objects')
 
     def __init__(self, *args: Union[str, PathPyObject],
                  uid: Optional[str] = None,
@@ -431,6 +786,9 @@ class PathPyPath(PathPyObject):
                  **kwargs: Any) -> None:
         """Initialize the path object."""
 
+        # indicator if the args have to be checked (not stored as attribute)
+        checking: bool = kwargs.pop('checking', True)
+
         # initialize the parent class
         super().__init__(uid=uid, **kwargs)
 
@@ -447,7 +805,7 @@ class PathPyPath(PathPyObject):
         self._objects: dict = dict()
 
         # if checking is disabled create path directly from args of str
-        if not kwargs.pop('checking', True):
+        if not checking:
             self._relations = PathPyRelation(
                 args, directed=directed, ordered=ordered)
             self._objects = {uid.uid: uid for uid in args}  # type: ignore
@@ -523,6 +881,19 @@ class PathPyPath(PathPyObject):
         for key in self._relations:
             yield self._objects[key]
 
+    def _clone(self: _Object, objects: dict) -> _Object:
+        """Helper function to return a shallow clone of the path.
+
+        The associated objects are replaced by their clones {object: clone}.
+        """
+        other = super()._clone(objects)
+        clone = objects.get
+        other._objects = {  # type: ignore
+            uid: clone(obj, obj) for uid, obj in self._objects.items()}
+        if self._objects.get(self._uid, None) is self:
+            other._objects[self._uid] = other  # type: ignore
+        return other
+
     @property
     def objects(self) -> dict:
         """Return the associated objects. """
@@ -547,7 +918,8 @@ class PathPyPath(PathPyObject):
     def directed(self, directed: bool) -> None:
         """Set the direction of the path"""
         self._directed = directed
-        self._relations.directed = directed
+        self._relations = PathPyRelation(
+            tuple(self._relations), directed=directed, ordered=self._ordered)
 
     def items(self):
         """Return a new view of the container’s items ((key, value) pairs)."""
@@ -611,6 +983,51 @@ class PathPyPath(PathPyObject):
         return ''.join(summary)
 
 
+# operators of the predicates of PathPyCollection.where
+_OPERATORS: dict = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'lt': operator.lt,
+    'le': operator.le,
+    'gt': operator.gt,
+    'ge': operator.ge,
+    'in': lambda value, values: value in values,
+}
+
+
+def _to_array(values: list) -> np.ndarray:
+    """Helper function to convert attribute values to a column.
+
+    Numeric values are stored in a numeric array with ``nan`` for missing
+    values, all other values in an object array with ``None``.
+    """
+    present = [v for v in values if v is not None]
+    if all(isinstance(v, (int, float, np.number)) for v in present):
+        if len(present) == len(values):
+            return np.array(values)
+        return np.array([np.nan if v is None else v for v in values],
+                        dtype=float)
+
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _to_weights(column: np.ndarray, fill: float) -> np.ndarray:
+    """Helper function to convert an attribute column to float weights.
+
+    Missing values (``None`` or ``nan``) are replaced by ``fill``.
+    """
+    if column.dtype == object:
+        return np.fromiter((fill if v is None else float(v)
+                            for v in column), dtype=float,
+                           count=len(column))
+
+    column = column.astype(float)
+    column[np.isnan(column)] = fill
+    return column
+
+
 class PathPyCollection():
     """Base collection for PathPyObjects"""
 
@@ -619,6 +1036,20 @@ class PathPyCollection():
         # dict to store the PathPyObjects {uid:PathPyObject}
         self._store: dict = dict()
 
+        # map between uids and integer indices {uid: index} and its inverse
+        # in the order of the store, i.e. new objects are appended and
+        # removed objects leave a hole in the inverse (see _remove_index)
+        self._index: dict = dict()
+        self._inverse: list = list()
+
+        # indicator if the index was built, i.e. the index is only allocated
+        # and maintained after it was read the first time
+        self._index_valid: bool = False
+
+        # position of the first hole of the inverse, which is compacted on
+        # the next read of the index
+        self._index_hole: Optional[int] = None
+
         # dict to store child objects {child.uid:child.PathPyObject}
         self._objects: dict = dict()
 
@@ -637,14 +1068,65 @@ class PathPyCollection():
         # indicator if multipaths/edges are allowed
         self._multiple: bool = kwargs.pop('multiple', False)
 
-        # dict to store the relationships between objects
-        # IMPORTANT key has to be hashable
-        # i.e. if the structure changes the mapping has to be updated
-        self._relations: defaultdict = defaultdict(set)
+        # interning table of the relations {canonical relation: integer key}
+        # a relation is dropped from the table if its last object is removed
+        self._keys: dict = dict()
+
+        # next integer key of the interning table (keys are never reused)
+        self._next_key: int = 0
+
+        # dict to store the relationships between objects {key: (uids)}
+        # the uids are immutable tuples (mostly of a single uid), which are
+        # smaller than sets and can be shared with snapshots
+        # IMPORTANT if the structure changes the mapping has to be updated
+        self._relations: dict = dict()
+
+        # indicator if added and removed objects are logged
+        self._track_changes: bool = kwargs.pop('track_changes', False)
+
+        # number of structural changes (used to invalidate caches)
+        self._version: int = 0
+
+        # logs of pending changes {PathPyObject: None} (i.e. ordered sets)
+        # the owner of the collection has to consume them via _pop_changes
+        self._added: dict = dict()
+        self._removed: dict = dict()
+
+        # indicator if the stores (or the counter) are shared with a snapshot
+        # the shared stores are cloned before the first change (copy-on-write)
+        self._shared: bool = False
+        self._shared_counter: bool = False
+
+        # keys of the cloned sets of a store {id(store): {keys}}
+        self._owned: dict = dict()
+
+        # indicator if the collection is a read-only snapshot
+        self._read_only: bool = False
+
+        # cached attribute columns {key: (version, np.ndarray)}
+        self._columns: dict = dict()
+
+        # cached number of objects per attribute (version, {key: count})
+        self._attribute_keys: Optional[tuple] = None
+
+        # log of the attribute changes of the stored objects, which is only
+        # written after the first sync of the caches (see _observe)
+        self._changes: AttributeLog = AttributeLog()
+        self._observing: bool = False
+
+        # indicator if the log is shared with a snapshot
+        self._log_shared: bool = False
+
+        # position of the attribute log the cached columns are in sync with
+        self._synced: int = 0
+
+        # number of synced changes per attribute, None counts the full resets
+        self._attribute_changes: Counter = Counter()
 
         # initialize object counter
         self._counter: PathPyCounter = PathPyCounter(
             relations=self._relations,
+            keys=self._keys,
             directed=self._directed,
             ordered=self._ordered)
 
@@ -665,16 +1147,26 @@ class PathPyCollection():
 
     @__getitem__.register(tuple)  # type: ignore
     def _(self, key):
-        new = tuple(k.uid if isinstance(k, PathPyObject) else k for k in key)
-        values = {self._store[uid] for uid in self._relations[
-            PathPyRelation(new, directed=self.directed, ordered=self._ordered)]}
+        values = {self._store[uid]
+                  for uid in self._relations.get(self._key(key), ())}
         return values if self._multiple else next(iter(values))
 
     def __setitem__(self, key, value):
+        self._unshare()
+        old = self._store.get(key, None)
+        if old is not None:
+            self._release(old)
+        elif self._index_valid:
+            self._index[key] = len(self._inverse)
+            self._inverse.append(key)
         self._store[key] = value
+        if self._observing:
+            value._observe(self._log_ref)
 
     def __delitem__(self, key):
-        del self._store[key]
+        self._unshare()
+        self._release(self._store.pop(key))
+        self._remove_index(key)
 
     def __iter__(self):
         return self._store.values().__iter__()
@@ -692,6 +1184,26 @@ class PathPyCollection():
         """Return if two collections are equal"""
         return self._store == other._store
 
+    def __getstate__(self) -> dict:
+        """Return the state of the collection without the attribute log."""
+        state = self.__dict__.copy()
+        for key in ('_changes', '_log_ref', '_columns', '_attribute_keys'):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a (copied) collection without the cached columns."""
+        self.__dict__.update(state)
+        self._columns = dict()
+        self._attribute_keys = None
+        self._changes = AttributeLog()
+        self._observing = False
+        self._log_shared = False
+        self._synced = 0
+        self._read_only = False
+        self._attribute_changes = Counter(self._attribute_changes)
+        self._attribute_changes[None] += 1
+
     def __iadd__(self, other):
         for obj in other:
             self.add(obj, count=other.counter[obj.uid])
@@ -700,7 +1212,7 @@ class PathPyCollection():
     def __isub__(self, other):
         for obj in other:
             if isinstance(obj, PathPyPath):
-                if obj._has_python_uid and obj.relations in self._relations:
+                if obj._has_python_uid and self._key(obj.relations) is not None:
                     obj = self[obj.relations]
                 elif obj.uid in self.keys():
                     obj = self[obj.uid]
@@ -716,23 +1228,16 @@ class PathPyCollection():
 
     @__contains__.register(PathPyObject)  # type: ignore
     def _(self, item: PathPyObject) -> bool:
-        return item in self._store.values()
+        return self._is_stored(item)
 
     @__contains__.register(str)  # type: ignore
     def _(self, item: str) -> bool:
         return item in self._store.keys()
 
     @__contains__.register(PathPySet)  # type: ignore
-    def _(self, item: PathPySet) -> bool:
-        new = tuple(k.uid if isinstance(k, PathPyObject) else k for k in item)
-        return PathPyRelation(new, directed=self.directed,
-                              ordered=self._ordered) in self._relations
-
     @__contains__.register(tuple)  # type: ignore
     def _(self, item: tuple) -> bool:
-        new = tuple(k.uid if isinstance(k, PathPyObject) else k for k in item)
-        return PathPyRelation(new, directed=self.directed,
-                              ordered=self._ordered) in self._relations
+        return self._relations.get(self._key(item), None) is not None
 
     def items(self):
         """Return a new view of the container’s items ((key, value) pairs)."""
@@ -748,7 +1253,12 @@ class PathPyCollection():
 
     def pop(self, key, default: Any = KeyError) -> Any:
         """Pop item form dict"""
-        self._store.pop(key, default)
+        self._unshare()
+        obj = self._store.pop(key, None)
+        if obj is None:
+            return
+        self._release(obj)
+        self._remove_index(key)
 
     @property
     def uids(self) -> set:
@@ -763,23 +1273,508 @@ class PathPyCollection():
     @property
     def counter(self) -> Counter:
         """Return a counter of the objects. """
+        if self._read_only:
+            return MappingProxyType(self._counter)  # type: ignore
+        self._unshare_counter()
         return self._counter
 
     @property
-    def index(self) -> Dict[str, int]:
+    def index(self) -> Mapping[str, int]:
         """Returns a dictionary that maps object uids to  integer indices.
 
         The indices of nodes correspond to the row/column ordering of objects
         in any list/array/matrix representation generated by pathpy, e.g. for
         degrees.sequence or adjacency_matrix.
 
+        The index is maintained by the collection, i.e. the returned read-only
+        view is always up to date. The index follows the order of the
+        collection: new objects get the next free index and the objects
+        after a removed object move up by one.
+
         Returns
         -------
-        dict
+        Mapping
             maps node uids to zero-based integer index
 
         """
-        return dict(zip(self._store, range(len(self))))
+        return IndexView(self)
+
+    @property
+    def inverse_index(self) -> Sequence[str]:
+        """Returns a sequence that maps integer indices to object uids.
+
+        Returns
+        -------
+        Sequence
+            read-only sequence with the uid at the position of its index
+
+        """
+        return InverseIndexView(self)
+
+    @property
+    def attrs(self) -> AttributeView:
+        """Returns the attributes of the objects as columns.
+
+        The columns are numpy arrays aligned with :py:attr:`index`. They are
+        cached and rebuilt if objects are added or removed. Changes of the
+        attributes are written to the cached columns.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> net = pp.Network()
+        >>> net.add_edge('a', 'b', weight=2)
+        >>> net.add_edge('b', 'c', weight=5)
+        >>> net.edges.attrs['weight']
+        array([2, 5])
+
+        """
+        return AttributeView(self)
+
+    def where(self, **predicates: Any) -> np.ndarray:
+        """Returns the indices of the objects fulfilling all predicates.
+
+        The predicates are given as ``key__operator=value``, where the
+        operator is one of ``eq`` (default), ``ne``, ``lt``, ``le``, ``gt``,
+        ``ge`` or ``in``. Objects without the attribute are never selected.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> net = pp.Network()
+        >>> net.add_edge('a', 'b', weight=2)
+        >>> net.add_edge('b', 'c', weight=5)
+        >>> net.edges.where(weight__gt=2)
+        array([1])
+
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for name, value in predicates.items():
+            key, _, op = name.rpartition('__')
+            if op not in _OPERATORS:
+                key, op = name, 'eq'
+
+            column = self._column(key)
+            if column.dtype == object:
+                func = _OPERATORS[op]
+                mask &= np.fromiter(
+                    (v is not None and bool(func(v, value)) for v in column),
+                    dtype=bool, count=len(column))
+                continue
+
+            if op == 'in':
+                result = np.isin(column, list(value))
+            else:
+                result = _OPERATORS[op](column, value)
+
+            if column.dtype.kind == 'f':
+                result &= ~np.isnan(column)
+            mask &= result
+
+        return np.flatnonzero(mask)
+
+    def weights(self, weight: Union[str, bool, None] = 'weight',
+                default: float = 1.0) -> np.ndarray:
+        """Returns the weights of the objects aligned with the index.
+
+        The weights are read from the attribute columns and follow the rules
+        of :py:meth:`PathPyObject.weight`.
+        """
+        if weight is None or weight is False:
+            return np.full(len(self), float(default))
+
+        key = weight if isinstance(weight, str) else 'weight'
+        fill = default if key == 'weight' else 0.0
+        return _to_weights(self._column(key), fill)
+
+    def _column(self, key: str) -> np.ndarray:
+        """Helper function to return the (cached) column of an attribute."""
+        self._sync()
+        cached = self._columns.get(key, None)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        column = _to_array([obj._attributes.get(key, None)
+                            if obj._attributes else None
+                            for obj in self._values_by_index()])
+        column.flags.writeable = False
+        self._columns[key] = (self._version, column)
+        return column
+
+    def _attribute_counts(self) -> Counter:
+        """Helper function to return the number of objects per attribute."""
+        self._sync()
+        cached = self._attribute_keys
+        if cached is None or cached[0] != self._version:
+            cached = self._attribute_keys = (self._version, Counter(
+                key for obj in self._store.values() if obj._attributes
+                for key in obj._attributes))
+        return cached[1]
+
+    def _attribute_version(self, key: str) -> tuple:
+        """Helper function to return the version of the values of an attribute.
+
+        The version changes if the attribute of a stored object is changed,
+        objects added or removed are tracked by the version of the collection.
+        """
+        self._sync()
+        return (self._attribute_changes[None], self._attribute_changes[key])
+
+    def _sync(self) -> None:
+        """Helper function to apply the logged attribute changes to the caches.
+
+        The log only holds the changes of the stored objects, i.e. changes of
+        other collections neither slow down the sync nor drop entries which
+        are still needed. Caches which are outdated due to added or removed
+        objects are skipped since they are rebuilt anyway.
+        """
+        log = self._observe()
+        changes = log.since(self._synced)
+        self._synced = log.position
+
+        # the changes were dropped from the log, i.e. the caches are rebuilt
+        if changes is None:
+            self._columns = dict()
+            self._attribute_keys = None
+            self._attribute_changes[None] += 1
+            return
+
+        # state of the changed attributes of the stored objects before the
+        # changes {(obj, key): present}
+        changed: dict = dict()
+        for obj, key, present in changes:
+            if self._store.get(obj.uid, None) is obj:
+                changed.setdefault((obj, key), present)
+
+        if changed:
+            self._sync_attribute_counts(changed)
+            self._sync_columns(changed)
+
+    def _sync_attribute_counts(self, changed: dict) -> None:
+        """Helper function to update the cached counts of the attributes."""
+        keys = self._attribute_keys
+        if keys is None or keys[0] != self._version:
+            return
+
+        counts = keys[1]
+        for (obj, key), present in changed.items():
+            counts[key] += (key in (obj._attributes or ())) - present
+            if counts[key] <= 0:
+                del counts[key]
+
+    def _sync_columns(self, changed: dict) -> None:
+        """Helper function to update the cached columns of the attributes."""
+        objs: defaultdict = defaultdict(list)
+        for obj, key in changed:
+            objs[key].append(obj)
+
+        for key, _objs in objs.items():
+            self._attribute_changes[key] += 1
+            cached = self._columns.get(key, None)
+            if cached is not None and cached[0] == self._version:
+                self._columns[key] = (self._version, self._update_column(
+                    key, cached[1], _objs))
+
+    def _release(self, obj: PathPyObject) -> None:
+        """Helper function to stop logging the changes of a removed object.
+
+        Objects which may still be stored by a snapshot sharing the log keep
+        logging their changes.
+        """
+        if self._observing and not self._log_shared:
+            obj._unobserve(self._log_ref)
+
+    @property
+    def _log_ref(self) -> weakref.ref:
+        """Helper property to return a weak ref to the attribute log."""
+        return weakref.ref(self._changes)
+
+    def _observe(self) -> AttributeLog:
+        """Helper function to return the log of the attribute changes.
+
+        The stored objects only log their changes after the log was
+        requested the first time, i.e. attribute writes are not slowed down
+        by collections without caches. The objects refer weakly to the log,
+        hence the log does not keep deleted collections alive.
+        """
+        if not self._observing:
+            self._observing = True
+            ref = self._log_ref
+            for obj in self._store.values():
+                obj._observe(ref)
+        return self._changes
+
+    def _update_column(self, key: str, column: np.ndarray,
+                       objs: list) -> np.ndarray:
+        """Helper function to return a column with the values of objects."""
+        index = self._get_index()[0]
+        rows = [index[obj.uid] for obj in objs]
+        values = [obj._attributes.get(key, None) if obj._attributes else None
+                  for obj in objs]
+
+        if column.dtype == object:
+            column = column.copy()
+            for row, value in zip(rows, values):
+                column[row] = value
+        else:
+            array = _to_array(values)
+
+            # numeric columns with other values are rebuilt as object columns
+            if array.dtype == object:
+                column = _to_array([obj._attributes.get(key, None)
+                                    if obj._attributes else None
+                                    for obj in self._values_by_index()])
+            else:
+                column = column.astype(
+                    np.result_type(column.dtype, array.dtype))
+                column[rows] = array
+
+        column.flags.writeable = False
+        return column
+
+    def _set_column(self, key: str, values: Iterable) -> None:
+        """Helper function to set an attribute of all objects."""
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        values = list(values)
+
+        if len(values) != len(self._store):
+            LOG.error('The column "%s" has %s values for %s objects!',
+                      key, len(values), len(self._store))
+            raise AttributeError
+
+        for obj, value in zip(self._values_by_index(), values):
+            obj[key] = value
+
+    def memory_usage(self, deep: bool = True) -> Dict[str, int]:
+        """Return the memory usage of the collection in bytes.
+
+        Each object is only counted once, i.e. in the first of the following
+        components it is reached from: ``'attributes'`` (attribute dicts of
+        the objects), ``'events'`` (interval trees of temporal objects),
+        ``'counter'``, ``'cache'`` (cached attribute columns), ``'objects'``
+        (the stored objects including their relations) and ``'index'`` (the
+        stores and indexes of the collection).
+
+        Parameters
+        ----------
+        deep : bool, optional (default = True)
+
+            If ``False`` strings and numbers (e.g. uids and attribute values)
+            are not counted.
+
+        Returns
+        -------
+        Dict[str, int]
+
+            Number of bytes per component.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> edges = pp.EdgeCollection()
+        >>> edges.add('a', 'b', color='red')
+        >>> sorted(edges.memory_usage())
+        ['attributes', 'cache', 'counter', 'events', 'index', 'objects']
+
+        """
+        return self._memory_usage(set(), deep)
+
+    def _memory_usage(self, seen: set, deep: bool) -> Dict[str, int]:
+        """Helper function to measure the components of the collection."""
+        objs = list(self._store.values())
+        usage = {
+            'attributes': sizeof(*(obj._attributes for obj in objs),
+                                 seen=seen, deep=deep),
+            'events': sizeof(getattr(self, '_events', None),
+                             *(getattr(obj, '_events', None) for obj in objs),
+                             seen=seen, deep=deep),
+            'cache': sizeof(self._columns, self._attribute_keys, seen=seen,
+                            deep=deep),
+            'objects': sizeof(*objs, seen=seen, deep=deep),
+        }
+
+        # the counter refers to the relations of the index
+        seen.add(id(self._counter))
+        usage['index'] = sizeof(self, seen=seen, deep=deep)
+        seen.discard(id(self._counter))
+        usage['counter'] = sizeof(self._counter, seen=seen, deep=deep)
+        return usage
+
+    def _get_index(self) -> tuple:
+        """Helper function to return the (compacted) index and its inverse.
+
+        The index is built from the store on the first read. The keys after
+        the first hole move up to close the holes, i.e. the removals since
+        the last read are compacted at once.
+        """
+        first = self._index_hole
+        if not self._index_valid:
+            self._inverse = list(self._store)
+            self._index = dict(zip(self._inverse, range(len(self._inverse))))
+            self._index_valid, self._index_hole = True, None
+        elif first is not None:
+            inverse, index = self._inverse, self._index
+            tail = [key for key in inverse[first:] if key is not _REMOVED]
+            del inverse[first:]
+            inverse.extend(tail)
+            index.update(zip(tail, range(first, len(inverse))))
+            self._index_hole = None
+        return self._index, self._inverse
+
+    def _values_by_index(self) -> list:
+        """Helper function to return the objects in the order of the index."""
+        return list(self._store.values())
+
+    def _remove_index(self, key) -> None:
+        """Helper function to remove a key from the index.
+
+        The key is replaced by a hole, which keeps the order of the index in
+        line with the order of the store. The holes are compacted on the
+        next read (see _get_index). Removing the last key needs no hole.
+        """
+        if not self._index_valid:
+            return
+
+        position = self._index.pop(key, None)
+        if position is None:
+            return
+
+        if position == len(self._inverse) - 1:
+            self._inverse.pop()
+        else:
+            self._inverse[position] = _REMOVED
+            if self._index_hole is None or position < self._index_hole:
+                self._index_hole = position
+
+    def _snapshot(self: _Collection,
+                  read_only: bool = True) -> _Collection:
+        """Helper function to create a copy-on-write copy of the collection.
+
+        The copy shares the stored objects and all stores with the
+        collection. The stores of both collections are cloned before they
+        are changed the next time. Changes of a read-only snapshot raise a
+        TypeError.
+        """
+        # the holes of the index are compacted in place, i.e. before sharing
+        if self._index_hole is not None:
+            self._get_index()
+
+        other = copy(self)
+        other._added, other._removed = dict(), dict()
+        other._read_only = read_only
+
+        # the objects are shared, hence their changes are logged once for
+        # both collections and the (immutable) columns can be shared as well
+        other._changes, other._synced = self._changes, self._synced
+        other._observing = self._observing
+        other._attribute_changes = Counter(self._attribute_changes)
+        other._columns = dict(self._columns)
+        self._log_shared = other._log_shared = True
+        self._shared = other._shared = True
+        self._shared_counter = other._shared_counter = True
+        return other
+
+    def _fork(self: _Collection, objects: dict) -> _Collection:
+        """Helper function to create a copy-on-write copy with cloned objects.
+
+        Like a snapshot, the copy shares the stores with the collection, but
+        the stored objects are replaced by their clones {object: clone}.
+        Hence, the copy logs the attribute changes of the clones itself.
+        """
+        log_shared = self._log_shared
+        other = self._snapshot(read_only=False)
+        self._log_shared = log_shared
+
+        other._store = {uid: objects.get(obj, obj)
+                        for uid, obj in self._store.items()}
+        other._objects = {uid: objects.get(obj, obj)
+                          for uid, obj in self._objects.items()}
+
+        # the clones have the attributes of the objects, i.e. the cached
+        # columns stay valid if the clones are observed from the start
+        other._changes, other._synced = AttributeLog(), 0
+        other._observing = other._log_shared = False
+        if self._observing:
+            other._observe()
+        return other
+
+    def _check_writable(self) -> None:
+        """Helper function to raise an error if the collection is read-only."""
+        if self._read_only:
+            LOG.error('A snapshot is read-only, use fork() or copy() to get '
+                      'a network which can be changed!')
+            raise TypeError
+
+    def _unshare(self) -> None:
+        """Helper function to clone the stores shared with a snapshot."""
+        self._check_writable()
+        if not self._shared:
+            return
+
+        self._store = dict(self._store)
+        self._index = dict(self._index)
+        self._inverse = list(self._inverse)
+        self._objects = dict(self._objects)
+        self._mapping = defaultdict(set, self._mapping)
+        self._relations = dict(self._relations)
+        self._keys = dict(self._keys)
+        self._shared = False
+
+        # the sets of the mapping are cloned before changes
+        self._owned = {id(self._mapping): set()}
+
+        # the counter has to use the new relations
+        self._unshare_counter()
+        self._counter._relations = self._relations
+        self._counter._keys = self._keys
+
+    def _unshared_set(self, store: defaultdict, key: Any) -> set:
+        """Helper function to return the set of a key cloned if shared."""
+        owned = self._owned.get(id(store), None)
+        if owned is not None and key not in owned:
+            store[key] = set(store.get(key, ()))
+            owned.add(key)
+        return store[key]
+
+    def _unshare_counter(self) -> None:
+        """Helper function to clone the counter shared with a snapshot."""
+        if not self._shared_counter:
+            return
+
+        counter = PathPyCounter(relations=self._relations,
+                                keys=self._keys,
+                                directed=self._directed,
+                                ordered=self._ordered)
+        dict.update(counter, self._counter)
+        counter._version = self._counter._version
+        self._counter = counter
+        self._shared_counter = False
+
+    def _key(self, relation: Iterable) -> Optional[int]:
+        """Helper function to return the interned key of a relation.
+
+        The relation can be given by uids or objects. Returns ``None`` if the
+        relation was never stored in the collection.
+        """
+        return self._keys.get(PathPyRelation.key(
+            (r.uid if isinstance(r, PathPyObject) else r for r in relation),
+            directed=self._directed, ordered=self._ordered), None)
+
+    def _intern(self, relation: Iterable) -> int:
+        """Helper function to return the interned key of a new relation."""
+        key = PathPyRelation.key(relation, directed=self._directed,
+                                 ordered=self._ordered)
+        value = self._keys.get(key, None)
+        if value is None:
+            # a relation which hashes and compares like its canonical key is
+            # stored instead of the key, i.e. no tuple is allocated per object
+            if isinstance(relation, (tuple, frozenset)) and \
+                    hash(relation) == hash(key) and relation == key:
+                key = relation
+            value = self._keys[key] = self._next_key
+            self._next_key += 1
+        return value
 
     @property
     def nodes(self) -> dict:
@@ -800,11 +1795,11 @@ class PathPyCollection():
         if not kwargs.pop('checking', True):
             for obj in args:
                 self._add(obj, **kwargs)
-                return
+            return
 
         for obj in args:
             # check if object exists already
-            if obj not in self.values() and obj.uid not in self.keys():
+            if obj.uid not in self.keys():
                 # add edge to the collection
                 self._add(obj, **kwargs)
             else:
@@ -816,10 +1811,10 @@ class PathPyCollection():
         if not kwargs.pop('checking', True):
             for obj in args:
                 self._add(obj, **kwargs)
-                return
+            return
 
         for obj in args:
-            if (obj in self.values() or
+            if (self._is_stored(obj) or
                 (obj.uid in self.keys() and
                  self[obj.uid].relations == obj.relations) or
                 (obj.uid not in self.keys() and
@@ -895,9 +1890,196 @@ class PathPyCollection():
             *args, uid=uid, directed=self.directed, ordered=self._ordered, **kwargs)
         self.add(obj, count=count, **kwargs)
 
+    def extend(self, objs: Iterable[PathPyObject], validate: str = 'deferred',
+               **kwargs: Any) -> None:
+        """Add multiple objects to the collection.
+
+        Parameters
+        ----------
+        objs : Iterable[PathPyObject]
+
+            Objects which should be added to the collection.
+
+        validate : str, optional (default = 'deferred')
+
+            If ``'deferred'`` the objects are collected first and the
+            duplicates and multi-object rules are validated once for the whole
+            batch before the objects are stored without further checks. If
+            the validation fails no object is added. If ``'eager'`` each
+            object is added and checked via :py:meth:`add`.
+
+        kwargs : Any
+
+            The ``count`` and attributes assigned to all objects.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> edges = pp.EdgeCollection()
+        >>> edges.extend([pp.Edge('a', 'b'), pp.Edge('b', 'c')])
+        >>> len(edges)
+        2
+
+        """
+        if validate == 'eager':
+            for obj in objs:
+                self.add(obj, **kwargs)
+            return
+
+        if validate != 'deferred':
+            LOG.error('The validation "%s" is not supported!', validate)
+            raise AttributeError
+
+        # validate the whole batch before changing the collection
+        plan = self._join(list(objs))
+
+        # existing objects are handled as in add (see _if_exist)
+        count = kwargs.pop('count', 1)
+        for obj, element in plan:
+            if element is None:
+                self._add(obj, count=count, **kwargs)
+            else:
+                self._if_exist(obj, count=count, **kwargs)
+
+    def _merge(self, objs: Iterable[PathPyObject], counter: Counter) -> None:
+        """Helper function to merge a batch of objects with their counts.
+
+        The objects are joined with the stored objects via their uids and
+        relations (see :py:meth:`_join`). New objects are stored with their
+        count, the counts of existing objects are increased.
+        """
+        for obj, element in self._join(list(objs)):
+            if element is None:
+                self._add(obj, count=counter[obj.uid])
+            else:
+                self._if_exist(obj, count=counter[obj.uid])
+
+    def _restore(self, objs: list, counts: Iterable[int]) -> None:
+        """Helper function to fill an empty collection in one pass.
+
+        The store, the counter and the relations are built
+        directly from the objects (e.g. of an unpickled collection), i.e.
+        without the checks of :py:meth:`add` and without :py:meth:`_add` per
+        object. Hence, the uids (and the relations if multiple objects are
+        not allowed) of the objects have to be unique.
+        """
+        self._unshare()
+
+        store = self._store = {obj.uid: obj for obj in objs}
+        self._index, self._inverse = dict(), list()
+        self._index_valid, self._index_hole = False, None
+
+        dict.update(self._counter, zip(store, counts))
+        self._counter._version += 1
+        self._version += 1
+
+        if self._track_changes:
+            self._added.update(dict.fromkeys(objs))
+
+        if self._observing:
+            ref = self._log_ref
+            for obj in objs:
+                obj._observe(ref)
+
+        objects, mapping, relations = (
+            self._objects, self._mapping, self._relations)
+        intern, indexed = self._intern, self._indexed
+        for obj in objs:
+            if not isinstance(obj, PathPyPath):
+                continue
+            children = obj.objects
+            for key, value in children.items():
+                if ((key not in objects) or
+                    (isinstance(objects[key], PathPyEmpty)
+                     and isinstance(value, PathPyEmpty))):
+                    objects[key] = value
+
+            if indexed:
+                uid = obj.uid
+                for key in children:
+                    mapping[key].add(uid)
+                key = intern(obj.relations)
+                relations[key] = relations.get(key, ()) + (uid,)
+
+    def _join(self, objs: list) -> list:
+        """Helper function to validate a batch of objects.
+
+        The objects are joined with the stored objects (and the previous
+        objects of the batch) via their uids and relations. Returns a list of
+        ``(obj, element)`` tuples, where element is the existing object which
+        is updated by obj or ``None`` if obj is a new object.
+        """
+        uids: dict = dict()
+        relations: defaultdict = defaultdict(list)
+        plan: list = []
+
+        for obj in objs:
+            if not isinstance(obj, PathPyObject):
+                LOG.error('Only PathPyObjects can be added in a batch!')
+                raise TypeError
+
+            element = self._store.get(obj.uid, uids.get(obj.uid, None))
+
+            if element is obj or not isinstance(obj, PathPyPath):
+                plan.append((obj, element))
+            elif element is not None:
+                self._join_uid(obj, element)
+                plan.append((obj, element))
+            else:
+                key = PathPyRelation.key(obj.relations,
+                                         directed=self._directed,
+                                         ordered=self._ordered)
+                element = self._join_relations(obj, key, relations[key])
+                plan.append((obj, element))
+                if element is None:
+                    relations[key].append(obj)
+
+            if element is None:
+                uids[obj.uid] = obj
+
+        return plan
+
+    @staticmethod
+    def _join_uid(obj: PathPyPath, element: PathPyPath) -> None:
+        """Helper function to check a path which matches a stored uid."""
+        if element.relations != obj.relations:
+            LOG.error('The object %s exists already. '
+                      'Please use an appropriate uid or enable the '
+                      'handling of multiple objects.', obj.uid)
+            raise KeyError
+
+    def _join_relations(self, obj: PathPyPath, key: Hashable,
+                        batch: list) -> Optional[PathPyPath]:
+        """Helper function to match a new path via its relations.
+
+        Returns the existing path with the same relations if multiple objects
+        are not allowed or ``None`` if obj is a new object. The batch holds
+        the new paths of the current batch with the same relations.
+        """
+        existing = [self._store[uid] for uid in self._relations.get(
+            self._keys.get(key, None), ())] + batch
+
+        if existing and not self._multiple:
+            if not obj.has_python_uid:
+                LOG.error('The object with relations %s exists already. '
+                          'Please use an appropriate uid or enable the '
+                          'handling of multiple objects.', obj.relations)
+                raise KeyError
+            return existing[0]
+
+        if (existing and obj.has_python_uid and
+                not all(o.has_python_uid for o in existing)):
+            LOG.error('The object %s cannot be uniquely identified. '
+                      'Please use the uid property.', obj.relations)
+            raise KeyError
+
+        return None
+
     def _add(self, obj: Union[PathPyObject, PathPyPath], **kwargs: Any) -> None:
         """Add an edge to the set of edges."""
 
+        self._unshare()
+
         # get count and update obj
         count = kwargs.pop('count', 1)
         if kwargs:
@@ -906,6 +2088,10 @@ class PathPyCollection():
         self[obj.uid] = obj
 
         self.counter[obj.uid] += count
+        self._version += 1
+
+        if self._track_changes:
+            self._log_change(obj, self._added, self._removed)
 
         if isinstance(obj, PathPyPath):
             for key, value in obj.objects.items():
@@ -916,12 +2102,23 @@ class PathPyCollection():
 
             if self._indexed:
                 for uid in obj.objects:
-                    self._mapping[uid].add(obj.uid)
+                    self._unshared_set(self._mapping, uid).add(obj.uid)
+
+                key = self._intern(obj.relations)
+                uids = self._relations.get(key, ())
+                self._relations[key] = uids + (obj.uid,)
 
-                self._relations[obj.relations].add(obj.uid)
+    def _is_stored(self, obj: PathPyObject) -> bool:
+        """Helper function to check if the object itself is stored.
+
+        Objects are always stored under their uid, hence the store is used as
+        identity index and the check is done in constant time.
+        """
+        return self._store.get(obj.uid, None) is obj
 
     def _if_exist(self, obj: Any, **kwargs: Any) -> None:
         """Helper function if the edge does already exsist."""
+        self._check_writable()
 
         # get element
         element = self[obj.uid] if self._multiple else self[
@@ -947,7 +2144,7 @@ class PathPyCollection():
         for obj in args:
 
             # check if object exists already
-            if obj in self.values() and obj.uid in self.keys():
+            if self._is_stored(obj):
                 self._remove(obj)
 
     @remove.register(str)  # type: ignore
@@ -967,20 +2164,58 @@ class PathPyCollection():
 
     def _remove(self, obj: Union[PathPyObject, PathPyPath]) -> None:
         """Add an edge to the set of edges."""
+        self._unshare()
         self.pop(obj.uid, None)
         self.counter.pop(obj.uid, None)
+        self._version += 1
+
+        if self._track_changes:
+            self._log_change(obj, self._removed, self._added)
 
         if isinstance(obj, PathPyPath):
             if self._indexed:
                 for uid in obj.objects:
-                    self._mapping[uid].discard(obj.uid)
+                    self._unshared_set(self._mapping, uid).discard(obj.uid)
                     if len(self._mapping[uid]) == 0:
                         self._mapping.pop(uid, None)
                         self._objects.pop(uid, None)
 
-                self._relations[obj.relations].discard(obj.uid)
-                if len(self._relations[obj.relations]) == 0:
-                    self._relations.pop(obj.relations, None)
+                relation = PathPyRelation.key(
+                    obj.relations, directed=self._directed,
+                    ordered=self._ordered)
+                key = self._keys.get(relation, None)
+                if key is not None:
+                    uids = tuple(uid for uid in self._relations.get(key, ())
+                                 if uid != obj.uid)
+                    if uids:
+                        self._relations[key] = uids
+                    else:
+                        self._relations.pop(key, None)
+                        del self._keys[relation]
+
+    def _remove_many(self, objs: Iterable[PathPyObject]) -> None:
+        """Helper function to remove multiple stored objects in one sweep."""
+        for obj in objs:
+            self._remove(obj)
+
+    @staticmethod
+    def _log_change(obj: PathPyObject, log: dict, opposite: dict) -> None:
+        """Helper function to log an added or removed object.
+
+        If the object is pending in the opposite log both changes cancel out.
+        """
+        if obj in opposite:
+            del opposite[obj]
+        else:
+            log[obj] = None
+
+    def _pop_changes(self, added: bool = True) -> list:
+        """Return and clear the pending added (or removed) objects."""
+        if added:
+            changes, self._added = list(self._added), dict()
+        else:
+            changes, self._removed = list(self._removed), dict()
+        return changes
 
 
 def _get_valid_objects(item) -> list:
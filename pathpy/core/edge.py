@@ -8,12 +8,15 @@
 #
 # Copyright (c) 2016-2021 Pathpy Developers
 # =============================================================================
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Optional, Sequence, Union
 
+import numpy as np
+import pandas as pd
 from singledispatchmethod import singledispatchmethod  # NOTE: not needed at 3.9
 
 from pathpy import logger
 from pathpy.core.core import PathPyObject, PathPyPath, PathPyCollection
+from pathpy.core.node import Node
 
 # create logger for the Path class
 LOG = logger(__name__)
@@ -191,6 +194,8 @@ class Edge(PathPyPath):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, v: Union[str, PathPyObject],
                  w: Union[str, PathPyObject],
                  uid: Optional[str] = None,
@@ -202,13 +207,13 @@ class Edge(PathPyPath):
         super().__init__(v, w, uid=uid, directed=directed, **kwargs)
 
     @property
-    def v(self) -> str:
+    def v(self) -> Node:
         """Return the uid of the source node v. """
         # pylint: disable=invalid-name
         return self.objects[self.relations[0]]
 
     @property
-    def w(self) -> str:
+    def w(self) -> Node:
         """Return the uid of the target node w. """
         # pylint: disable=invalid-name
         return self.objects[self.relations[-1]]
@@ -243,6 +248,9 @@ class EdgeCollection(PathPyCollection):
         # indicator whether the network has multi-edges
         self._multiple: bool = kwargs.pop('multiedges', False)
 
+        # cached packed keys of the node pairs (version, table)
+        self._lookup: Optional[tuple] = None
+
         # class of objects
         self._default_class: Any = Edge
 
@@ -258,6 +266,8 @@ class EdgeCollection(PathPyCollection):
 
     @add.register(Edge)  # type: ignore
     def _(self, *args: Edge, **kwargs: Any) -> None:
+        # the uid is given by the edge object
+        kwargs.pop('uid', None)
         super().add(args[0], **kwargs)
 
     @add.register(str)  # type: ignore
@@ -322,6 +332,134 @@ class EdgeCollection(PathPyCollection):
         for arg in args:
             self.remove(*arg, **kwargs)
 
+    def lookup_many(self, pairs: Iterable, values: str = 'index',
+                    weight: Union[str, bool, None] = 'weight',
+                    nodes: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Look up the edges between multiple pairs of nodes in one call.
+
+        The node pairs of the edges are packed into sorted int64 keys
+        ``v * n + w`` (with node indices ``v <= w`` for undirected edges),
+        which are cached until edges are added or removed. The pairs are
+        packed in the same way and found by binary search, i.e. no edge
+        objects have to be created or dispatched for the single lookups. If
+        multiple edges connect a pair, the first edge (i.e. the edge with the
+        smallest index) is returned.
+
+        Parameters
+        ----------
+        pairs : Iterable
+
+            Pairs ``(v, w)`` of node uids or node objects. If ``nodes`` is
+            given, the pairs are integer indices, e.g. an array of shape
+            ``(m, 2)``.
+
+        values : str, optional (default = 'index')
+
+            The returned values of the edges: ``'index'`` returns the indices
+            of the edges (-1 for missing edges), ``'uid'`` the uids (``None``
+            for missing edges), ``'count'`` the counts (0 for missing edges)
+            and ``'weight'`` the weights (``nan`` for missing edges).
+
+        weight : Union[str, bool, None], optional (default = 'weight')
+
+            The attribute used as weight if ``values='weight'``.
+
+        nodes : Sequence[str], optional (default = None)
+
+            Sequence which maps integer indices to node uids, e.g.
+            ``network.nodes.inverse_index``.
+
+        Returns
+        -------
+        np.ndarray
+
+            Array with one value per pair.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> net = pp.Network()
+        >>> net.add_edges(('a', 'b'), ('b', 'c'))
+        >>> net.edges.lookup_many([('b', 'c'), ('c', 'a')])
+        array([ 1, -1])
+
+        """
+        if values not in ('index', 'uid', 'count', 'weight'):
+            LOG.error('The values "%s" are not supported!', values)
+            raise AttributeError
+
+        table, (sorted_keys, edge_ids), uids = self._lookup_table()
+        if nodes is not None:
+            idx = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+            index = table.get_indexer(np.asarray(list(nodes), dtype=object))
+            v, w = index[idx[:, 0]], index[idx[:, 1]]
+        else:
+            if not isinstance(pairs, np.ndarray):
+                pairs = [tuple(p.uid if isinstance(p, PathPyObject) else p
+                               for p in pair) for pair in pairs]
+            array = np.empty((len(pairs), 2), dtype=object)
+            if len(pairs) > 0:
+                array[:] = pairs
+            v = table.get_indexer(array[:, 0])
+            w = table.get_indexer(array[:, 1])
+
+        # pack the pairs and find the first edge with the same key
+        if not self._directed:
+            v, w = np.minimum(v, w), np.maximum(v, w)
+        keys = np.where((v >= 0) & (w >= 0), v * len(table) + w, -1)
+        ids = np.full(len(keys), -1, dtype=np.int64)
+        if len(sorted_keys) > 0:
+            pos = np.minimum(np.searchsorted(sorted_keys, keys),
+                             len(sorted_keys) - 1)
+            match = (keys >= 0) & (sorted_keys[pos] == keys)
+            ids[match] = edge_ids[pos[match]]
+        found = ids >= 0
+
+        if values == 'index':
+            return ids
+
+        if values == 'uid':
+            result = np.full(len(ids), None, dtype=object)
+            result[found] = uids[ids[found]]
+            return result
+
+        if values == 'count':
+            counter = self._counter
+            result = np.zeros(len(ids), dtype=np.int64)
+            result[found] = [dict.get(counter, uid, 0)
+                             for uid in uids[ids[found]].tolist()]
+            return result
+
+        result = np.full(len(ids), np.nan)
+        result[found] = self.weights(weight)[ids[found]]
+        return result
+
+    def _lookup_table(self) -> tuple:
+        """Helper function to return the (cached) packed keys of the edges.
+
+        Returns the node uids as :py:class:`pandas.Index`, the sorted keys of
+        the edges together with the edge indices and the edge uids.
+        """
+        if self._lookup is not None and self._lookup[0] == self._version:
+            return self._lookup[1]
+
+        edges = self._values_by_index()
+        uids, v, w = (np.empty(len(edges), dtype=object) for _ in range(3))
+        uids[:] = self._get_index()[1]
+        v[:] = [e.v.uid for e in edges]
+        w[:] = [e.w.uid for e in edges]
+
+        table = pd.Index(list(self._objects), dtype=object)
+        v, w = table.get_indexer(v), table.get_indexer(w)
+        if not self._directed:
+            v, w = np.minimum(v, w), np.maximum(v, w)
+
+        keys = v.astype(np.int64) * len(table) + w
+        order = np.argsort(keys, kind='stable')
+        self._lookup = (self._version, (table, (keys[order], order), uids))
+        return self._lookup[1]
+
+
 # =============================================================================
 # eof
 #
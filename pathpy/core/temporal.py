@@ -8,9 +8,13 @@
 #
 # Copyright (c) 2016-2021 Pathpy Developers
 # =============================================================================
-from typing import Any, Optional, Union
+from __future__ import annotations
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Type, TypeVar, Union)
+from copy import copy
 from singledispatchmethod import singledispatchmethod  # NOTE: not needed at 3.9
-from intervaltree import IntervalTree
+from intervaltree import Interval, IntervalTree
+import numpy as np
 import pandas as pd
 
 from pathpy import logger, config
@@ -19,6 +23,9 @@ from pathpy.core.core import PathPyObject
 # create logger for the Path class
 LOG = logger(__name__)
 
+# type of the window created by the from_* class methods
+_Window = TypeVar('_Window', bound='EventWindow')
+
 
 class TemporalPathPyObject(PathPyObject):
     """Base class for a temporal object."""
@@ -33,15 +40,20 @@ class TemporalPathPyObject(PathPyObject):
         self._start = float('-inf')
         self._end = float('inf')
 
+        # indicator whether the events have to be normalised
+        self._dirty = False
+
+        # objects created without events get them from the caller (see
+        # _without_events), i.e. no interval tree is built
+        if getattr(self, '_events', None) is not None:
+            return
+
         # initialize an intervaltree to save events
         self._events = IntervalTree()
 
         # add new events
         self.event(**kwargs)
 
-        # variable to store changes in the events
-        self._len_events = len(self._events)
-
     def __iter__(self):
         self._clean_events()
 
@@ -49,8 +61,7 @@ class TemporalPathPyObject(PathPyObject):
         for start, end, attributes in sorted(self._events):
             self._attributes = {**{'start': start, 'end': end}, **attributes}
             yield self
-        self._attributes.pop('start', None)
-        self._attributes.pop('end', None)
+        self._drop_times()
 
     @singledispatchmethod
     def __getitem__(self, key: Any) -> Any:
@@ -77,8 +88,7 @@ class TemporalPathPyObject(PathPyObject):
         for start, end, attributes in sorted(self._events[start:end]):
             self._attributes = {**{'start': start, 'end': end}, **attributes}
             yield self
-        self._attributes.pop('start', None)
-        self._attributes.pop('end', None)
+        self._drop_times()
 
     @singledispatchmethod
     def __setitem__(self, key: Any, value: Any) -> None:
@@ -100,22 +110,33 @@ class TemporalPathPyObject(PathPyObject):
         """end of the object"""
         return self.attributes.get('end', self._end)
 
+    def _drop_times(self) -> None:
+        """Helper function to drop the times of the last yielded event.
+
+        The attribute dict is only allocated if needed, i.e. it is missing if
+        no event was yielded (e.g. after unpickling).
+        """
+        if self._attributes is not None:
+            attributes = self._own_attributes()
+            attributes.pop('start', None)
+            attributes.pop('end', None)
+
     def _clean_events(self):
-        """helper function to clean events"""
-        # BUG: There is a bug in the intervaltree library
-        # merge_equals switches old and new data randomly
-        def reducer(old, new):
-            return {**old, **new}
+        """helper function to normalise the events before they are read
 
-        if len(self._events) != self._len_events:
-            # split overlapping intervals
-            self._events.split_overlaps()
+        The events are only normalised once after overlapping events have been
+        added. Overlapping events are split and the attributes of equal periods are
+        combined in a single sweep over the sorted events.
+        """
+        if not self._dirty:
+            return
 
-            # combine the dict of the overlapping intervals
-            self._events.merge_equals(data_reducer=reducer)
+        intervals = _normalize(self._events)
+        if intervals is not None:
+            self._events.clear()
+            self._events.update(intervals)
 
-            # update the length of the events
-            self._len_events = len(self._events)
+        self._dirty = False
 
     def event(self, *args, **kwargs) -> None:
         """Add a temporal event."""
@@ -127,8 +148,11 @@ class TemporalPathPyObject(PathPyObject):
         start, end, kwargs = _get_start_end(*args, **kwargs)
 
         if active:
+            # the events only have to be normalised if the new one overlaps
+            if not self._dirty and self._events.overlaps(start, end):
+                self._dirty = True
             self._events[start:end] = kwargs  # type: ignore
-            self._attributes = kwargs.copy()
+            self._replace_attributes(kwargs.copy())
         else:
             self._events.chop(start, end)
 
@@ -142,6 +166,754 @@ class TemporalPathPyObject(PathPyObject):
         return interval.begin, interval.end, interval.data
 
 
+class EventStore:
+    """Columnar store of the events of a temporal collection.
+
+    The events are stored as parallel arrays of the start times, end times
+    and object ids, which are sorted by the start times, plus one column per
+    event attribute (``None`` marks missing values). Hence, time slices are
+    found via binary search and no interval tree per object is needed. New
+    events are buffered, sorted and merged into the sorted arrays before the
+    next query. Removed events are masked and dropped in the same pass.
+
+    The times keep their dtype, i.e. integer times stay integers as in the
+    interval trees of the objects. If integer and float times are mixed, all
+    times are stored as floats (following the type promotion of numpy).
+
+    The events of a single object are accessed via an :py:class:`EventView`.
+    The store keeps track of the objects with new events, such that only the
+    events of those objects which actually overlap have to be normalised.
+
+    Examples
+    --------
+    >>> store = EventStore()
+    >>> store.append(store.register('a-b'), 1, 2, {'color': 'red'})
+    >>> store.append(store.register('b-c'), 3, 5, {})
+    >>> sorted(store[0:4])
+    [Interval(1, 2, 'a-b'), Interval(3, 5, 'b-c')]
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the event store."""
+
+        # uids of the objects and the map between uids and object ids
+        self._uids: list = []
+        self._ids: dict = {}
+
+        # number of events and observation period per object id
+        self._count: list = []
+        self._begin: list = []
+        self._end: list = []
+
+        # events sorted by the start times and the event attributes
+        self._start: np.ndarray = np.empty(0)
+        self._stop: np.ndarray = np.empty(0)
+        self._id: np.ndarray = np.empty(0, dtype=np.int64)
+        self._columns: Dict[str, np.ndarray] = {}
+
+        # maximal duration of an event (None if there are no events)
+        self._duration: Any = None
+
+        # new events (start, end, object id, attributes)
+        self._buffer: list = []
+
+        # mask and number of the removed rows which are not yet dropped
+        self._dead: Optional[np.ndarray] = None
+        self._deleted: int = 0
+
+        # ids of the objects with new or removed events which are pending
+        self._pending: set = set()
+
+        # events grouped by the object ids (indptr, rows)
+        self._rows: Optional[tuple] = None
+
+        # ids of the objects with new events
+        self._changed: set = set()
+
+    def __len__(self) -> int:
+        """Return the number of events."""
+        return len(self._id) - self._deleted + len(self._buffer)
+
+    def __iter__(self) -> Iterator[Interval]:
+        """Iterate over the events as (start, end, uid) intervals."""
+        self._flush()
+        uids = self._uids
+        for start, end, i in zip(self._start.tolist(), self._stop.tolist(),
+                                 self._id.tolist()):
+            yield Interval(start, end, uids[i])
+
+    def __getitem__(self, key: slice) -> set:
+        """Return the (start, end, uid) intervals which overlap a period."""
+        rows, uids = self.overlap(key.start, key.stop), self._uids
+        return {Interval(start, end, uids[i]) for start, end, i in zip(
+            self._start[rows].tolist(), self._stop[rows].tolist(),
+            self._id[rows].tolist())}
+
+    def __repr__(self) -> str:
+        """Return the description of the event store."""
+        return '{}({} events)'.format(self.__class__.__name__, len(self))
+
+    @property
+    def uids(self) -> list:
+        """Return the uids of the objects (indexed by the object ids)."""
+        return self._uids
+
+    def begin(self) -> Any:
+        """Return the earliest start time (0 if there are no events)."""
+        self._flush()
+        return _item(self._start[0]) if len(self._start) else 0
+
+    def end(self) -> Any:
+        """Return the latest end time (0 if there are no events)."""
+        self._flush()
+        return _item(self._stop.max()) if len(self._stop) else 0
+
+    def copy(self) -> EventStore:
+        """Return a copy of the event store."""
+        self._flush()
+        other = copy(self)
+        other._uids = list(self._uids)
+        other._ids = dict(self._ids)
+        other._count = list(self._count)
+        other._begin = list(self._begin)
+        other._end = list(self._end)
+        other._columns = dict(self._columns)
+        other._buffer = []
+        other._pending = set()
+        other._changed = set(self._changed)
+        return other
+
+    def register(self, uid: str) -> int:
+        """Return the id of an object (a new id is assigned if needed)."""
+        i = self._ids.get(uid, None)
+        if i is None:
+            i = self._ids[uid] = len(self._uids)
+            self._uids.append(uid)
+            self._count.append(0)
+            self._begin.append(None)
+            self._end.append(None)
+        return i
+
+    def append(self, i: int, start: Any, end: Any, data: dict) -> None:
+        """Add an event of the object with the id i."""
+        self._buffer.append((start, end, i, data))
+        self._changed.add(i)
+        self._pending.add(i)
+        self._count[i] += 1
+        if self._begin[i] is None or start < self._begin[i]:
+            self._begin[i] = start
+        if self._end[i] is None or end > self._end[i]:
+            self._end[i] = end
+
+    def extend(self, ids: np.ndarray, start: np.ndarray, end: np.ndarray,
+               columns: Optional[Dict[str, np.ndarray]] = None) -> None:
+        """Add the events of many objects at once.
+
+        Parameters
+        ----------
+        ids : np.ndarray
+
+            Ids of the objects (see :py:meth:`register`) per event.
+
+        start : np.ndarray
+
+            Start times of the events.
+
+        end : np.ndarray
+
+            End times of the events.
+
+        columns : Dict[str, np.ndarray], optional (default = None)
+
+            Attributes of the events (``None`` marks missing values).
+
+        """
+        self._flush()
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(ids):
+            return
+        start, end = _times(start), _times(end)
+        columns = {key: np.asarray(column, dtype=object)
+                   for key, column in (columns or {}).items()}
+
+        # update the number of events and observation period per object
+        frame = pd.DataFrame({'start': start, 'end': end}).groupby(ids)
+        for i, count, begin, stop in zip(
+                frame.size().index.tolist(), frame.size().tolist(),
+                frame['start'].min().tolist(), frame['end'].max().tolist()):
+            self._count[i] += count
+            if self._begin[i] is None or begin < self._begin[i]:
+                self._begin[i] = begin
+            if self._end[i] is None or stop > self._end[i]:
+                self._end[i] = stop
+
+        self._changed.update(np.unique(ids).tolist())
+        self._merge(start, end, ids, columns)
+
+    def attach(self, obj: Any) -> None:
+        """Move the events of a temporal object into the store."""
+        i = self.register(obj.uid)
+        for start, end, data in list(obj._events):
+            self.append(i, start, end, data)
+        obj._events = EventView(self, i)
+
+    def detach(self, objs: Iterable[Any]) -> None:
+        """Remove the events of objects and restore their interval trees."""
+        ids = []
+        for obj in objs:
+            events = obj._events
+            if isinstance(events, EventView) and events._store is self:
+                obj._events = IntervalTree(events)
+                ids.append(events._id)
+        self._drop(ids)
+        self._changed.difference_update(ids)
+
+    def pop_changed(self) -> List[int]:
+        """Return the ids of the objects with new events and reset them."""
+        changed, self._changed = self._changed, set()
+        return list(changed)
+
+    def overlapping(self, ids: Iterable[int]) -> List[int]:
+        """Return the ids of the objects whose events overlap."""
+        self._flush()
+        ids = np.fromiter(ids, dtype=np.int64)
+        rows = np.flatnonzero(np.isin(self._id, ids))
+
+        # the rows of each object sorted by the start times
+        rows = rows[np.argsort(self._id[rows], kind='stable')]
+        if len(rows) < 2:
+            return []
+        owner, start = self._id[rows], self._start[rows]
+        try:
+            ends = pd.Series(self._stop[rows]).groupby(
+                owner).cummax().to_numpy()
+            hit = (owner[1:] == owner[:-1]) & (start[1:] < ends[:-1])
+        except TypeError:
+            return [i for i in np.unique(owner).tolist()
+                    if self._overlapping(i)]
+        return np.unique(owner[1:][hit]).tolist()
+
+    def overlap(self, start: Any = None, end: Any = None) -> np.ndarray:
+        """Return the rows of the events which overlap a period.
+
+        The rows are sorted by the start and end times of the events.
+        """
+        self._flush()
+        times = self._start
+        high = len(times) if end is None else int(
+            np.searchsorted(times, end, side='left'))
+        low = 0
+        if start is not None and self._duration is not None:
+            try:
+                low = int(np.searchsorted(
+                    times, start - self._duration, side='left'))
+            except (TypeError, ValueError, OverflowError):
+                low = 0
+        rows = np.arange(low, high)
+        if start is not None:
+            rows = rows[np.asarray(self._stop[low:high] > start, dtype=bool)]
+
+        # the rows are sorted by the start times, sort equal starts by ends
+        try:
+            return rows[np.lexsort((self._stop[rows], self._start[rows]))]
+        except TypeError:
+            return np.array(sorted(rows.tolist(), key=lambda row: (
+                self._start[row], self._stop[row])), dtype=np.int64)
+
+    def rows(self, start: Any = None, end: Any = None) -> Iterator[tuple]:
+        """Iterate over the (start, end, uid, attributes) of the events which
+        overlap a period."""
+        rows, uids = self.overlap(start, end), self._uids
+        for row, begin, stop, i in zip(
+                rows.tolist(), self._start[rows].tolist(),
+                self._stop[rows].tolist(), self._id[rows].tolist()):
+            yield begin, stop, uids[i], self._data(row)
+
+    def arrays(self, *keys: str) -> Dict[str, np.ndarray]:
+        """Return the sorted start times, end times, ids and attributes."""
+        self._flush()
+        arrays = {'start': self._start, 'end': self._stop, 'id': self._id}
+        for key in keys:
+            arrays[key] = self._columns.get(
+                key, np.full(len(self._id), None, dtype=object))
+        return arrays
+
+    def _data(self, row: int) -> dict:
+        """Helper function to return the attributes of an event."""
+        return {key: column[row] for key, column in self._columns.items()
+                if column[row] is not None}
+
+    def _object_rows(self, i: int) -> np.ndarray:
+        """Helper function to return the rows of the object with id i.
+
+        The pending changes are only applied if they concern the object,
+        i.e. the events of many objects can be replaced in one batch.
+        """
+        if i in self._pending:
+            self._flush()
+        return self._grouped_rows(i)
+
+    def _grouped_rows(self, i: int) -> np.ndarray:
+        """Helper function to return the rows of an object in the arrays."""
+        if self._rows is None:
+            order = np.argsort(self._id, kind='stable')
+            indptr = np.zeros(len(self._uids) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self._id, minlength=len(self._uids)),
+                      out=indptr[1:])
+            self._rows = (indptr, order)
+        indptr, order = self._rows
+        if i + 1 >= len(indptr):
+            return order[:0]
+        return order[indptr[i]:indptr[i+1]]
+
+    def _overlapping(self, i: int) -> bool:
+        """Helper function to check if events of an object overlap."""
+        rows = self._object_rows(i)
+        if len(rows) < 2:
+            return False
+        ends = np.maximum.accumulate(self._stop[rows][:-1])
+        return bool(np.any(self._start[rows][1:] < ends))
+
+    def _replace(self, i: int, intervals: Iterable[Interval]) -> None:
+        """Helper function to replace the events of an object."""
+        self._drop([i])
+        for start, end, data in intervals:
+            self.append(i, start, end, data)
+        self._changed.discard(i)
+
+    def _drop(self, ids: list) -> None:
+        """Helper function to remove the events of objects.
+
+        The rows of the events are only masked, they are dropped from the
+        arrays with the next flush.
+        """
+        ids = [i for i in ids if self._count[i]]
+        if not ids:
+            return
+
+        if self._buffer:
+            drop = set(ids)
+            self._buffer = [event for event in self._buffer
+                            if event[2] not in drop]
+
+        if self._dead is None:
+            self._dead = np.zeros(len(self._id), dtype=bool)
+        for i in ids:
+            rows = self._grouped_rows(i)
+            self._deleted += len(rows) - int(
+                np.count_nonzero(self._dead[rows]))
+            self._dead[rows] = True
+            self._count[i] = 0
+            self._begin[i] = self._end[i] = None
+        self._pending.update(ids)
+
+    def _flush(self) -> None:
+        """Helper function to apply the removed and new events to the arrays.
+
+        The masked rows are dropped and the new events are sorted and merged
+        into the sorted arrays, i.e. the arrays are not sorted again.
+        """
+        if self._dead is not None:
+            keep = ~self._dead
+            self._start, self._stop = self._start[keep], self._stop[keep]
+            self._id = self._id[keep]
+            self._columns = {key: column[keep]
+                             for key, column in self._columns.items()}
+            self._dead, self._deleted = None, 0
+            self._rows = None
+        self._pending = set()
+
+        if not self._buffer:
+            return
+        buffer, self._buffer = self._buffer, []
+        new = len(buffer)
+
+        columns: Dict[str, np.ndarray] = {}
+        for key in set().union(*(event[3] for event in buffer)):
+            column = np.full(new, None, dtype=object)
+            column[:] = [event[3].get(key, None) for event in buffer]
+            columns[key] = column
+
+        self._merge(_times([event[0] for event in buffer]),
+                    _times([event[1] for event in buffer]),
+                    np.fromiter((event[2] for event in buffer),
+                                dtype=np.int64, count=new), columns)
+
+    def _merge(self, start: np.ndarray, end: np.ndarray, ids: np.ndarray,
+               columns: Dict[str, np.ndarray]) -> None:
+        """Helper function to merge events into the sorted arrays."""
+        size, new = len(self._id), len(ids)
+        duration = _max_duration(start, end)
+        if self._duration is not None:
+            try:
+                duration = max(self._duration, duration)
+            except TypeError:
+                duration = float('inf')
+        self._duration = duration
+
+        # only the new events are sorted
+        order = np.argsort(start, kind='stable')
+        start, end, ids = start[order], end[order], ids[order]
+        columns = {key: column[order] for key, column in columns.items()}
+
+        if not size:
+            self._start, self._stop, self._id = start, end, ids
+            self._columns = columns
+            self._rows = None
+            return
+
+        # positions of the new events in the merged arrays (after the
+        # stored events with equal start times)
+        positions = np.searchsorted(self._start, start, side='right')
+        positions += np.arange(new)
+
+        self._start = _interleave(self._start, start, positions)
+        self._stop = _interleave(self._stop, end, positions)
+        self._id = _interleave(self._id, ids, positions)
+        self._columns = {key: _interleave(
+            self._columns.get(key, np.full(size, None, dtype=object)),
+            columns.get(key, np.full(new, None, dtype=object)), positions)
+            for key in set(self._columns).union(columns)}
+        self._rows = None
+
+
+class EventView:
+    """View on the events of a single object in an :py:class:`EventStore`.
+
+    The view provides the parts of the interval tree interface which are
+    used by temporal objects.
+    """
+    __slots__ = ('_store', '_id')
+
+    def __init__(self, store: EventStore, i: int) -> None:
+        """Initialize the view."""
+        self._store: EventStore = store
+        self._id: int = i
+
+    def __iter__(self) -> Iterator[Interval]:
+        """Iterate over the events of the object."""
+        store = self._store
+        rows = store._object_rows(self._id)
+        for row, start, end in zip(rows.tolist(), store._start[rows].tolist(),
+                                   store._stop[rows].tolist()):
+            yield Interval(start, end, store._data(row))
+
+    def __len__(self) -> int:
+        """Return the number of events of the object."""
+        return self._store._count[self._id]
+
+    def __getitem__(self, key: Any) -> set:
+        """Return the events which overlap a period or point in time."""
+        if isinstance(key, slice):
+            start, end = key.start, key.stop
+            return {interval for interval in self
+                    if (end is None or interval.begin < end) and
+                    (start is None or interval.end > start)}
+        return {interval for interval in self
+                if interval.begin <= key < interval.end}
+
+    def __setitem__(self, key: slice, data: Any) -> None:
+        """Add an event of the object."""
+        self._store.append(self._id, key.start, key.stop, data)
+
+    def __copy__(self) -> IntervalTree:
+        return IntervalTree(self)
+
+    def __deepcopy__(self, memo: dict) -> IntervalTree:
+        return IntervalTree(self)
+
+    def __reduce__(self) -> tuple:
+        return (IntervalTree, (list(self),))
+
+    def begin(self) -> Any:
+        """Return the earliest start time of the events."""
+        begin = self._store._begin[self._id]
+        return 0 if begin is None else begin
+
+    def end(self) -> Any:
+        """Return the latest end time of the events."""
+        end = self._store._end[self._id]
+        return 0 if end is None else end
+
+    def copy(self) -> IntervalTree:
+        """Return the events as interval tree."""
+        return IntervalTree(self)
+
+    def overlaps(self, start: Any, end: Any) -> bool:
+        """Return if events may overlap a period.
+
+        Only the observation period of the object is checked, hence periods
+        within the observation period are always considered as overlapping.
+        """
+        store, i = self._store, self._id
+        if not store._count[i]:
+            return False
+        try:
+            return not (start >= store._end[i] or end <= store._begin[i])
+        except TypeError:
+            return True
+
+    def chop(self, start: Any, end: Any) -> None:
+        """Remove the period between start and end from the events."""
+        tree = IntervalTree(self)
+        tree.chop(start, end)
+        self._store._replace(self._id, tree)
+
+    def clear(self) -> None:
+        """Remove all events of the object."""
+        self._store._replace(self._id, ())
+
+    def update(self, intervals: Iterable[Interval]) -> None:
+        """Add events of the object."""
+        for start, end, data in intervals:
+            self._store.append(self._id, start, end, data)
+
+
+class EventWindow:
+    """Immutable view on the events of a collection within a period.
+
+    The start times, end times and uids of the events are stored in
+    read-only arrays sorted by the start and end times. Attribute values are
+    only collected if requested (e.g. ``window['color']``) and the temporal
+    objects are only looked up while iterating over the window. Hence, no
+    objects are created per event and the window is not affected by other
+    iterations or later changes of the collection.
+
+    Examples
+    --------
+    >>> import pathpy as pp
+    >>> net = pp.TemporalNetwork()
+    >>> net.add_edge('a', 'b', timestamp=1, color='red')
+    >>> net.add_edge('b', 'c', timestamp=3)
+    >>> window = net.edges.window(0, 2)
+    >>> window.start, window['color']
+    (array([1]), array(['red'], dtype=object))
+
+    """
+    __slots__ = ('_collection', '_start', '_end', '_uids', '_keys', '_data',
+                 '_cache')
+
+    def __init__(self, collection: Any, start: np.ndarray, end: np.ndarray,
+                 uids: np.ndarray, keys: Iterable[str],
+                 data: Callable[[str], np.ndarray]) -> None:
+        """Initialize the window."""
+        self._collection: Any = collection
+        self._start: np.ndarray = _readonly(start)
+        self._end: np.ndarray = _readonly(end)
+        self._uids: np.ndarray = _readonly(uids)
+        self._keys: tuple = tuple(keys)
+        self._data: Callable[[str], np.ndarray] = data
+        self._cache: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        """Return the number of events in the window."""
+        return len(self._uids)
+
+    def __iter__(self) -> Iterator[tuple]:
+        """Iterate over the (object, start, end) of the events."""
+        collection = self._collection
+        for uid, start, end in zip(self._uids.tolist(), self._start.tolist(),
+                                   self._end.tolist()):
+            yield collection[uid], start, end
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        """Return the values of an event attribute (``None`` if missing)."""
+        if key not in self._cache:
+            self._cache[key] = _readonly(self._data(key))
+        return self._cache[key]
+
+    def __repr__(self) -> str:
+        """Return the description of the window."""
+        return '{} object with {} events'.format(
+            self.__class__.__name__, len(self))
+
+    @property
+    def start(self) -> np.ndarray:
+        """Return the start times of the events."""
+        return self._start
+
+    @property
+    def end(self) -> np.ndarray:
+        """Return the end times of the events."""
+        return self._end
+
+    @property
+    def uids(self) -> np.ndarray:
+        """Return the uids of the objects of the events."""
+        return self._uids
+
+    def keys(self) -> tuple:
+        """Return the keys of the event attributes in the window."""
+        return self._keys
+
+    def objects(self) -> Iterator[Any]:
+        """Iterate over the objects with events in the window."""
+        collection = self._collection
+        for uid in dict.fromkeys(self._uids.tolist()):
+            yield collection[uid]
+
+    @classmethod
+    def from_tree(cls: Type[_Window], collection: Any, start: Any = None,
+                  end: Any = None) -> _Window:
+        """Create a window from the interval trees of a collection."""
+        rows: List[tuple] = []
+        for uid in {interval.data for interval in
+                    _overlap(collection._events, start, end)}:
+            obj = collection[uid]
+            obj._clean_events()
+            for interval in _overlap(obj._events, start, end):
+                rows.append((interval.begin, interval.end, uid, interval.data))
+        rows.sort(key=lambda row: (row[0], row[1]))
+
+        def data(key: str) -> np.ndarray:
+            values = np.empty(len(rows), dtype=object)
+            values[:] = [row[3].get(key, None) for row in rows]
+            return values
+
+        uids = np.empty(len(rows), dtype=object)
+        uids[:] = [row[2] for row in rows]
+        keys = dict.fromkeys(key for row in rows for key in row[3])
+        return cls(collection, _times([row[0] for row in rows]),
+                   _times([row[1] for row in rows]), uids, keys, data)
+
+    @classmethod
+    def from_store(cls: Type[_Window], collection: Any, start: Any = None,
+                   end: Any = None) -> _Window:
+        """Create a window from the columnar event store of a collection."""
+        store = collection._events
+        rows, columns = store.overlap(start, end), store._columns
+
+        def data(key: str) -> np.ndarray:
+            if key in columns:
+                return columns[key][rows]
+            return np.full(len(rows), None, dtype=object)
+
+        # only the uids of the rows in the window are looked up
+        objs = store._uids
+        uids = np.empty(len(rows), dtype=object)
+        uids[:] = [objs[i] for i in store._id[rows].tolist()]
+        return cls(collection, store._start[rows], store._stop[rows],
+                   uids, tuple(columns), data)
+
+
+class _UidInterval(Interval):
+    """Interval of a collection tree whose hash includes the uid.
+
+    The hash of an interval depends on its period only, such that the events
+    of many objects at the same times collide in the sets of the tree and
+    inserting them becomes quadratic. The uids of the objects are hashable
+    and are included in the hash, intervals are still equal to plain
+    intervals with the same period and uid.
+    """
+    __slots__ = ()
+
+    def __hash__(self):
+        return hash((self.begin, self.end, self.data))
+
+    def __reduce__(self):
+        return _UidInterval, self._get_fields()
+
+
+def _without_events(cls: type, *args: Any, **kwargs: Any) -> Any:
+    """Helper function to create a temporal object without events.
+
+    The constructor builds an interval tree with the first event of the
+    object, which is skipped here. The caller has to assign the events
+    (an interval tree or a view of an event store) and their period.
+    """
+    obj = cls.__new__(cls)
+    obj._events = ()
+    obj.__init__(*args, **kwargs)
+    return obj
+
+
+def _item(value: Any) -> Any:
+    """Helper function to convert numpy scalars to python objects."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _normalize(events: Iterable[Interval]) -> Optional[List[Interval]]:
+    """Helper function to split overlapping events and combine their data.
+
+    The events are sorted and split at all start and end times in one sweep.
+    The attributes of the events covering a period are combined in the order
+    of their start and end times. If no events overlap None is returned.
+    """
+    intervals = sorted(events, key=lambda event: (event.begin, event.end))
+
+    end = None
+    for interval in intervals:
+        if end is not None and interval.begin < end:
+            break
+        end = interval.end if end is None else max(end, interval.end)
+    else:
+        return None
+
+    times = sorted({time for interval in intervals
+                    for time in (interval.begin, interval.end)})
+    result: List[Interval] = []
+    active: List[Interval] = []
+    k = 0
+    for begin, stop in zip(times[:-1], times[1:]):
+        while k < len(intervals) and intervals[k].begin <= begin:
+            active.append(intervals[k])
+            k += 1
+        active = [interval for interval in active if interval.end > begin]
+        if active:
+            data: dict = {}
+            for interval in active:
+                data.update(interval.data)
+            result.append(Interval(begin, stop, data))
+    return result
+
+
+def _interleave(old: np.ndarray, new: np.ndarray,
+                positions: np.ndarray) -> np.ndarray:
+    """Helper function to insert values at their positions of the result."""
+    merged = np.empty(len(old) + len(new), dtype=np.result_type(old, new))
+    rest = np.ones(len(merged), dtype=bool)
+    rest[positions] = False
+    merged[rest] = old
+    merged[positions] = new
+    return merged
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    """Helper function to make an array read-only."""
+    array.setflags(write=False)
+    return array
+
+
+def _overlap(tree: Any, start: Any, end: Any) -> Iterable[Interval]:
+    """Helper function to return the events which overlap a period."""
+    if start is None and end is None:
+        return tree
+    if start is None:
+        start = tree.begin()
+    if end is None:
+        end = tree.end()
+    return tree[start:end] if start < end else set()
+
+
+def _times(values: Union[list, np.ndarray]) -> np.ndarray:
+    """Helper function to convert times into an array."""
+    array = np.array(values)
+    if array.dtype.kind not in 'iuf':
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+    return array
+
+
+def _max_duration(start: np.ndarray, end: np.ndarray) -> Any:
+    """Helper function to return the maximal duration of events."""
+    try:
+        duration = np.max(end - start)
+    except TypeError:
+        return float('inf')
+    return float('inf') if duration != duration else duration
+
+
 def _get_start_end(*args, **kwargs) -> tuple:
     """Helper function to extract the start and end time"""
 
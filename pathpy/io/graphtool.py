@@ -235,7 +235,7 @@ def parse_graphtool_format(data: bytes, ignore_temporal: bool=False, multiedges:
     network_data = pd.DataFrame.from_dict(network_dict, orient='index', columns=['v', 'w'])
 
     # collect all attributes from property maps
-    network_attributes = {}
+    network_attributes: dict = {}
     edge_attribute_names = set()
     node_attributes = defaultdict(lambda: dict())
     edge_attributes = defaultdict(lambda: defaultdict(lambda: pd.NA))
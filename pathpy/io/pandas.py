@@ -12,6 +12,7 @@ from __future__ import annotations
 from typing import Any, Union, Optional
 from collections import Counter
 
+import numpy as np
 import pandas as pd  # pylint: disable=import-error
 
 from pathpy import config, logger
@@ -191,6 +192,7 @@ def add_attributes(df: pd.DataFrame, network: Network):
 
 def to_temporal_network(df: pd.DataFrame, loops: bool = True,
                         directed: bool = True, multiedges: bool = False,
+                        events: str = 'tree',
                         **kwargs: Any) -> TemporalNetwork:
     """Reads a temporal network from a pandas data frame.
 
@@ -228,6 +230,12 @@ def to_temporal_network(df: pd.DataFrame, loops: bool = True,
         Whether or not to allow multiple edges between the same node pair. By
         default multi-edges are ignored.
 
+    events: Optional[str]='tree'
+
+        Backend to store the edge events, either `tree` (interval trees) or
+        `columnar` (see :py:class:`EventStore`). The columnar backend is
+        recommended for large data frames.
+
     **kwargs: Any
 
         Arbitrary keyword arguments that will be set as network-level
@@ -336,13 +344,18 @@ def to_temporal_network(df: pd.DataFrame, loops: bool = True,
         LOG.error('DataFrame minimally needs columns \'v\' and \'w\'')
         raise IOError
 
+    # create empty network
+    net = TemporalNetwork(directed=directed, multiedges=multiedges,
+                          events=events, **kwargs)
+
+    # add the events in bulk if every row is an event of a (v, w) pair
+    if not multiedges and not {'uid', 'unit'} & set(df.columns):
+        _add_temporal_edges(net, df)
+        return net
+
     # create dict with node.uid and node
     nodes: dict = {str(n): TemporalNode(str(n)) for n in node_set}
 
-    # create empty network
-    net = TemporalNetwork(directed=directed, multiedges=multiedges, **kwargs)
-
-    # TODO: Make this for loop faster!
     for row in df.to_dict(orient='records'):
         # get node and edge  uids
         _v, _w = str(row.pop('v')), str(row.pop('w'))
@@ -355,6 +368,100 @@ def to_temporal_network(df: pd.DataFrame, loops: bool = True,
     return net
 
 
+def _add_temporal_edges(net: TemporalNetwork, df: pd.DataFrame) -> None:
+    """Helper function to add the rows of a data frame as edge events.
+
+    The time columns are converted in bulk and the events are added to the
+    network at once (see :py:meth:`TemporalNetwork.extend_events`).
+    """
+    start, end = _event_times(df)
+    keys = [name for name in df.columns if name not in ('v', 'w')]
+    times = [name for name in keys if name in (
+        config['temporal']['start'], config['temporal']['end'],
+        config['temporal']['timestamp'], config['temporal']['duration'])]
+    net.extend_events(
+        df['v'].astype(str).to_numpy(), df['w'].astype(str).to_numpy(),
+        start, end,
+        columns={name: df[name].to_numpy(dtype=object)
+                 for name in keys if name not in times},
+        times={name: df[name].to_numpy(dtype=object) for name in times})
+
+
+def _event_times(df: pd.DataFrame) -> tuple:
+    """Helper function to return the start and end times of the rows."""
+    if config['temporal']['timestamp'] in df.columns:
+        start, end = _timestamp_times(df)
+    else:
+        start, end = _start_end_times(df)
+    return _time_array(df, start), _time_array(df, end)
+
+
+def _timestamp_times(df: pd.DataFrame) -> tuple:
+    """Helper function to return the times of rows with timestamps."""
+    start = _times(df, config['temporal']['timestamp'])
+    return start, start + _durations(df, start)
+
+
+def _start_end_times(df: pd.DataFrame) -> tuple:
+    """Helper function to return the times of rows with start or end times.
+
+    Missing times are derived from the durations or are unbounded.
+    """
+    _start = config['temporal']['start']
+    _end = config['temporal']['end']
+    _duration = config['temporal']['duration']
+
+    start: Any = float('-inf')
+    end: Any = float('inf')
+    if _start in df.columns:
+        start = _times(df, _start)
+    if _end in df.columns:
+        end = _times(df, _end)
+    if _duration in df.columns and _start in df.columns:
+        end = start + _durations(df, start)
+    elif _duration in df.columns and _end in df.columns:
+        start = end - _durations(df, end)
+    return start, end
+
+
+def _times(df: pd.DataFrame, name: str) -> pd.Series:
+    """Helper function to return a column of numeric or datetime times."""
+    values = df[name]
+    if values.dtype.kind in 'iufM':
+        return values
+    try:
+        return pd.to_datetime(values)
+    except ValueError:
+        # times in different formats are parsed one by one
+        return pd.to_datetime(values.map(pd.Timestamp))
+
+
+def _durations(df: pd.DataFrame, like: pd.Series) -> Any:
+    """Helper function to return the durations matching the type of times."""
+    _duration = config['temporal']['duration']
+    unit = config['temporal']['unit']
+
+    if _duration not in df.columns:
+        value = config['temporal']['duration_value']
+        return (pd.Timedelta(value, unit=unit)
+                if like.dtype.kind == 'M' else value)
+    values = df[_duration]
+    if like.dtype.kind != 'M':
+        return values
+    if values.dtype.kind in 'iuf':
+        return pd.to_timedelta(values, unit=unit)
+    return pd.to_timedelta(values)
+
+
+def _time_array(df: pd.DataFrame, values: Any) -> np.ndarray:
+    """Helper function to return the times as an array with a row each."""
+    if not isinstance(values, pd.Series):
+        return np.full(len(df), values)
+    if values.dtype.kind == 'M':
+        return values.astype(object).to_numpy()
+    return values.to_numpy()
+
+
 def from_network(network: Network, include_edge_uid: Optional[bool] = False,
                  export_indices: Optional[bool] = False) -> pd.DataFrame:
     """Returns a pandas dataframe of the network.
@@ -0,0 +1,524 @@
+"""Compiled network class"""
+# !/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : compiled_network.py -- Array based snapshot of a network
+# Author    : Pathpy Developers
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+from __future__ import annotations
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from pathpy import logger
+
+# pseudo load class for type checking
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+    from pathpy.models.network import Network
+
+# create logger for the CompiledNetwork class
+LOG = logger(__name__)
+
+
+class CompiledNetwork:
+    """Immutable integer-indexed snapshot of a network.
+
+    The compiled network stores the structure of a :py:class:`Network` in
+    flat NumPy arrays, which can be directly used by array based algorithms.
+    Nodes and edges are indexed in the order of ``network.nodes.index`` and
+    ``network.edges.index``, respectively.
+
+    The out- and in-neighbours of the nodes are stored in the compressed
+    sparse row (CSR) format, i.e. the successors of the node ``i`` are
+    ``indices[indptr[i]:indptr[i+1]]`` and the corresponding edges are
+    ``edge_ids[indptr[i]:indptr[i+1]]``. For undirected networks both
+    directions of an edge are stored, self-loops are stored only once.
+
+    .. note::
+
+        The snapshot is not updated if the network changes. Use
+        :py:meth:`Network.compile` to get an up-to-date version.
+        The ``weight`` and ``count`` arrays contain the values at the time of
+        the compilation.
+
+    Parameters
+    ----------
+    network : Network
+
+        The network which should be compiled.
+
+    Examples
+    --------
+    >>> import pathpy as pp
+    >>> net = pp.Network()
+    >>> net.add_edges(('a', 'b'), ('b', 'c'), ('a', 'c'))
+    >>> csr = net.compile()
+    >>> csr.uids[csr.successors(csr.index['a'])]
+    array(['b', 'c'], dtype=object)
+
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, network: Network) -> None:
+        """Initialize the compiled network."""
+
+        edges = network.edges
+        counter = edges.counter
+
+        # get number of edges
+        m = network.number_of_edges()
+
+        # map between node uids and integer indices
+        index = dict(network.nodes.index)
+
+        # source and target indices of the edges
+        objs = edges._values_by_index()
+        self._compile(
+            uids=network.nodes.inverse_index,
+            v=_array((index[e.v.uid] for e in objs), np.int64, m),
+            w=_array((index[e.w.uid] for e in objs), np.int64, m),
+            weight=edges.weights(),
+            count=_array((counter[uid] for uid in edges.inverse_index),
+                         float, m),
+            directed=network.directed,
+            edge_uids=edges.inverse_index)
+        self._index = index
+
+    @classmethod
+    def from_arrays(cls, uids: Any, edge_uids: Any, v: np.ndarray,
+                    w: np.ndarray, weight: np.ndarray, count: np.ndarray,
+                    directed: bool = True) -> CompiledNetwork:
+        """Create a compiled network from the columns of a network.
+
+        Networks whose objects are not created yet (e.g. networks created
+        via :py:meth:`Network.from_arrays` or unpickled networks) are
+        compiled from their stored columns. If the edge uids are not known
+        before the edges are created, ``edge_uids`` is a function which
+        returns them and is called when ``edge_uids`` is accessed the first
+        time.
+
+        Parameters
+        ----------
+        uids : array_like
+
+            Uids of the nodes.
+
+        edge_uids : array_like or Callable[[], Iterable[str]]
+
+            Uids of the edges or function returning them.
+
+        v : np.ndarray
+
+            Indices of the source nodes of the edges.
+
+        w : np.ndarray
+
+            Indices of the target nodes of the edges.
+
+        weight : np.ndarray
+
+            Weights of the edges.
+
+        count : np.ndarray
+
+            Counts of the edges.
+
+        directed : bool, optional (default = True)
+
+            Indicator whether the network is directed or undirected.
+
+        """
+        network = cls.__new__(cls)
+        network._compile(
+            uids=uids, v=np.asarray(v, dtype=np.int64), w=np.asarray(w, dtype=np.int64),
+            weight=np.asarray(weight, dtype=float),
+            count=np.asarray(count, dtype=float),
+            directed=directed, edge_uids=edge_uids)
+        return network
+
+    def _compile(self, uids: Any, v: np.ndarray, w: np.ndarray,
+                 weight: np.ndarray, count: np.ndarray, directed: bool,
+                 edge_uids: Any) -> None:
+        """Helper function to create the arrays of the compiled network."""
+        n, m = len(uids), len(v)
+
+        # indicator whether the network is directed or undirected
+        self.directed: bool = directed
+
+        # map between node uids and integer indices (created on access)
+        self._index: Optional[Dict[str, int]] = None
+        self.uids: np.ndarray = _array(uids, object, n)
+
+        # edge uids (requested on access if not known yet) and source and
+        # target indices of the edges
+        if callable(edge_uids):
+            self._pending: Optional[Callable[[], Any]] = edge_uids
+        else:
+            self.edge_uids: np.ndarray = _array(edge_uids, object, m)
+        self.v: np.ndarray = v
+        self.w: np.ndarray = w
+
+        # edge weights and counts
+        self.weight: np.ndarray = weight
+        self.count: np.ndarray = count
+
+        # compressed sparse rows of the out- and in-neighbours
+        src, dst, eid = self.v, self.w, np.arange(m, dtype=np.int64)
+        if not self.directed:
+            loop = self.v == self.w
+            src = np.concatenate((self.v, self.w[~loop]))
+            dst = np.concatenate((self.w, self.v[~loop]))
+            eid = np.concatenate((eid, eid[~loop]))
+
+        self.indptr, self.indices, self.edge_ids = _csr(src, dst, eid, n)
+        self.in_indptr, self.in_indices, self.in_edge_ids = _csr(
+            dst, src, eid, n)
+
+        # make the snapshot immutable
+        for array in vars(self).values():
+            if isinstance(array, np.ndarray):
+                array.flags.writeable = False
+
+    def __getattr__(self, name: str) -> Any:
+        """Request the edge uids if they are accessed the first time."""
+        pending = self.__dict__.get('_pending', None)
+        if name != 'edge_uids' or pending is None:
+            raise AttributeError(name)
+        uids = _array(pending(), object, len(self.v))
+        uids.flags.writeable = False
+        self.edge_uids, self._pending = uids, None
+        return uids
+
+    def __repr__(self) -> str:
+        """Return the description of the compiled network."""
+        return '{} {}'.format(self.__class__.__name__, self.shape)
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """Return the map between node uids and integer indices."""
+        if self._index is None:
+            self._index = {uid: i for i, uid in enumerate(self.uids.tolist())}
+        return self._index
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Return the number of nodes and edges."""
+        return len(self.uids), len(self.v)
+
+    def successors(self, i: int) -> np.ndarray:
+        """Return the indices of the successors of the node with index i."""
+        return self.indices[self.indptr[i]:self.indptr[i+1]]
+
+    def predecessors(self, i: int) -> np.ndarray:
+        """Return the indices of the predecessors of the node with index i."""
+        return self.in_indices[self.in_indptr[i]:self.in_indptr[i+1]]
+
+    def outdegrees(self) -> np.ndarray:
+        """Return the number of outgoing edges of all nodes."""
+        return np.diff(self.indptr)
+
+    def indegrees(self) -> np.ndarray:
+        """Return the number of incoming edges of all nodes."""
+        return np.diff(self.in_indptr)
+
+    def share(self, **arrays: np.ndarray) -> SharedNetwork:
+        """Publish the compiled network in shared memory.
+
+        The arrays of the compiled network (and optional attribute arrays)
+        are copied once into a block of shared memory. The returned handle
+        is small and can be passed to the workers of a process pool, which
+        attach to the arrays without copying them.
+
+        .. note::
+
+            Shared memory requires Python 3.8 or later.
+
+        Parameters
+        ----------
+        arrays : np.ndarray
+
+            Additional numeric arrays, e.g. node or edge attribute columns,
+            which are published as ``key=array`` pairs.
+
+        Returns
+        -------
+        SharedNetwork
+
+            Handle of the shared compiled network.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> from concurrent.futures import ProcessPoolExecutor
+        >>> net = pp.Network()
+        >>> net.add_edges(('a', 'b'), ('b', 'c'), weight=2.0)
+        >>> def degree(shared, i):
+        ...     return shared.attach().outdegrees()[i]
+        >>> with net.compile().share() as shared:
+        ...     with ProcessPoolExecutor(2) as pool:
+        ...         list(pool.map(degree, [shared] * 3, range(3)))
+        [1, 1, 0]
+
+        """
+        return SharedNetwork(self, **arrays)
+
+
+# arrays of a compiled network which are published in shared memory
+_SHARED: Tuple[str, ...] = (
+    'uids', 'edge_uids', 'v', 'w', 'weight', 'count', 'indptr', 'indices',
+    'edge_ids', 'in_indptr', 'in_indices', 'in_edge_ids')
+
+# uid arrays which are published as bytes and offsets
+_UIDS: Tuple[str, ...] = ('uids', 'edge_uids')
+
+
+class SharedNetwork:
+    """Handle of a compiled network stored in shared memory.
+
+    The handle only stores the name and the layout of the shared memory
+    block, i.e. it can be pickled cheaply and passed to other processes.
+    :py:meth:`attach` returns a read-only :py:class:`CompiledNetwork` whose
+    arrays are views on the shared memory. Additional attribute arrays are
+    returned by ``shared[key]``.
+
+    The node and edge uids are stored as UTF-8 encoded bytes together with
+    the offsets of the single uids. They are decoded once per process when
+    the network is attached and the map between node uids and indices is
+    only created if it is accessed.
+
+    .. note::
+
+        The process which created the handle owns the shared memory and has
+        to release it with :py:meth:`unlink` (or by using the handle as
+        context manager) after the workers have finished.
+
+    Parameters
+    ----------
+    network : CompiledNetwork
+
+        The compiled network which should be published.
+
+    arrays : np.ndarray
+
+        Additional numeric arrays which are published as ``key=array``
+        pairs.
+
+    """
+
+    def __init__(self, network: CompiledNetwork, **arrays: np.ndarray) -> None:
+        """Initialize the shared network."""
+
+        # collect the arrays which are published
+        published = {name: getattr(network, name) for name in _SHARED
+                     if name not in _UIDS}
+        for name in _UIDS:
+            published[name], published[name + '_offsets'] = _encode(
+                getattr(network, name))
+
+        attributes = {key: np.asarray(array) for key, array in arrays.items()}
+        for key, array in attributes.items():
+            if array.dtype == object:
+                LOG.error('The array "%s" is not numeric!', key)
+                raise AttributeError
+
+        # indicator whether the network is directed or undirected
+        self.directed: bool = network.directed
+
+        # layout of the shared memory {name: (offset, dtype, shape)}
+        self._layout: Dict[str, tuple] = {}
+        self._attributes: Dict[str, tuple] = {}
+
+        offset = 0
+        for layout, values in ((self._layout, published),
+                               (self._attributes, attributes)):
+            for key, array in values.items():
+                layout[key] = (offset, array.dtype.str, array.shape)
+                offset += -(-array.nbytes // 64) * 64
+
+        # create the shared memory and copy the arrays
+        self._memory: Optional[SharedMemory] = _shared_memory(
+            create=True, size=max(offset, 1))
+        self._owner: bool = True
+        self._network: Optional[CompiledNetwork] = None
+
+        self.name: str = self._memory.name
+
+        for layout, values in ((self._layout, published),
+                               (self._attributes, attributes)):
+            for key, array in values.items():
+                _view(self._memory, layout[key], writeable=True)[...] = array
+
+    def __repr__(self) -> str:
+        """Return the description of the shared network."""
+        return '{} {}'.format(self.__class__.__name__, self.name)
+
+    def __getstate__(self) -> dict:
+        """Return the state of the handle without the shared memory."""
+        return {'directed': self.directed, 'name': self.name,
+                '_layout': self._layout, '_attributes': self._attributes}
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a handle which is not yet attached."""
+        self.__dict__.update(state)
+        self._memory = None
+        self._owner = False
+        self._network = None
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        """Return a shared attribute array."""
+        if key not in self._attributes:
+            LOG.error('No array "%s" was shared!', key)
+            raise KeyError(key)
+        return _view(self._attach_memory(), self._attributes[key])
+
+    def __enter__(self) -> SharedNetwork:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+    @property
+    def attributes(self) -> Tuple[str, ...]:
+        """Return the keys of the shared attribute arrays."""
+        return tuple(self._attributes)
+
+    def attach(self) -> CompiledNetwork:
+        """Return the compiled network stored in the shared memory."""
+        if self._network is None:
+            memory = self._attach_memory()
+            network = CompiledNetwork.__new__(CompiledNetwork)
+            network.directed = self.directed
+            network._index = None
+            for name, layout in self._layout.items():
+                setattr(network, name, _view(memory, layout))
+            for name in _UIDS:
+                uids = _decode(getattr(network, name),
+                               getattr(network, name + '_offsets'))
+                uids.flags.writeable = False
+                setattr(network, name, uids)
+                delattr(network, name + '_offsets')
+            self._network = network
+        return self._network
+
+    def close(self) -> None:
+        """Detach this process from the shared memory.
+
+        All arrays returned by the handle have to be released before.
+        """
+        self._network = None
+        if self._memory is not None:
+            self._memory.close()
+            self._memory = None
+
+    def unlink(self) -> None:
+        """Release the shared memory (only called by the owner)."""
+        if not self._owner:
+            LOG.error('Only the creator of the shared network can unlink it')
+            raise AttributeError
+        memory = self._memory or _shared_memory(name=self.name)
+        self._network = None
+        self._memory = None
+        memory.close()
+        _track(memory, True)
+        memory.unlink()
+        self._owner = False
+
+    def _attach_memory(self) -> SharedMemory:
+        """Helper function to open the shared memory in this process."""
+        if self._memory is None:
+            self._memory = _track(_shared_memory(name=self.name), False)
+        return self._memory
+
+
+def _shared_memory(**kwargs: Any) -> SharedMemory:
+    """Helper function to create or open a block of shared memory."""
+    try:
+        from multiprocessing.shared_memory import SharedMemory
+    except ImportError:
+        LOG.error('Shared networks require Python 3.8 or later')
+        raise ImportError
+    return SharedMemory(**kwargs)
+
+
+def _track(memory: SharedMemory, track: bool) -> SharedMemory:
+    """Helper function to (un)register a block with the resource tracker.
+
+    Before Python 3.13 every process which opens a block of shared memory
+    registers it with its resource tracker, which unlinks the block (or
+    warns about a leak) as soon as this process exits. Hence, the workers
+    unregister the block after opening it. Since the workers may share the
+    resource tracker with the owner, the owner registers the block again
+    before unlinking it, which unregisters it once more.
+    """
+    if sys.version_info < (3, 13) and os.name == 'posix':
+        from multiprocessing import resource_tracker
+        # NOTE: the tracker uses the name with the leading slash
+        name = getattr(memory, '_name', memory.name)
+        if track:
+            resource_tracker.register(name, 'shared_memory')
+        else:
+            resource_tracker.unregister(name, 'shared_memory')
+    return memory
+
+
+def _array(values, dtype, count: int) -> np.ndarray:
+    """Helper function to convert an iterable to a numpy array."""
+    if dtype is object:
+        array = np.empty(count, dtype=object)
+        array[:] = list(values)
+        return array
+    return np.fromiter(values, dtype=dtype, count=count)
+
+
+def _encode(uids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Helper function to encode uids as bytes and offsets."""
+    data = [str(uid).encode('utf-8') for uid in uids.tolist()]
+    offsets = np.zeros(len(data)+1, dtype=np.int64)
+    np.cumsum([len(uid) for uid in data], out=offsets[1:])
+    return np.frombuffer(b''.join(data), dtype=np.uint8), offsets
+
+
+def _decode(data: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Helper function to decode uids stored as bytes and offsets."""
+    buffer = data.tobytes()
+    bounds = offsets.tolist()
+    return _array((buffer[start:end].decode('utf-8')
+                   for start, end in zip(bounds, bounds[1:])),
+                  object, len(bounds) - 1)
+
+
+def _view(memory: SharedMemory, layout: tuple,
+          writeable: bool = False) -> np.ndarray:
+    """Helper function to return an array stored in shared memory."""
+    offset, dtype, shape = layout
+    array = np.ndarray(shape, dtype=dtype, buffer=memory.buf, offset=offset)
+    array.flags.writeable = writeable
+    return array
+
+
+def _csr(src: np.ndarray, dst: np.ndarray, eid: np.ndarray,
+         n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Helper function to create the compressed sparse rows."""
+    order = np.argsort(src, kind='stable')
+    indptr = np.zeros(n+1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return indptr, dst[order], eid[order]
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
@@ -74,31 +74,32 @@ class DirectedAcyclicGraph(ABCDirectedAcyclicGraph, Network):
     def _add_node_properties(self):
         """Helper function to update node properties."""
 
-        nodes = set(self.nodes).difference(self._properties['nodes'])
+        for node in self.nodes._pop_changes(added=True):
+            self._unshare_properties()
+            if node not in self._properties['nodes']:
+                self._properties['roots'].add(node)
+                self._properties['leafs'].add(node)
 
-        for node in nodes:
-            self._properties['roots'].add(node)
-            self._properties['leafs'].add(node)
+                self._properties['nodes'].add(node)
 
-            self._properties['nodes'].add(node)
+            self._notify('add_node', node)
 
     def _remove_node_properties(self):
         """Helper function to update node properties."""
 
-        nodes = set(self.nodes).difference(self._properties['nodes'])
-
-        for node in nodes:
+        for node in self.nodes._pop_changes(added=False):
+            self._unshare_properties()
             self._properties['roots'].discard(node)
             self._properties['leafs'].discard(node)
 
             self._properties['nodes'].discard(node)
+            self._drop_node_properties(node)
+            self._notify('remove_node', node)
 
     def _add_edge_properties(self, *args):
         """Helper function to update network properties."""
 
-        edges = set(self.edges).difference(self._properties['edges'])
-
-        for edge in edges:
+        for edge in self.edges._pop_changes(added=True):
 
             # update nodes in the network
             for uid, node in edge.nodes.items():
@@ -107,6 +108,7 @@ class DirectedAcyclicGraph(ABCDirectedAcyclicGraph, Network):
 
             # get node objects
             node_v, node_w = self.nodes[edge.v.uid], self.nodes[edge.w.uid]
+            self._unshare_properties(node_v, node_w)
             uid = edge.uid
 
             _nodes: list = [(node_v, node_w), (node_w, node_v)]
@@ -145,14 +147,21 @@ class DirectedAcyclicGraph(ABCDirectedAcyclicGraph, Network):
 
             self._properties['edges'].add(edge)
 
+            for accumulator in self._accumulators.values():
+                accumulator.add(edge)
+
+            self._notify('add_edge', edge)
+
+        # update properties of nodes added via the edges
+        self._add_node_properties()
+
     def _remove_edge_properties(self, *args):
         """Helper function to update network properties."""
 
-        edges = self._properties['edges'].difference(set(self.edges))
-
-        for edge in edges:
+        for edge in self.edges._pop_changes(added=False):
             # get node objects
             node_v, node_w = self.nodes[edge.v.uid], self.nodes[edge.w.uid]
+            self._unshare_properties(node_v, node_w)
             uid = edge.uid
 
             _nodes: list = [(node_v, node_w), (node_w, node_v)]
@@ -186,6 +195,16 @@ class DirectedAcyclicGraph(ABCDirectedAcyclicGraph, Network):
 
             self._properties['edges'].discard(edge)
 
+            for accumulator in self._accumulators.values():
+                accumulator.remove(edge)
+
+            self._notify('remove_edge', edge)
+
+    def _new(self, uid: Optional[str] = None) -> DirectedAcyclicGraph:
+        """Helper function to create an empty dag of the same kind."""
+        return self.__class__(uid=uid, multiedges=self.multiedges,
+                              **self.attributes)
+
     def summary(self) -> str:
         """Returns a summary of the dag."""
         summary = [
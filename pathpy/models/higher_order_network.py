@@ -8,13 +8,14 @@
 #
 # Copyright (c) 2016-2020 Pathpy Developers
 # =============================================================================
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 from itertools import islice
 from collections import Counter
 from singledispatchmethod import singledispatchmethod  # NOTE: not needed at 3.9
 import numpy as np
 
 from pathpy import logger, tqdm
+from pathpy.utils.memory import sizeof
 from pathpy.core.core import PathPyRelation
 from pathpy.core.edge import Edge, EdgeCollection
 from pathpy.core.path import Path, PathCollection
@@ -93,10 +94,10 @@ class HigherOrderNetwork(BaseHigherOrderNetwork, Network):
         self._order: int = order
 
         # a container for node objects
-        self._nodes: Any = HigherOrderNodeCollection()
+        self._nodes: Any = HigherOrderNodeCollection(track_changes=True)
 
         # a container for edge objects
-        self._edges: Any = HigherOrderEdgeCollection()
+        self._edges: Any = HigherOrderEdgeCollection(track_changes=True)
 
         # a counter for observed paths
         self._observed: Counter = Counter()
@@ -109,6 +110,17 @@ class HigherOrderNetwork(BaseHigherOrderNetwork, Network):
         """Return the order of the higher-order network."""
         return self._order
 
+    def _new(self, uid: Optional[str] = None) -> 'HigherOrderNetwork':
+        """Helper function to create an empty network of the same order."""
+        return self.__class__(uid=uid, order=self.order, **self.attributes)
+
+    def _memory_usage(self, seen: set, deep: bool) -> Dict[str, int]:
+        """Helper function to measure the components of the network."""
+        usage = super()._memory_usage(seen, deep)
+        usage['counters'] += sizeof(self._observed, self._subpaths,
+                                    seen=seen, deep=deep)
+        return usage
+
     @property
     def subpaths(self) -> Counter:
         """Return a counter of (observed) subpaths."""
@@ -10,16 +10,38 @@
 # Copyright (c) 2016-2019 Pathpy Developers
 # =============================================================================
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Tuple, Optional, Union, Dict, Set, cast
-from collections import defaultdict
+from typing import (TYPE_CHECKING, Any, Tuple, Optional, Union, Dict, Set,
+                    Mapping, Iterable, Iterator, Callable, cast)
+from collections import defaultdict, Counter
+from copy import copy
+from collections.abc import Mapping as ABCMapping, Set as ABCSet
+
+import numpy as np
+import pandas as pd
 
 from pathpy import logger
+from pathpy.utils.memory import sizeof
 from pathpy.models.classes import BaseNetwork
+from pathpy.core.core import PathPyObject, AttributeLog, _to_weights
 from pathpy.core.node import Node, NodeCollection
 from pathpy.core.edge import Edge, EdgeCollection
+from pathpy.models.compiled_network import CompiledNetwork
+from pathpy.models.network_view import NetworkView
 
 # create custom types
 Weight = Union[str, bool, None]
+Observer = Callable[['Network', PathPyObject], None]
+
+# events which can be observed via Network.subscribe
+EVENTS: Tuple[str, ...] = ('add_node', 'remove_node', 'add_edge', 'remove_edge')
+
+# stores of a network which are built on access after unpickling or after
+# creating the network from arrays
+_PACKED: Tuple[str, ...] = ('_nodes', '_edges', '_properties')
+
+# methods returning the columns of the packed data per unpack method
+_COLUMNS: Dict[str, str] = {'_unpack': '_columns',
+                            '_unpack_arrays': '_columns_arrays'}
 
 # pseudo load class for type checking
 if TYPE_CHECKING:
@@ -30,6 +52,176 @@ if TYPE_CHECKING:
 LOG = logger(__name__)
 
 
+class PropertyView(ABCMapping):
+    """Read-only view of a node property of a network.
+
+    The view maps the uids of the nodes to the values stored in the network
+    properties, e.g. the set of successors of a node. The values are not
+    copied but returned as read-only :py:class:`SetView`, i.e. changes of the
+    network are directly visible in the view.
+
+    Parameters
+    ----------
+    network : Network
+
+        The network whose nodes are used as keys of the view.
+
+    name : str
+
+        The name of the network property which maps node objects to their
+        values, e.g. ``'successors'``.
+
+    """
+
+    def __init__(self, network: Network, name: str) -> None:
+        """Initialize the view."""
+        self._network: Network = network
+        self._name: str = name
+
+    def __getitem__(self, key: str) -> SetView:
+        network = self._network
+        values = network._properties[self._name].get(
+            network.nodes._store[key], None)
+        return SetView(values if values is not None else frozenset())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._network.nodes.keys())
+
+    def __len__(self) -> int:
+        return len(self._network.nodes)
+
+    def __repr__(self) -> str:
+        return dict(self).__repr__()
+
+
+class SetView(ABCSet):
+    """Read-only view of a set stored in the network properties.
+
+    The set is not copied, but it can only be read via the view. Set
+    operations like ``|`` or ``-`` return a new ``frozenset``.
+    """
+    __slots__ = ('_values',)
+
+    def __init__(self, values: Iterable) -> None:
+        """Initialize the view."""
+        self._values = values
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable) -> frozenset:
+        return frozenset(it)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._values
+
+    def __iter__(self) -> Iterator:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return set(self._values).__repr__()
+
+
+class DegreeAccumulator:
+    """Weighted in-, out- and total degrees of the nodes of a network.
+
+    The accumulator stores the weight of each edge and the sums of the
+    weights per node. It is registered by a network for a weight attribute
+    and updated incrementally if edges are added or removed. Changes of the
+    weight attribute are read from the attribute log of the edge collection
+    and only the changed edges are updated before the degrees are returned.
+
+    Parameters
+    ----------
+    network : Network
+
+        The network whose edges are accumulated.
+
+    weight : Union[str, bool]
+
+        The attribute which is used as weight (see :py:meth:`Edge.weight`).
+
+    """
+
+    def __init__(self, network: Network, weight: Weight) -> None:
+        """Initialize the accumulator."""
+        self.directed: bool = network.directed
+        self.weight: Weight = weight
+
+        # weights of the edges {Edge: weight}
+        self.edges: Dict[Edge, float] = {}
+
+        # weighted degrees {node uid: degree}
+        self.indegrees: defaultdict = defaultdict(float)
+        self.outdegrees: defaultdict = defaultdict(float)
+        self.degrees: defaultdict = defaultdict(float)
+
+        # attribute which determines the weights (None for constant weights)
+        self.key: Optional[str] = None
+        if weight is not None and weight is not False:
+            self.key = weight if isinstance(weight, str) else 'weight'
+
+        # edges whose attribute log is read and the position of the log the
+        # weights are in sync with
+        self._edges: EdgeCollection = network.edges
+        self._log: Optional[AttributeLog] = self._edges._observe()
+        self._position: int = self._log.position
+
+        for edge in network.edges.values():
+            self.add(edge)
+
+    def __getstate__(self) -> dict:
+        """Return the state without the log (all edges are checked after)."""
+        state = self.__dict__.copy()
+        state['_log'] = None
+        return state
+
+    def add(self, edge: Edge) -> None:
+        """Add the weight of an edge to the degrees."""
+        self.remove(edge)
+        self.edges[edge] = edge.weight(self.weight)
+        self._apply(edge, self.edges[edge])
+
+    def remove(self, edge: Edge) -> None:
+        """Remove the weight of an edge from the degrees."""
+        if edge in self.edges:
+            self._apply(edge, -self.edges.pop(edge))
+
+    def _apply(self, edge: Edge, value: float) -> None:
+        """Helper function to add a value to the degrees of the nodes."""
+        v, w = edge.v.uid, edge.w.uid
+        self.outdegrees[v] += value
+        self.indegrees[w] += value
+        self.degrees[v] += value
+        if v != w:
+            self.degrees[w] += value
+            if not self.directed:
+                self.outdegrees[w] += value
+                self.indegrees[v] += value
+
+    def update(self) -> None:
+        """Apply changes of the edge weights to the degrees."""
+        log = self._edges._observe()
+        changes = log.since(self._position) if log is self._log else None
+        self._log, self._position = log, log.position
+
+        if self.key is None:
+            return
+
+        # the changes were dropped (or the network was copied), i.e. all edges
+        # are checked
+        if changes is None:
+            for edge, value in list(self.edges.items()):
+                if edge.weight(self.weight) != value:
+                    self.add(edge)
+            return
+
+        for obj, key, _ in changes:
+            if key == self.key and obj in self.edges:
+                self.add(obj)
+
+
 class Network(BaseNetwork):
     """Class for a network.
 
@@ -165,6 +357,9 @@ class Network(BaseNetwork):
     # pylint: disable=too-many-instance-attributes
     # pylint: disable=too-many-public-methods
 
+    # node and edge classes which can be pickled in the compact format
+    _compact_classes: Tuple[type, type] = (Node, Edge)
+
     def __init__(self, uid: Optional[str] = None, directed: bool = True,
                  multiedges: bool = False, **kwargs: Any) -> None:
         """Initialize the network object."""
@@ -182,11 +377,11 @@ class Network(BaseNetwork):
         self._properties: defaultdict = defaultdict()
 
         # a container for node objects
-        self._nodes: NodeCollection = NodeCollection()
+        self._nodes: NodeCollection = NodeCollection(track_changes=True)
 
         # a container for edge objects
         self._edges: EdgeCollection = EdgeCollection(
-            directed=directed, multiedges=multiedges)
+            directed=directed, multiedges=multiedges, track_changes=True)
 
         # add network properties
         self._properties['edges'] = set()
@@ -200,6 +395,26 @@ class Network(BaseNetwork):
         self._properties['outdegrees'] = defaultdict(float)
         self._properties['degrees'] = defaultdict(float)
 
+        # indicator if the properties are shared with a snapshot and the
+        # nodes with already cloned property sets (None if nothing is shared)
+        self._shared_properties: bool = False
+        self._owned: Optional[Set[Node]] = None
+
+        # cached compiled version of the network (key, CompiledNetwork)
+        self._compiled: Optional[Tuple[tuple, CompiledNetwork]] = None
+
+        # weighted degrees registered per weight attribute
+        self._accumulators: Dict[Weight, DegreeAccumulator] = {}
+
+        # callbacks which are notified about changes {event: [callbacks]}
+        self._observers: Dict[str, list] = {}
+
+        # read-only views of the node properties
+        self._views: Dict[str, PropertyView] = {
+            key: PropertyView(self, key) for key in (
+                'successors', 'predecessors', 'outgoing', 'incoming',
+                'neighbors', 'incident_edges')}
+
     def __str__(self) -> str:
         """Print the summary of the network.
 
@@ -246,85 +461,214 @@ class Network(BaseNetwork):
         return super().uid
 
     def __add__(self, other: Network) -> Network:
-        """Add a network to a network."""
-        network = Network(directed=self.directed,
-                          multiedges=self.multiedges,
-                          **self.attributes)
-
-        # TODO: add warnings if two networks have different properties
-        # TODO: update also netork properties
-
-        # add nodes and edges of self to the new network
-        network.add_nodes(*self.nodes.values())
-        network.add_edges(*self.edges.values())
-
-        # add nodes and edges of the other to the new network
-        # iterate over all other nodes
-        for node in other.nodes.values():
-            # check if the node object already exists
-            if node not in network.nodes.values():
-                # add node to the network
-                network.add_node(node)
-
-        # iterate over all other edges
-        for edge in other.edges.values():
-            # check if the edge object already exists
-            if edge not in network.edges.values():
-                # add node to the network
-                network.add_edge(edge)
-
-        # return the new network
+        """Return the union of two networks.
+
+        The nodes are matched via their uids and the edges via their uids or,
+        if the network has no multi-edges, via their nodes. The counts of
+        matched nodes and edges are added.
+        """
+        network = self._new()
+        network._merge(self.nodes.values(), self.edges.values(),
+                       self.nodes.counter, self.edges.counter)
+        network._merge(other.nodes.values(), other.edges.values(),
+                       other.nodes.counter, other.edges.counter)
         return network
 
     def __sub__(self, other: Network) -> Network:
-        """Remove a network from a network."""
-
-        network = Network(directed=self.directed,
-                          multiedges=self.multiedges,
-                          **self.attributes)
+        """Return the nodes and edges which are not in the other network.
 
-        # add nodes and edges of self to a new network
-        network.add_nodes(*self.nodes.values())
-        network.add_edges(*self.edges.values())
+        Edges which are incident to a removed node are removed as well. The
+        remaining nodes and edges keep their counts.
+        """
+        nodes, edges = self._match(other)
+        network = self._new()
+        network._merge(
+            [node for node in self.nodes.values() if node.uid not in nodes],
+            [edge for edge in self.edges.values() if edge.uid not in edges
+             and edge.v.uid not in nodes and edge.w.uid not in nodes],
+            self.nodes.counter, self.edges.counter)
+        return network
 
-        # remove nodes and edges of the other network
-        network.remove_edges(*other.edges.values())
-        network.remove_nodes(*other.nodes.values())
+    def __and__(self, other: Network) -> Network:
+        """Return the nodes and edges which are in both networks.
 
-        # return the new network
+        The intersection keeps the objects of this network with the minimal
+        counts of both networks.
+        """
+        nodes, edges = self._match(other)
+        network = self._new()
+        network._merge(
+            [self.nodes[uid] for uid in nodes],
+            [self.edges[uid] for uid in edges],
+            _min_counts(self.nodes.counter, other.nodes.counter,
+                        {uid: uid for uid in nodes}),
+            _min_counts(self.edges.counter, other.edges.counter, edges))
         return network
 
     def __iadd__(self, other: Network) -> Network:
         """Add a network to it self."""
-
-        # TODO: add warnings if two networks have different properties
-        # TODO: update also netork properties
-
-        # add nodes and edges of the other to the network
-        # iterate over all other nodes
-        for node in other.nodes.values():
-            # check if the node object already exists
-            if node not in self.nodes.values():
-                # add node to the network
-                self.add_node(node)
-
-        # iterate over all other edges
-        for edge in other.edges.values():
-            # check if the edge object already exists
-            if edge not in self.edges.values():
-                # add node to the network
-                self.add_edge(edge)
-
+        self._merge(other.nodes.values(), other.edges.values(),
+                    other.nodes.counter, other.edges.counter)
         return self
 
     def __isub__(self, other: Network) -> Network:
         """Remove a network."""
+        nodes, edges = self._match(other)
+        self.remove_edges(*edges)
+        self.remove_nodes(*nodes)
+        return self
 
-        # remove nodes and edges of the other network
-        self.remove_edges(*other.edges.values())
-        self.remove_nodes(*other.nodes.values())
+    def _match(self, other: Network) -> Tuple[set, dict]:
+        """Helper function to match the nodes and edges of an other network.
 
-        return self
+        Returns the uids of the nodes which are also in the other network and
+        a dict which maps the uids of the matched edges to the uids of the
+        edges in the other network.
+        """
+        nodes = {uid for uid in self.nodes.keys() if uid in other.nodes.keys()}
+
+        edges: dict = {}
+        store, relations = other.edges._store, other.edges._relations
+        for uid, edge in self.edges.items():
+            if uid in store:
+                edges[uid] = uid
+            elif not self.multiedges:
+                found = relations.get(other.edges._key(edge.relations), ())
+                if found:
+                    edges[uid] = next(iter(found))
+        return nodes, edges
+
+    def _merge(self, nodes: Iterable[Node], edges: Iterable[Edge],
+               node_counts: Counter, edge_counts: Counter) -> None:
+        """Helper function to merge nodes and edges with their counts.
+
+        The nodes and edges are joined with the stored objects in one batch
+        each and the network properties are updated once.
+        """
+        self.nodes._merge(nodes, node_counts)
+        self._add_node_properties()
+        self.edges._merge(edges, edge_counts)
+        self._add_edge_properties()
+
+    def __copy__(self) -> Network:
+        """Return a shallow copy of the network (see snapshot)."""
+        self._rebuild()
+        other = self.__class__.__new__(self.__class__)
+        other.__dict__.update(self.__dict__)
+        for slot in PathPyObject.__slots__:
+            setattr(other, slot, getattr(self, slot))
+        other._logs = None
+        return other
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        """Return the compact pickle representation of the network.
+
+        Instead of the object graph of the nodes, edges and network
+        properties, only the uids, the integer indices of the edges, the
+        counts and the attribute columns are pickled. The nodes and edges
+        are rebuilt in one pass when the unpickled network is accessed the
+        first time. Networks with other node or edge classes are pickled as
+        usual. Networks whose stores are not built yet are pickled with their
+        stored columns, i.e. without creating the objects.
+        """
+        packed = self.__dict__.get('_packed', None)
+        if packed is None and not self._compact():
+            return super().__reduce_ex__(protocol)
+
+        # empty network with the same configuration and attributes
+        template = self._new(uid=self.uid)
+        template._has_python_uid = self._has_python_uid
+
+        if packed is not None:
+            return (_defer, (template, packed[0], packed[1]))
+
+        return (_unpickle, (template, self._pack()))
+
+    # hidden from type checkers, which would accept any attribute otherwise
+    if not TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any:
+            """Build the stores of a network if they are accessed."""
+            if '_packed' not in self.__dict__ or name not in _PACKED:
+                raise AttributeError(name)
+            self._rebuild()
+            return getattr(self, name)
+
+    def _rebuild(self) -> None:
+        """Helper function to build the stores of the network.
+
+        The stores of unpickled networks and networks created from arrays
+        are filled with the given unpack method on the first access. Until
+        then, the compiled network, the number of nodes and edges and the
+        degrees are derived from the stored columns.
+        """
+        packed = self.__dict__.pop('_packed', None)
+        if packed is not None:
+            unpack, data, stores = packed
+            self.__dict__.update(stores)
+            getattr(self, unpack)(data)
+
+            # the network compiled from the columns is kept, its pending
+            # edge uids are resolved before the network is changed
+            if self._compiled is not None and self._compiled[0] is None:
+                compiled = self._compiled[1]
+                _ = compiled.edge_uids
+                self._compiled = (self._compile_key(), compiled)
+
+    def _compact(self) -> bool:
+        """Helper function to check if the compact pickling can be used."""
+        node_class, edge_class = self._compact_classes
+        return (self.number_of_nodes() > 0 and
+                all(type(n) is node_class for n in self.nodes.values()) and
+                all(type(e) is edge_class for e in self.edges.values()))
+
+    def _pack(self) -> dict:
+        """Helper function to return the compact state of the network."""
+        index = self.nodes.index
+        edges = self.edges._values_by_index()
+        return {
+            'nodes': _pack_objects(self.nodes),
+            'edges': _pack_objects(self.edges),
+            'v': _pack_values([index[e.v.uid] for e in edges]),
+            'w': _pack_values([index[e.w.uid] for e in edges]),
+        }
+
+    def _unpack(self, data: dict) -> None:
+        """Helper function to rebuild the network from its compact state."""
+        nodes, edges = self._unpack_objects(data)
+
+        # the packed objects are unique, hence the stores are filled directly
+        self.nodes._restore(nodes, _unpack_values(data['nodes']['counts']))
+        self.edges._restore(edges, _unpack_values(data['edges']['counts']))
+
+        # update the network properties in one pass
+        self._add_edge_properties()
+
+    def _columns(self, data: dict) -> dict:
+        """Helper function to return the columns of the compact state."""
+        edges = data['edges']
+        weight = edges['attributes'].get('weight', None)
+        size = edges['hex'][0]
+        return {
+            'uids': _unpack_uids(data['nodes']),
+            'edge_uids': _unpack_uids(edges),
+            'v': np.asarray(data['v'], dtype=np.int64),
+            'w': np.asarray(data['w'], dtype=np.int64),
+            'weight': (np.ones(size) if weight is None else
+                       _to_weights(_unpack_column(weight, size), 1.0)),
+            'count': np.asarray(edges['counts'], dtype=float),
+        }
+
+    def _unpack_objects(self, data: dict) -> Tuple[list, list]:
+        """Helper function to create the node and edge objects."""
+        node_class, edge_class = self._compact_classes
+        v, w = _unpack_values(data['v']), _unpack_values(data['w'])
+
+        nodes = _unpack_objects(
+            data['nodes'], lambda i, uid: node_class(uid=uid))
+        edges = _unpack_objects(
+            data['edges'], lambda i, uid: edge_class(
+                nodes[v[i]], nodes[w[i]], uid=uid, directed=self.directed))
+        return nodes, edges
 
     @property
     def shape(self) -> Tuple[int, int]:
@@ -432,15 +776,16 @@ class Network(BaseNetwork):
         return self._edges
 
     @property
-    def successors(self) -> Dict[str, Set[Node]]:
-        """Returns a dict of set of all successor nodes for a given node.
+    def successors(self) -> Mapping[str, Set[Node]]:
+        """Returns a view of the sets of all successor nodes of each node.
 
         Returns
         -------
 
-        Dict[str, Set[Node]]
+        Mapping[str, Set[Node]]
 
-            Return the Node objects of all successor nodes.
+            Return a read-only view with the Node objects of all successor
+            nodes.
 
         Examples
         --------
@@ -457,18 +802,19 @@ class Network(BaseNetwork):
 
         """
 
-        return {n.uid: self._properties['successors'][n] for n in self.nodes}
+        return self._views['successors']
 
     @property
-    def predecessors(self) -> Dict[str, Set[Node]]:
-        """Returns a dict of sets of all predecessor nodes for a given node.
+    def predecessors(self) -> Mapping[str, Set[Node]]:
+        """Returns a view of the sets of all predecessor nodes of each node.
 
         Returns
         -------
 
-        Dict[str, Set[Node]]
+        Mapping[str, Set[Node]]
 
-            Return the Node objects of all predecessor nodes.
+            Return a read-only view with the Node objects of all predecessor
+            nodes.
 
         Examples
         --------
@@ -484,63 +830,459 @@ class Network(BaseNetwork):
         {'v':{}, 'w': {Node v}}
 
         """
-        return {n.uid: self._properties['predecessors'][n] for n in self.nodes}
+        return self._views['predecessors']
 
     @property
-    def outgoing(self) -> Dict[str, Set[Edge]]:
-        """Retuns a dict with sets of outgoing edges."""
-        return {n.uid: self._properties['outgoing'][n] for n in self.nodes}
+    def outgoing(self) -> Mapping[str, Set[Edge]]:
+        """Retuns a view with sets of outgoing edges."""
+        return self._views['outgoing']
 
     @property
-    def incoming(self) -> Dict[str, Set[Edge]]:
-        """Retuns a dict with sets of incoming edges."""
-        return {n.uid: self._properties['incoming'][n] for n in self.nodes}
+    def incoming(self) -> Mapping[str, Set[Edge]]:
+        """Retuns a view with sets of incoming edges."""
+        return self._views['incoming']
 
     @property
-    def neighbors(self) -> Dict[str, Set[Node]]:
-        """Retuns a dict with sets of adjacent nodes."""
-        return {n.uid: self._properties['neighbors'][n] for n in self.nodes}
+    def neighbors(self) -> Mapping[str, Set[Node]]:
+        """Retuns a view with sets of adjacent nodes."""
+        return self._views['neighbors']
 
     @property
-    def incident_edges(self) -> Dict[str, Set[Edge]]:
-        """Retuns a dict with sets of adjacent edges."""
-        return {n.uid: self._properties['incident_edges'][n] for n in self.nodes}
-
-    def _degrees(self, _dict: defaultdict,
-                 weight: Weight = None) -> Dict[str, float]:
-        """Helper function to calculate the degrees."""
-        _degrees: dict = {}
-        if weight is None:
-            _degrees = {node.uid: _dict[node] for node in self.nodes}
+    def incident_edges(self) -> Mapping[str, Set[Edge]]:
+        """Retuns a view with sets of adjacent edges."""
+        return self._views['incident_edges']
+
+    @property
+    def csr(self) -> CompiledNetwork:
+        """Return the compiled (CSR) snapshot of the network.
+
+        See Also
+        --------
+        compile
+
+        """
+        return self.compile()
+
+    def compile(self) -> CompiledNetwork:
+        """Return an integer-indexed snapshot of the network.
+
+        The snapshot stores the nodes, edges, out- and in-neighbours as well as
+        the edge weights and counts in NumPy arrays (see
+        :py:class:`CompiledNetwork`). The snapshot is cached and only
+        recompiled if nodes, edges, edge counts or edge weights have changed
+        since the last call.
+
+        Returns
+        -------
+        CompiledNetwork
+
+            Immutable array based snapshot of the network.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> net = pp.Network()
+        >>> net.add_edges(('a', 'b'), ('b', 'c'))
+        >>> net.compile().indptr
+        array([0, 1, 2, 2])
+
+        """
+        # networks whose stores are not built yet are compiled from their
+        # columns (see _rebuild)
+        packed = self.__dict__.get('_packed', None)
+        if packed is not None and packed[0] in _COLUMNS:
+            if self._compiled is None:
+                unpack, data, _ = packed
+                self._compiled = (None, CompiledNetwork.from_arrays(
+                    directed=self.directed,
+                    **getattr(self, _COLUMNS[unpack])(data)))
+            return self._compiled[1]
+
+        key = self._compile_key()
+
+        if self._compiled is None or self._compiled[0] != key:
+            self._compiled = (key, CompiledNetwork(self))
+
+        return self._compiled[1]
+
+    def _compile_key(self) -> tuple:
+        """Helper function to return the cache key of the compiled network."""
+        return (id(self.nodes), self.nodes._version,
+                id(self.edges), self.edges._version,
+                self.edges._counter._version,
+                self.edges._attribute_version('weight'))
+
+    def memory_usage(self, deep: bool = True) -> Dict[str, int]:
+        """Return the memory usage of the network in bytes.
+
+        The breakdown contains the node and edge objects, the attribute
+        dicts, the interval trees of temporal objects (``'events'``), the
+        counters, the indexes of the node and edge collections, the network
+        properties (e.g. successors and degrees), the cached structures
+        (compiled network, attribute columns and weighted degrees) and the
+        remaining members of the network (``'other'``). Objects which are
+        referenced by several components are only counted once.
+
+        .. note::
+
+            The cached structures are rebuilt on demand, i.e. the
+            ``'cache'`` entry is the memory which can be released by clearing
+            the caches.
+
+        Parameters
+        ----------
+        deep : bool, optional (default = True)
+
+            If ``False`` strings and numbers (e.g. uids and attribute values)
+            are not counted.
+
+        Returns
+        -------
+        Dict[str, int]
+
+            Number of bytes per component.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> net = pp.Network()
+        >>> net.add_edges(('a', 'b'), ('b', 'c'))
+        >>> usage = net.memory_usage()
+        >>> list(usage)
+        ['nodes', 'edges', 'attributes', 'events', 'counters', 'index',
+         'properties', 'cache', 'other']
+
+        The compiled network is counted as cache.
+
+        >>> csr = net.compile()
+        >>> net.memory_usage()['cache'] > usage['cache']
+        True
+
+        """
+        seen = {id(self)}
+        usage = self._memory_usage(seen, deep)
+        seen.discard(id(self))
+        usage['other'] = sizeof(self, seen=seen, deep=deep)
+        return usage
+
+    def _memory_usage(self, seen: set, deep: bool) -> Dict[str, int]:
+        """Helper function to measure the components of the network."""
+        nodes = self.nodes._memory_usage(seen, deep)
+        edges = self.edges._memory_usage(seen, deep)
+        return {
+            'nodes': nodes['objects'],
+            'edges': edges['objects'],
+            'attributes': nodes['attributes'] + edges['attributes'] + sizeof(
+                self._attributes, seen=seen, deep=deep),
+            'events': nodes['events'] + edges['events'],
+            'counters': nodes['counter'] + edges['counter'],
+            'index': nodes['index'] + edges['index'],
+            'properties': sizeof(self._properties, seen=seen, deep=deep),
+            'cache': nodes['cache'] + edges['cache'] + sizeof(
+                self._compiled, self._accumulators, seen=seen, deep=deep),
+        }
+
+    def snapshot(self) -> Network:
+        """Return a read-only snapshot of the network.
+
+        In contrast to :py:meth:`copy`, the snapshot shares the node and edge
+        stores as well as the network properties with the original network,
+        i.e. taking a snapshot is cheap. The shared stores are cloned before
+        the network is changed the next time, hence the snapshot keeps the
+        nodes and edges at the time it was taken (e.g. the time-slice
+        networks of a :py:class:`RollingTimeWindow`). Changes of the
+        snapshot raise a TypeError.
+
+        .. note::
+
+            The snapshot is a view of the node and edge objects, i.e. their
+            attributes are shared with the network and attribute changes
+            such as ``net.edges['a', 'b']['weight'] = 2`` are seen by the
+            snapshot. The attributes of the network itself are copied. Use
+            :py:meth:`fork` to get a network which can be changed and
+            :py:meth:`copy` to get independent objects. Likewise, the events
+            of temporal nodes and edges are shared, i.e. new events of
+            existing objects are seen by the snapshot.
+
+        Returns
+        -------
+        Network
+
+            Returns a snapshot of the network.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> net = pp.Network()
+        >>> net.add_edges(('a', 'b'), ('b', 'c'))
+        >>> snap = net.snapshot()
+        >>> net.remove_edge('a', 'b')
+        >>> snap.shape, net.shape
+        ((3, 2), (3, 1))
+
+        """
+        return self._share(read_only=True)
+
+    def fork(self) -> Network:
+        """Return a copy-on-write copy of the network which can be changed.
+
+        Like a :py:meth:`snapshot`, the fork shares the node and edge stores
+        with the network. The stores are cloned before the network or the
+        fork is changed the next time. Hence, nodes and edges can be added
+        to or removed from the fork (e.g. to evaluate the removal of edges)
+        without changing the network and vice versa.
+
+        The fork stores shallow clones of the node and edge objects, which
+        share the attribute dicts with the original objects until either
+        of them is changed. Hence, attribute changes such as
+        ``fork.edges['a', 'b']['weight'] = 2`` are not seen by the network
+        and vice versa, but forking has to create a clone per object.
+
+        Returns
+        -------
+        Network
+
+            Returns a fork of the network.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> net = pp.Network()
+        >>> net.add_edges(('a', 'b'), ('b', 'c'))
+        >>> fork = net.fork()
+        >>> fork.remove_edge('a', 'b')
+        >>> fork.shape, net.shape
+        ((3, 1), (3, 2))
+        >>> fork.edges['b', 'c']['weight'] = 2
+        >>> net.edges['b', 'c']['weight'] is None
+        True
+
+        """
+        objects: dict = {}
+        for node in self.nodes._store.values():
+            objects[node] = node._clone(objects)
+        for edge in self.edges._store.values():
+            objects[edge] = edge._clone(objects)
+        return self._share(read_only=False, objects=objects)
+
+    def _share(self, read_only: bool,
+               objects: Optional[dict] = None) -> Network:
+        """Helper function to create a network sharing the stores.
+
+        The stored objects are replaced by the given clones {object: clone}.
+        """
+        other = copy(self)
+        other._attributes = dict(self.attributes)
+        if objects is None:
+            other._nodes = self._nodes._snapshot(read_only)
+            other._edges = self._edges._snapshot(read_only)
         else:
-            for node in self.nodes:
-                _degrees[node.uid] = sum([self.edges[e].weight(weight)
-                                          for e in _dict[node]])
-        return _degrees
+            other._nodes = self._nodes._fork(objects)
+            other._edges = self._edges._fork(objects)
+        other._views = {key: PropertyView(other, key) for key in self._views}
 
-    def indegrees(self, weight: Weight = None) -> Dict[str, float]:
-        """Retuns a dict with indegrees of the nodes."""
-        if weight is None:
-            _d = self._degrees(self._properties['indegrees'], weight)
+        # the weighted degrees are registered again if needed
+        other._accumulators = {}
+
+        # the observers follow the original network only
+        other._observers = {}
+
+        # the properties are cloned before the first change
+        if objects is None:
+            self._shared_properties = other._shared_properties = True
         else:
-            _d = self._degrees(self._properties['incoming'], weight)
-        return _d
+            other._properties = _clone_properties(self._properties, objects)
+            other._shared_properties, other._owned = False, None
+
+        # the compiled network is immutable and can be shared
+        if self._compiled is not None and \
+           self._compiled[0] == self._compile_key():
+            other._compiled = (other._compile_key(), self._compiled[1])
+
+        return other
+
+    def subgraph(self, nodes: Iterable[Union[str, Node]]) -> NetworkView:
+        """Return the subgraph induced by the given nodes as a view.
+
+        The view contains the given nodes and all edges between them. It
+        does not copy the network, use :py:meth:`NetworkView.materialize` to
+        create a new network from the view.
+
+        Parameters
+        ----------
+        nodes : Iterable[Union[str, Node]]
+
+            Nodes (or node uids) of the subgraph.
+
+        Returns
+        -------
+        NetworkView
+
+            Returns a filtered view of the network.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> net = pp.Network()
+        >>> net.add_edges(('a', 'b'), ('b', 'c'), ('c', 'd'))
+        >>> net.subgraph(['a', 'b', 'c']).shape
+        (3, 2)
+
+        """
+        return NetworkView(self, nodes=(
+            n.uid if isinstance(n, Node) else n for n in nodes))
+
+    def edge_subgraph(self, edges: Iterable[Union[str, Edge]]) -> NetworkView:
+        """Return the subgraph of the given edges as a view.
+
+        The view contains the given edges and the nodes attached to them.
+
+        Parameters
+        ----------
+        edges : Iterable[Union[str, Edge]]
+
+            Edges (or edge uids) of the subgraph.
+
+        Returns
+        -------
+        NetworkView
+
+            Returns a filtered view of the network.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> net = pp.Network()
+        >>> net.add_edges(('a', 'b'), ('b', 'c'), ('c', 'd'))
+        >>> net.edge_subgraph([net.edges['a', 'b']]).shape
+        (2, 1)
+
+        """
+        return NetworkView(self, edges=(
+            e.uid if isinstance(e, Edge) else e for e in edges))
+
+    def _new(self, uid: Optional[str] = None) -> Network:
+        """Helper function to create an empty network of the same kind."""
+        return self.__class__(uid=uid, directed=self.directed,
+                              multiedges=self.multiedges, **self.attributes)
+
+    def _unshare_properties(self, *nodes: Node) -> None:
+        """Helper function to clone the properties shared with a snapshot.
+
+        The containers are copied shallowly, the property sets of the given
+        nodes are cloned before they are changed.
+        """
+        if self._shared_properties:
+            self._properties = defaultdict(None, {
+                key: copy(value) for key, value in self._properties.items()})
+            self._owned = set()
+            self._shared_properties = False
+
+        if self._owned is None:
+            return
+
+        for node in nodes:
+            if node in self._owned:
+                continue
+            for value in self._properties.values():
+                if isinstance(value, dict) and isinstance(
+                        value.get(node, None), set):
+                    value[node] = set(value[node])
+            self._owned.add(node)
+
+    def _degrees(self, mode: str, weight: Weight = None) -> Dict[str, float]:
+        """Helper function to return the (weighted) degrees of a mode."""
+        if weight is None and '_packed' in self.__dict__:
+            return _compiled_degrees(self.compile(), mode)
+
+        if weight is None:
+            _dict = self._properties[mode]
+            return {node.uid: _dict[node]
+                    for node in self.nodes._values_by_index()}
+
+        _dict = getattr(self._accumulator(weight), mode)
+        return {uid: _dict.get(uid, 0.0) for uid in self.nodes.inverse_index}
+
+    def subscribe(self, event: str, callback: Observer) -> None:
+        """Register a callback which is notified about changes.
+
+        The callback is called with the network and the added or removed
+        object, after the network properties were updated. Hence, derived
+        structures (e.g. components or degree statistics) can be updated
+        incrementally instead of being recomputed.
+
+        .. note::
+
+            Edges are notified before the nodes added (or removed) together
+            with them.
+
+        Parameters
+        ----------
+        event : str
+
+            One of ``'add_node'``, ``'remove_node'``, ``'add_edge'`` or
+            ``'remove_edge'``.
+
+        callback : Callable[[Network, PathPyObject], None]
+
+            Function which is called for every added or removed object.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> net = pp.Network()
+        >>> added = []
+        >>> net.subscribe('add_edge', lambda network, edge: added.append(edge))
+        >>> net.add_edges(('a', 'b'), ('b', 'c'))
+        >>> len(added)
+        2
+
+        """
+        if event not in EVENTS:
+            LOG.error('The event "%s" is not supported!', event)
+            raise AttributeError
+
+        # the objects of a network created on access are not notified
+        self._rebuild()
+        self._observers.setdefault(event, []).append(callback)
+
+    def unsubscribe(self, event: str, callback: Observer) -> None:
+        """Remove a callback registered via :py:meth:`subscribe`."""
+        callbacks = self._observers.get(event, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def _notify(self, event: str, obj: PathPyObject) -> None:
+        """Helper function to call the observers of an event."""
+        for callback in self._observers.get(event, ()):
+            callback(self, obj)
+
+    def _accumulator(self, weight: Weight) -> DegreeAccumulator:
+        """Helper function to return the registered weighted degrees."""
+        weight = 'weight' if weight is True else weight
+        if weight not in self._accumulators:
+            self._accumulators[weight] = DegreeAccumulator(self, weight)
+
+        accumulator = self._accumulators[weight]
+        accumulator.update()
+        return accumulator
+
+    def indegrees(self, weight: Weight = None) -> Dict[str, float]:
+        """Retuns a dict with indegrees of the nodes.
+
+        The weighted indegrees are registered per weight attribute and
+        updated incrementally, i.e. only the first call is linear in the
+        number of edges.
+        """
+        return self._degrees('indegrees', weight)
 
     def outdegrees(self, weight: Weight = None) -> Dict[str, float]:
         """Retuns a dict with outdegrees of the nodes."""
-        if weight is None:
-            _d = self._degrees(self._properties['outdegrees'], weight)
-        else:
-            _d = self._degrees(self._properties['outgoing'], weight)
-        return _d
+        return self._degrees('outdegrees', weight)
 
     def degrees(self, weight: Weight = None) -> Dict[str, float]:
         """Retuns a dict with degrees of the nodes."""
-        if weight is None:
-            _d = self._degrees(self._properties['degrees'], weight)
-        else:
-            _d = self._degrees(self._properties['incident_edges'], weight)
-        return _d
+        return self._degrees('degrees', weight)
 
     def summary(self) -> str:
         """Returns a summary of the network.
@@ -610,6 +1352,8 @@ class Network(BaseNetwork):
         5
 
         """
+        if '_packed' in self.__dict__:
+            return self.compile().shape[0]
         # if unique:
         return len(self.nodes)
 
@@ -647,6 +1391,8 @@ class Network(BaseNetwork):
         4
 
         """
+        if '_packed' in self.__dict__:
+            return self.compile().shape[1]
         # if unique:
         return len(self.edges)
 
@@ -765,6 +1511,13 @@ class Network(BaseNetwork):
             Edges from a list of :py:class:`Edge` objects are added to the
             network.
 
+        validate : str, optional (default = 'eager')
+
+            If ``'deferred'`` the edges are added in bulk, i.e. the per-edge
+            checks are skipped and duplicated edges and multi-edge rules are
+            validated once for all edges (see
+            :py:meth:`PathPyCollection.extend`).
+
         kwargs : Any, optional(default={})
 
             Attributes assigned to all edges in the list as ``key=value``
@@ -782,10 +1535,16 @@ class Network(BaseNetwork):
         >>> net.number_of_edges()
         2
 
+        Add many edges in bulk.
+
+        >>> net.add_edges(*[(str(i), str(i+1)) for i in range(1000)],
+        ...               validate='deferred')
+
         """
 
         uid: Optional[str] = kwargs.pop('uid', None)
         nodes: bool = kwargs.pop('nodes', True)
+        validate: str = kwargs.pop('validate', 'eager')
 
         if all(isinstance(arg, (str, Node)) for arg in edges) and nodes:
             edges = tuple(cast(Union[str, Node], edge)
@@ -797,9 +1556,16 @@ class Network(BaseNetwork):
         if not edges:
             LOG.warning('No edge was added!')
 
-        for edge in edges:
-            self.add_edge(edge, uid=uid, nodes=nodes,
-                          update_properties=False, **kwargs)
+        if validate == 'deferred':
+            edge_class = self.edges._default_class
+            self.edges.extend(
+                (edge if isinstance(edge, Edge) else
+                 edge_class(*edge, uid=uid, directed=self.directed)
+                 for edge in edges), validate=validate, **kwargs)
+        else:
+            for edge in edges:
+                self.add_edge(edge, uid=uid, update_properties=False,
+                              **kwargs)
 
         self._add_edge_properties()
 
@@ -835,11 +1601,7 @@ class Network(BaseNetwork):
         (3, 1, 0)
 
         """
-        if node in self.nodes:
-            for _edge in list(self.incident_edges[self.nodes[node].uid]):
-                self.remove_edge(_edge)
-        self.nodes.remove(node)
-        self._remove_node_properties()
+        self.remove_nodes(node)
 
     def remove_edge(self, *edge: Union[str, tuple, Node, Edge],
                     uid: Optional[str] = None) -> None:
@@ -881,27 +1643,120 @@ class Network(BaseNetwork):
         self._remove_edge_properties()
 
     def remove_edges(self, *edges: Union[str, tuple, list, Node, Edge]) -> None:
-        """Remove multiple edges from the network."""
-        self.edges.remove(*edges)
+        """Remove multiple edges from the network.
+
+        The edges can be given as edge objects, uids or pairs of nodes. As
+        for :py:meth:`remove_edge`, two nodes (or node uids) are the pair of
+        nodes of a single edge. All edges are removed in one sweep and the
+        network properties are updated once.
+
+        Examples
+        --------
+        >>> from pathpy import Network
+        >>> net = Network()
+        >>> net.add_edges(('a', 'b'), ('b', 'c'), ('c', 'd'))
+        >>> net.remove_edges(('a', 'b'), ('c', 'd'))
+        >>> net.number_of_edges()
+        1
+        >>> net.remove_edges('b', 'c')
+        >>> net.number_of_edges()
+        0
+
+        """
+        # two nodes are given instead of multiple edges
+        if len(edges) == 2 and all(isinstance(e, (str, Node)) for e in edges) \
+                and not all(e in self.edges for e in edges):
+            edges = (tuple(edges),)
+
+        objs: dict = {}
+        for edge in edges:
+            found = self._find_edges(edge)
+            if not found:
+                LOG.warning('No edge "%s" was removed!', edge)
+            for obj in found:
+                objs[obj.uid] = obj
+
+        self.edges._remove_many(objs.values())
         self._remove_edge_properties()
 
     def remove_nodes(self, *nodes: Union[str, Node]) -> None:
-        """Remove multiple nodes from the network."""
+        """Remove multiple nodes from the network.
+
+        The nodes and all their incident edges are removed in one sweep and
+        the network properties are updated once.
+
+        Examples
+        --------
+        >>> from pathpy import Network
+        >>> net = Network()
+        >>> net.add_edges(('a', 'b'), ('b', 'c'), ('c', 'd'))
+        >>> net.remove_nodes('b', 'c')
+        >>> net.shape
+        (2, 0)
+
+        """
+        objs: dict = {}
         for node in nodes:
-            self.remove_node(node)
+            if node in self.nodes:
+                obj = self.nodes[node]
+                objs[obj.uid] = obj
+
+        edges: dict = {}
+        for uid in objs:
+            for edge in self.incident_edges[uid]:
+                edges[edge.uid] = edge
+
+        # the edges are removed first since their hooks need the nodes
+        self.edges._remove_many(edges.values())
+        self._remove_edge_properties()
+
+        self.nodes._remove_many(objs.values())
+        self._remove_node_properties()
+
+    def _find_edges(self, edge: Union[str, tuple, list, Node, Edge]) -> list:
+        """Helper function to return the stored edges of an edge argument."""
+        if isinstance(edge, Edge):
+            return [edge] if edge in self.edges else []
+
+        if isinstance(edge, (tuple, list)) and len(edge) == 2:
+            if tuple(edge) not in self.edges:
+                return []
+            found = self.edges[tuple(edge)]
+            return list(found) if self.multiedges else [found]
+
+        if isinstance(edge, str):
+            return [self.edges[edge]] if edge in self.edges.keys() else []
+
+        LOG.error('The provided edge "%s" is of the wrong format!', edge)
+        raise AttributeError
 
     def _add_node_properties(self):
         """Helper function to update node properties."""
+        # the network has no node properties, only notify the observers
+        for node in self.nodes._pop_changes(added=True):
+            self._notify('add_node', node)
 
     def _remove_node_properties(self):
         """Helper function to update node properties."""
+        for node in self.nodes._pop_changes(added=False):
+            self._drop_node_properties(node)
+            self._notify('remove_node', node)
+
+    def _drop_node_properties(self, node: Node) -> None:
+        """Helper function to delete the properties of a removed node."""
+        self._unshare_properties()
+        for value in self._properties.values():
+            if isinstance(value, dict):
+                value.pop(node, None)
 
     def _add_edge_properties(self, *args):
         """Helper function to update network properties."""
 
-        edges = set(self.edges.values()).difference(self._properties['edges'])
+        # the containers are cloned once if shared with a snapshot
+        self._unshare_properties()
+        properties = self._properties
 
-        for edge in edges:
+        for edge in self.edges._pop_changes(added=True):
 
             # update nodes in the network
             for uid, node in edge.nodes.items():
@@ -909,70 +1764,83 @@ class Network(BaseNetwork):
                     self.nodes.add(node)
 
             # get node objects
-            node_v, node_w = self.nodes[edge.v.uid], self.nodes[edge.w.uid]
-            uid = edge.uid
+            store = self.nodes._store
+            node_v, node_w = store[edge.v.uid], store[edge.w.uid]
+            self._unshare_properties(node_v, node_w)
 
             _nodes: list = [(node_v, node_w), (node_w, node_v)]
 
             for _v, _w in _nodes:
-                self._properties['successors'][_v].add(_w)
-                self._properties['outgoing'][_v].add(edge)
-                self._properties['predecessors'][_w].add(_v)
-                self._properties['incoming'][_w].add(edge)
+                properties['successors'][_v].add(_w)
+                properties['outgoing'][_v].add(edge)
+                properties['predecessors'][_w].add(_v)
+                properties['incoming'][_w].add(edge)
 
-                if self.directed:
+                if self._directed:
                     break
 
             for _v, _w in _nodes:
-                self._properties['neighbors'][_v].add(_w)
-                self._properties['incident_edges'][_v].add(edge)
+                properties['neighbors'][_v].add(_w)
+                properties['incident_edges'][_v].add(edge)
 
-                self._properties['indegrees'][_v] = len(
-                    self._properties['incoming'][_v])
-                self._properties['outdegrees'][_v] = len(
-                    self._properties['outgoing'][_v])
-                self._properties['degrees'][_v] = len(
-                    self._properties['incident_edges'][_v])
+                properties['indegrees'][_v] = len(properties['incoming'][_v])
+                properties['outdegrees'][_v] = len(properties['outgoing'][_v])
+                properties['degrees'][_v] = len(
+                    properties['incident_edges'][_v])
 
             # update nodes of the edge
             edge.objects[node_v.uid] = node_v
             edge.objects[node_w.uid] = node_w
 
-            self._properties['edges'].add(edge)
+            properties['edges'].add(edge)
+
+            for accumulator in self._accumulators.values():
+                accumulator.add(edge)
+
+            self._notify('add_edge', edge)
+
+        # update properties of nodes added via the edges
+        self._add_node_properties()
 
     def _remove_edge_properties(self, *args):
         """Helper function to update network properties."""
 
-        edges = self._properties['edges'].difference(set(self.edges.values()))
+        # the containers are cloned once if shared with a snapshot
+        self._unshare_properties()
+        properties = self._properties
 
-        for edge in edges:
+        for edge in self.edges._pop_changes(added=False):
             # get node objects
-            node_v, node_w = self.nodes[edge.v.uid], self.nodes[edge.w.uid]
-            uid = edge.uid
+            store = self.nodes._store
+            node_v, node_w = store[edge.v.uid], store[edge.w.uid]
+            self._unshare_properties(node_v, node_w)
 
             _nodes: list = [(node_v, node_w), (node_w, node_v)]
 
             for _v, _w in _nodes:
-                self._properties['successors'][_v].discard(_w)
-                self._properties['outgoing'][_v].discard(edge)
-                self._properties['predecessors'][_w].discard(_v)
-                self._properties['incoming'][_w].discard(edge)
+                properties['successors'][_v].discard(_w)
+                properties['outgoing'][_v].discard(edge)
+                properties['predecessors'][_w].discard(_v)
+                properties['incoming'][_w].discard(edge)
 
-                if self.directed:
+                if self._directed:
                     break
 
             for _v, _w in _nodes:
-                self._properties['neighbors'][_v].discard(_w)
-                self._properties['incident_edges'][_v].discard(edge)
+                properties['neighbors'][_v].discard(_w)
+                properties['incident_edges'][_v].discard(edge)
+
+                properties['indegrees'][_v] = len(properties['incoming'][_v])
+                properties['outdegrees'][_v] = len(properties['outgoing'][_v])
+                properties['degrees'][_v] = len(
+                    properties['incident_edges'][_v])
+
+            properties['edges'].discard(edge)
 
-                self._properties['indegrees'][_v] = len(
-                    self._properties['incoming'][_v])
-                self._properties['outdegrees'][_v] = len(
-                    self._properties['outgoing'][_v])
-                self._properties['degrees'][_v] = len(
-                    self._properties['incident_edges'][_v])
+            for accumulator in self._accumulators.values():
+                accumulator.remove(edge)
 
-            self._properties['edges'].discard(edge)
+            self._notify('remove_edge', edge)
 
 
     def to_multi_layer(network: Network, edge_attribute: str, retain_nodes=True) -> dict:
@@ -1013,6 +1881,235 @@ class Network(BaseNetwork):
         return network
 
 
+    @classmethod
+    def from_arrays(cls, v: Any, w: Any, weight: Any = None, count: Any = None,
+                    nodes: Any = None, edge_uids: Any = None,
+                    attributes: Optional[Dict[str, Any]] = None,
+                    **kwargs: Any) -> Network:
+        """Create a network from arrays of source and target nodes.
+
+        The edges are given as two arrays ``v`` and ``w`` of equal length,
+        containing either the node uids or integer codes referring to the
+        positions in ``nodes``. Node uids are factorized and duplicated edges
+        are merged in a vectorised way. The node and edge objects are created
+        lazily, i.e. the network only stores the merged columns and creates
+        the objects in a single pass when its nodes, edges or properties are
+        accessed the first time.
+
+        Parameters
+        ----------
+        v : array_like
+
+            Uids (or integer codes) of the source nodes.
+
+        w : array_like
+
+            Uids (or integer codes) of the target nodes.
+
+        weight : array_like, optional (default = None)
+
+            Weights of the edges, stored as edge attribute ``weight``.
+
+        count : array_like, optional (default = None)
+
+            Counts of the edges. Per default each row is counted once.
+
+        nodes : array_like, optional (default = None)
+
+            Node uids. If given, ``v`` and ``w`` are integer codes referring
+            to this array and all nodes are added to the network (also nodes
+            without edges). Otherwise ``v`` and ``w`` contain node uids.
+
+        edge_uids : array_like, optional (default = None)
+
+            Uids of the edges. Per default python uids are assigned.
+
+        attributes : Dict[str, array_like], optional (default = None)
+
+            Additional edge attributes given as columns.
+
+        kwargs : Any
+
+            Keyword arguments for the network, e.g. ``uid``, ``directed`` and
+            ``multiedges`` as well as network attributes.
+
+        Returns
+        -------
+        Network
+
+            Returns the network with the given edges.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import pathpy as pp
+        >>> net = pp.Network.from_arrays(np.array(['a', 'b', 'a']),
+        ...                              np.array(['b', 'c', 'b']),
+        ...                              weight=np.array([1., 2., 3.]))
+        >>> net.shape
+        (3, 2)
+        >>> net.edges['a', 'b']['weight']
+        3.0
+        >>> net.edges.counter[net.edges['a', 'b'].uid]
+        2
+
+        """
+        # pylint: disable=too-many-locals
+        uid: Optional[str] = kwargs.pop('uid', None)
+        directed: bool = kwargs.pop('directed', True)
+        multiedges: bool = kwargs.pop('multiedges', False)
+
+        network = cls(uid=uid, directed=directed,
+                      multiedges=multiedges, **kwargs)
+
+        _v, _w = np.asarray(v), np.asarray(w)
+        if _v.ndim != 1 or _v.shape != _w.shape:
+            LOG.error('The arrays v and w must be one-dimensional '
+                      'and of the same length!')
+            raise AttributeError
+
+        # map the node uids to integer codes in order of appearance
+        if nodes is None:
+            codes, nodes = pd.factorize(np.column_stack((_v, _w)).ravel())
+            _v, _w = codes[0::2], codes[1::2]
+        _v, _w = _v.astype(np.int64), _w.astype(np.int64)
+        nodes = (nodes.tolist() if isinstance(nodes, np.ndarray)
+                 else list(nodes))
+
+        # merge nodes with the same uid (uids are stored as strings as in
+        # add_edge), keeping the first node
+        node_class = network.nodes._default_class
+        node_uids = [n.uid if isinstance(n, node_class) else str(n)
+                     for n in nodes]
+        codes, _ = pd.factorize(np.array(node_uids, dtype=object))
+        if len(nodes) > 0 and codes.max() + 1 < len(nodes):
+            _, first = np.unique(codes, return_index=True)
+            nodes = [nodes[i] for i in first]
+            node_uids = [node_uids[i] for i in first]
+            _v, _w = codes[_v], codes[_w]
+
+        # edge attributes given as columns
+        columns: dict = dict(attributes) if attributes is not None else {}
+        if weight is not None:
+            columns['weight'] = weight
+        columns = {key: np.asarray(value) for key, value in columns.items()}
+
+        # counts of the rows
+        _count = (np.ones(len(_v), dtype=np.int64) if count is None
+                  else np.asarray(count))
+
+        # rows which define the edges and rows defining their attributes
+        rows = last = np.arange(len(_v))
+        if not multiedges and len(_v) > 0:
+            _a, _b = (_v, _w) if directed else (
+                np.minimum(_v, _w), np.maximum(_v, _w))
+            groups, _ = pd.factorize(_a * len(nodes) + _b)
+            _, rows = np.unique(groups, return_index=True)
+            _, last = np.unique(groups[::-1], return_index=True)
+            last = len(groups) - 1 - last
+            _count = np.bincount(groups, weights=_count).astype(
+                _count.dtype)
+
+        _uids = np.asarray(edge_uids)[rows] if edge_uids is not None else None
+        unique = _uids is None or pd.Index(_uids).is_unique
+        network = _defer(network, '_unpack_arrays', {
+            'nodes': nodes,
+            'node_uids': node_uids,
+            'v': _v[rows],
+            'w': _w[rows],
+            'uids': _uids,
+            'unique': unique,
+            'counts': _count,
+            'attributes': {key: value[last] for key, value in columns.items()},
+        })
+
+        # edges with the same uid are joined (or rejected) right away
+        if not unique:
+            network._rebuild()
+
+        return network
+
+    def _unpack_arrays(self, data: dict) -> None:
+        """Helper function to create the objects of a network from arrays.
+
+        The nodes and edges are created in a single pass. The merged columns
+        hold unique nodes and edges, hence the stores are filled directly
+        (see :py:meth:`PathPyCollection._restore`) like the stores of an
+        unpickled network. Only edges with duplicated uids are validated and
+        added in bulk (see :py:meth:`PathPyCollection.extend`). The network
+        properties are updated once.
+        """
+        node_class = self.nodes._default_class
+        edge_class = self.edges._default_class
+
+        # create the nodes (uids are stored as strings as in add_edge)
+        nodes = [n if isinstance(n, node_class) else node_class(uid)
+                 for n, uid in zip(data['nodes'], data['node_uids'])]
+        self.nodes._restore(nodes, [1] * len(nodes))
+
+        # create the edges
+        uids = (data['uids'].tolist() if data['uids'] is not None
+                else [None] * len(data['v']))
+        values = {key: value.tolist()
+                  for key, value in data['attributes'].items()}
+        edges = [edge_class(nodes[_i], nodes[_j], uid=uids[i],
+                            directed=self.directed,
+                            **{key: value[i] for key, value in values.items()})
+                 for i, (_i, _j) in enumerate(zip(data['v'].tolist(),
+                                                  data['w'].tolist()))]
+        if data['unique']:
+            self.edges._restore(edges, data['counts'].tolist())
+        else:
+            self._add_node_properties()
+            self.edges._merge(edges, Counter(dict(zip(
+                (edge.uid for edge in edges), data['counts'].tolist()))))
+
+        # update the network properties in one pass
+        self._add_edge_properties()
+
+    def _columns_arrays(self, data: dict) -> dict:
+        """Helper function to return the columns of a network from arrays.
+
+        Python uids are only assigned when the edges are created, i.e. they
+        are requested from the network if they are accessed.
+        """
+        weight = data['attributes'].get('weight', None)
+        return {
+            'uids': data['node_uids'],
+            'edge_uids': (data['uids'] if data['uids'] is not None
+                          else lambda: self.edges.inverse_index),
+            'v': data['v'],
+            'w': data['w'],
+            'weight': (np.ones(len(data['v'])) if weight is None
+                       else _to_weights(weight, 1.0)),
+            'count': data['counts'],
+        }
+
+    @classmethod
+    def from_edge_index(cls, edge_index: Any, **kwargs: Any) -> Network:
+        """Create a network from an edge index.
+
+        The edge index is an array of shape ``(2, m)`` with the source nodes
+        in the first and the target nodes in the second row. All other
+        arguments are passed to :py:meth:`from_arrays`.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import pathpy as pp
+        >>> net = pp.Network.from_edge_index(np.array([[0, 1], [1, 2]]),
+        ...                                  nodes=['a', 'b', 'c'])
+        >>> net.shape
+        (3, 2)
+
+        """
+        edge_index = np.asarray(edge_index)
+        if edge_index.ndim != 2 or edge_index.shape[0] != 2:
+            LOG.error('The edge index must be an array of shape (2, m)!')
+            raise AttributeError
+
+        return cls.from_arrays(edge_index[0], edge_index[1], **kwargs)
+
     @classmethod
     def from_paths(cls, path_collection: PathCollection, **kwargs: Any):
         uid: Optional[str] = kwargs.pop('uid', None)        
@@ -1026,6 +2123,186 @@ class Network(BaseNetwork):
         
         return network
 
+
+def _min_counts(counter: Counter, other: Counter, uids: dict) -> Counter:
+    """Helper function to return the minimal counts of matched objects."""
+    return Counter({uid: min(counter[uid], other[match])
+                    for uid, match in uids.items()})
+
+
+def _clone_properties(properties: defaultdict, objects: dict) -> defaultdict:
+    """Helper function to return the properties of the cloned objects."""
+    clone = objects.get
+
+    def _clone(value: Any) -> Any:
+        if isinstance(value, set):
+            return set(map(clone, value, value))
+        return value
+
+    cloned: defaultdict = defaultdict()
+    for key, value in properties.items():
+        if isinstance(value, dict):
+            cloned[key] = copy(value)
+            cloned[key].clear()
+            cloned[key].update(zip(map(clone, value, value),
+                                   map(_clone, value.values())))
+        else:
+            cloned[key] = _clone(value)
+    return cloned
+
+
+def _compiled_degrees(csr: CompiledNetwork, mode: str) -> Dict[str, float]:
+    """Helper function to return the degrees of a mode of a compiled network.
+
+    Self-loops are counted once, as they are incident to the node once.
+    """
+    if mode == 'indegrees':
+        degrees = csr.indegrees()
+    elif mode == 'outdegrees' or not csr.directed:
+        degrees = csr.outdegrees()
+    else:
+        loops = csr.v[csr.v == csr.w]
+        degrees = (csr.outdegrees() + csr.indegrees() -
+                   np.bincount(loops, minlength=len(csr.uids)))
+    return dict(zip(csr.uids.tolist(), degrees.tolist()))
+
+
+def _unpickle(network: Network, data: dict) -> Network:
+    """Helper function to return a network which is rebuilt on access."""
+    return _defer(network, '_unpack', data)
+
+
+def _defer(network: Network, unpack: str, data: dict) -> Network:
+    """Helper function to return a network whose stores are built on access.
+
+    The stores are removed from the network until they are accessed the first
+    time, then the network method ``unpack`` is called with the data.
+    """
+    stores = {name: network.__dict__.pop(name) for name in _PACKED}
+    network.__dict__['_packed'] = (unpack, data, stores)
+    return network
+
+
+def _pack_values(values: list) -> Any:
+    """Helper function to store a list of int or float values as array.
+
+    Integer values are stored with the smallest possible dtype and float
+    values as single precision if no precision is lost.
+    """
+    for kind in (int, float):
+        if values and all(type(v) is kind for v in values):
+            array = np.array(values)
+            if array.dtype == object:
+                break
+            if kind is int:
+                array = array.astype(np.result_type(
+                    np.min_scalar_type(array.min()),
+                    np.min_scalar_type(array.max())))
+            elif _lossless(array, array.astype(np.float32)):
+                array = array.astype(np.float32)
+            return array
+    return values
+
+
+def _lossless(array: np.ndarray, other: np.ndarray) -> bool:
+    """Helper function to check if two float arrays hold the same values.
+
+    NaNs are compared via their masks, i.e. without ``equal_nan`` of
+    ``np.array_equal`` which requires numpy 1.19.
+    """
+    nan = np.isnan(array)
+    return (np.array_equal(nan, np.isnan(other)) and
+            np.array_equal(array[~nan], other[~nan]))
+
+
+def _unpack_values(values: Any) -> list:
+    """Helper function to convert packed values back to a list."""
+    return values.tolist() if isinstance(values, np.ndarray) else values
+
+
+def _pack_mask(mask: list) -> Tuple[int, np.ndarray]:
+    """Helper function to store a list of booleans as bits."""
+    return len(mask), np.packbits(np.array(mask, dtype=bool))
+
+
+def _unpack_mask(mask: Tuple[int, np.ndarray]) -> list:
+    """Helper function to convert packed bits back to a list of booleans."""
+    size, bits = mask
+    return np.unpackbits(bits, count=size).astype(bool).tolist()
+
+
+def _pack_objects(collection: Any) -> dict:
+    """Helper function to return the uids, counts and attribute columns.
+
+    The python uids are derived from the object ids and are stored as
+    integers instead of hex strings.
+    """
+    objs = collection._values_by_index()
+    counter = collection.counter
+
+    python = [obj._has_python_uid for obj in objs]
+    ids = [obj.uid.startswith('0x') and hex(int(obj.uid, 16)) == obj.uid
+           for obj in objs]
+
+    # sparse attribute columns {key: (indices, values)}
+    columns: dict = {}
+    for i, obj in enumerate(objs):
+        for key, value in (obj._attributes or {}).items():
+            column = columns.setdefault(key, ([], []))
+            column[0].append(i)
+            column[1].append(value)
+
+    return {
+        'uids': [obj.uid for obj, i in zip(objs, ids) if not i],
+        'ids': np.array([int(obj.uid, 16) for obj, i in zip(objs, ids) if i],
+                        dtype=np.uint64),
+        'python': _pack_mask(python),
+        'hex': _pack_mask(ids),
+        'counts': _pack_values([counter[obj.uid] for obj in objs]),
+        'attributes': {key: (_pack_values(idx), _pack_values(values))
+                       for key, (idx, values) in columns.items()},
+    }
+
+
+def _unpack_uids(data: dict) -> list:
+    """Helper function to return the uids of a packed collection."""
+    uids, ids = iter(data['uids']), iter(data['ids'].tolist())
+    return [hex(next(ids)) if packed else next(uids)
+            for packed in _unpack_mask(data['hex'])]
+
+
+def _unpack_column(column: tuple, size: int) -> np.ndarray:
+    """Helper function to return a packed sparse column as array.
+
+    Missing values are ``nan`` in numeric and ``None`` in object columns.
+    """
+    idx, values = column
+    if isinstance(values, np.ndarray):
+        array = np.full(size, np.nan)
+    else:
+        array = np.full(size, None, dtype=object)
+        values, values[:] = np.empty(len(values), dtype=object), values
+    array[np.asarray(idx, dtype=np.int64)] = values
+    return array
+
+
+def _unpack_objects(data: dict, create: Any) -> list:
+    """Helper function to create the objects of a packed collection."""
+    objs = [create(i, uid) for i, uid in enumerate(_unpack_uids(data))]
+
+    for obj, python in zip(objs, _unpack_mask(data['python'])):
+        obj._has_python_uid = python
+        obj._attributes = None
+
+    for key, (idx, values) in data['attributes'].items():
+        for i, value in zip(_unpack_values(idx), _unpack_values(values)):
+            obj = objs[i]
+            if obj._attributes is None:
+                obj._attributes = {}
+            obj._attributes[key] = value
+
+    return objs
+
 # =============================================================================
 # eof
 #
@@ -0,0 +1,221 @@
+"""Network view class"""
+# !/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : network_view.py -- Filtered views of a network
+# Author    : Pathpy Developers
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple, Set
+from copy import deepcopy
+
+from pathpy import logger
+from pathpy.core.node import Node
+from pathpy.core.edge import Edge
+from pathpy.core.temporal import TemporalPathPyObject
+
+# pseudo load class for type checking
+if TYPE_CHECKING:
+    from pathpy.models.network import Network
+
+# create logger for the NetworkView class
+LOG = logger(__name__)
+
+
+class NetworkView:
+    """Lightweight filtered view of a network.
+
+    A network view only stores the uids of the selected nodes or edges. The
+    node and edge objects of the view are looked up in the underlying network
+    when they are accessed, i.e. the view reflects changes of the network.
+    Views are created via :py:meth:`Network.subgraph` and
+    :py:meth:`Network.edge_subgraph`, a real network is obtained with
+    :py:meth:`materialize`.
+
+    Parameters
+    ----------
+    network : Network
+
+        The network which is filtered.
+
+    nodes : Iterable[str], optional (default = None)
+
+        Uids of the nodes of the induced subgraph, i.e. the view contains the
+        nodes and all edges between them.
+
+    edges : Iterable[str], optional (default = None)
+
+        Uids of the edges of the view, i.e. the view contains the edges and
+        the nodes attached to them.
+
+    Examples
+    --------
+    >>> import pathpy as pp
+    >>> net = pp.Network()
+    >>> net.add_edges(('a', 'b'), ('b', 'c'), ('c', 'd'))
+    >>> view = net.subgraph(['a', 'b', 'c'])
+    >>> view.shape
+    (3, 2)
+    >>> sub = view.materialize()
+    >>> sub.shape
+    (3, 2)
+
+    """
+
+    def __init__(self, network: Network,
+                 nodes: Optional[Iterable[str]] = None,
+                 edges: Optional[Iterable[str]] = None) -> None:
+        """Initialize the network view."""
+
+        # the underlying network
+        self.network: Network = network
+
+        # uids of the selected nodes or edges
+        self._node_uids: Optional[Set[str]] = set(
+            nodes) if nodes is not None else None
+        self._edge_uids: Optional[Set[str]] = set(
+            edges) if edges is not None else None
+
+        # cached nodes and edges of the view (key, nodes, edges)
+        self._cache: Optional[Tuple[tuple, dict, dict]] = None
+
+    def __repr__(self) -> str:
+        """Return the description of the view."""
+        return '{} of {} {}'.format(self.__class__.__name__,
+                                    self.network.uid, self.shape)
+
+    def __contains__(self, item: Any) -> bool:
+        """Returns if a node or an edge is in the view."""
+        uid = item.uid if isinstance(item, (Node, Edge)) else item
+        return uid in self.nodes or uid in self.edges
+
+    @property
+    def nodes(self) -> Dict[str, Node]:
+        """Return the nodes of the view {uid: Node}."""
+        return self._filter()[0]
+
+    @property
+    def edges(self) -> Dict[str, Edge]:
+        """Return the edges of the view {uid: Edge}."""
+        return self._filter()[1]
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Return the number of nodes and edges."""
+        return self.number_of_nodes(), self.number_of_edges()
+
+    def number_of_nodes(self) -> int:
+        """Return the number of nodes in the view."""
+        return len(self.nodes)
+
+    def number_of_edges(self) -> int:
+        """Return the number of edges in the view."""
+        return len(self.edges)
+
+    def materialize(self, uid: Optional[str] = None,
+                    copy: bool = False) -> Network:
+        """Create a network from the view.
+
+        The network is of the same class as the underlying network and is
+        built in one pass, i.e. the nodes and edges are stored without
+        further checks and the network properties are updated once.
+
+        .. note::
+
+            Per default the node and edge objects (including their
+            attributes) are shared with the underlying network. Temporal
+            objects are always copied since they store their events.
+
+        Parameters
+        ----------
+        uid : str, optional (default = None)
+
+            The uid of the new network.
+
+        copy : bool, optional (default = False)
+
+            If ``True`` the network consists of copies of the node and edge
+            objects, i.e. it is independent of the underlying network.
+
+        Returns
+        -------
+        Network
+
+            Returns a new network with the nodes and edges of the view.
+
+        """
+        nodes, edges = self._filter()
+        network = self.network._new(uid=uid)
+
+        if copy or any(isinstance(obj, TemporalPathPyObject)
+                       for objs in (nodes, edges) for obj in objs.values()):
+            # the edges of the copies refer to the copied nodes
+            nodes, edges = deepcopy((nodes, edges))
+
+        for node in nodes.values():
+            network.nodes._add(
+                node, count=self.network.nodes.counter[node.uid])
+
+        for edge in edges.values():
+            network.edges._add(
+                edge, count=self.network.edges.counter[edge.uid])
+
+        # update the network properties in one pass
+        network._add_edge_properties()
+
+        return network
+
+    def _filter(self) -> Tuple[dict, dict]:
+        """Helper function to return the (cached) nodes and edges."""
+        key = self.network._compile_key()
+        if self._cache is None or self._cache[0] != key:
+            if self._node_uids is not None:
+                nodes, edges = self._induced()
+            else:
+                nodes, edges = self._incident()
+            self._cache = (key, nodes, edges)
+        return self._cache[1], self._cache[2]
+
+    def _induced(self) -> Tuple[dict, dict]:
+        """Helper function to get the nodes and edges of a node subgraph."""
+        network = self.network
+        uids = self._node_uids & network.nodes.keys()
+
+        edges: dict = {}
+        for uid in uids:
+            for edge in network.outgoing[uid]:
+                if edge.v.uid in uids and edge.w.uid in uids:
+                    edges[edge.uid] = edge
+
+        return _sorted(network.nodes, uids), _sorted(network.edges, edges)
+
+    def _incident(self) -> Tuple[dict, dict]:
+        """Helper function to get the nodes and edges of an edge subgraph."""
+        network = self.network
+        uids = self._edge_uids & network.edges.keys()
+
+        nodes: set = set()
+        for uid in uids:
+            edge = network.edges[uid]
+            nodes.update((edge.v.uid, edge.w.uid))
+
+        return _sorted(network.nodes, nodes), _sorted(network.edges, uids)
+
+
+def _sorted(collection: Any, uids: Iterable[str]) -> dict:
+    """Helper function to return the objects in the order of the collection."""
+    index = collection.index
+    return {uid: collection[uid] for uid in sorted(uids, key=index.get)}
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
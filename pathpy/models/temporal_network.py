@@ -9,20 +9,24 @@
 # Copyright (c) 2016-2020 Pathpy Developers
 # =============================================================================
 from __future__ import annotations
-from typing import Any, Optional, Union
+from typing import Any, Dict, Iterable, Optional, Union
 from collections import defaultdict
 from singledispatchmethod import singledispatchmethod  # NOTE: not needed at 3.9
 
+import numpy as np
 import pandas as pd
-from intervaltree import IntervalTree
+from intervaltree import Interval, IntervalTree
 
 from pathpy import logger
 from pathpy.core.core import PathPyObject
-from pathpy.core.temporal import TemporalPathPyObject, _get_start_end
+from pathpy.core.temporal import (TemporalPathPyObject, EventStore,
+                                  EventView, EventWindow, _UidInterval,
+                                  _get_start_end, _readonly, _without_events)
 
 from pathpy.core.node import Node, NodeCollection
 from pathpy.core.edge import Edge, EdgeCollection
-from pathpy.models.network import Network
+from pathpy.models.network import (Network, _pack_values, _unpack_values,
+                                   _pack_mask, _unpack_mask)
 
 # from pathpy.core.base.attributes import TemporalAttributes
 
@@ -37,6 +41,42 @@ from pathpy.models.classes import BaseTemporalNetwork
 LOG = logger(__name__)
 
 
+class TemporalEdgeWindow(EventWindow):
+    """Immutable view on the edge events within a period.
+
+    In addition to the :py:class:`EventWindow` the uids of the source and
+    target nodes of the events are available as arrays.
+    """
+    __slots__ = ('_nodes',)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the window."""
+        super().__init__(*args, **kwargs)
+        self._nodes: Optional[tuple] = None
+
+    @property
+    def v(self) -> np.ndarray:
+        """Return the uids of the source nodes of the events."""
+        return self._endpoints()[0]
+
+    @property
+    def w(self) -> np.ndarray:
+        """Return the uids of the target nodes of the events."""
+        return self._endpoints()[1]
+
+    def _endpoints(self) -> tuple:
+        """Helper function to look up the nodes once per edge."""
+        if self._nodes is None:
+            uids, inverse = np.unique(self._uids, return_inverse=True)
+            edges = [self._collection[uid] for uid in uids.tolist()]
+            v, w = (np.empty(len(edges), dtype=object) for _ in range(2))
+            v[:] = [edge.v.uid for edge in edges]
+            w[:] = [edge.w.uid for edge in edges]
+            inverse = inverse.reshape(-1)
+            self._nodes = (_readonly(v[inverse]), _readonly(w[inverse]))
+        return self._nodes
+
+
 class TemporalNode(Node, TemporalPathPyObject):
     """Base class of a temporal node."""
 
@@ -44,11 +84,11 @@ class TemporalNode(Node, TemporalPathPyObject):
                  uid: Optional[str] = None, **kwargs: Any) -> None:
         """Initialize the node object."""
 
-        # initializing the parent classes
+        # initializing the parent classes (incl. the temporal object, which
+        # follows the path in the method resolution order)
         kwargs.pop('directed', None)
         kwargs.pop('ordered', None)
         Node.__init__(self, *node, uid=uid, **kwargs)
-        TemporalPathPyObject.__init__(self, uid=self.uid, **kwargs)
 
     def summary(self) -> str:
         """Object summary. """
@@ -69,9 +109,9 @@ class TemporalEdge(Edge, TemporalPathPyObject):
                  **kwargs: Any) -> None:
         """Initialize the node object."""
 
-        # initialize the parent class
+        # initialize the parent classes (incl. the temporal object, which
+        # follows the path in the method resolution order)
         Edge.__init__(self, v, w, uid=uid, directed=directed, **kwargs)
-        TemporalPathPyObject.__init__(self, uid=uid, **kwargs)
 
     def summary(self) -> str:
         """Object summary. """
@@ -82,20 +122,31 @@ class TemporalEdge(Edge, TemporalPathPyObject):
         return super().summary() + ''.join(summary)
 
 
-class TemporalNodeCollection(NodeCollection):
-    """A collection of temporal nodes"""
+class BaseTemporalCollection:
+    """Mixin which stores the events of the objects of a collection.
+
+    The events are stored in an interval tree (``events='tree'``) or in a
+    columnar :py:class:`EventStore` (``events='columnar'``) and are updated
+    when objects are added to or removed from the collection.
+    """
 
     def __init__(self, *args, **kwargs) -> None:
-        """Initialize the NodeCollection object."""
+        """Initialize the event store of the collection."""
+
+        # backend to store the events ('tree' or 'columnar')
+        events: str = kwargs.pop('events', 'tree')
 
         # initialize the base class
         super().__init__(*args, **kwargs)
 
-        # initialize an intervaltree to save events
-        self._events = IntervalTree()
-
-        # class of objects
-        self._default_class: Any = TemporalNode
+        # initialize an intervaltree or a columnar store to save events
+        if events == 'tree':
+            self._events: Any = IntervalTree()
+        elif events == 'columnar':
+            self._events = EventStore()
+        else:
+            LOG.error('The event backend "%s" is not supported!', events)
+            raise AttributeError
 
     @singledispatchmethod
     def __getitem__(self, key: Any) -> Any:
@@ -107,6 +158,10 @@ class TemporalNodeCollection(NodeCollection):
     def _(self, key: Union[int, float, slice]) -> Any:
         # pylint: disable=arguments-differ
         start, end, _ = _get_start_end(key)
+        if self.columnar:
+            yield from _window(self, start, end)
+            return
+
         for start, end, uid in sorted(self._events[start:end]):
             for obj in self[uid][start:end]:
                 yield obj
@@ -126,34 +181,184 @@ class TemporalNodeCollection(NodeCollection):
         """Temporal events"""
         return self._events
 
-    @singledispatchmethod
-    def add(self, *args, **kwargs: Any) -> None:
-        """Add multiple nodes. """
-        super().add(*args, **kwargs)
+    @property
+    def columnar(self) -> bool:
+        """Return if the events are stored in a columnar event store."""
+        return isinstance(self._events, EventStore)
+
+    def _snapshot(self, read_only: bool = True) -> Any:
+        """Helper function to create a copy-on-write copy of the collection.
+
+        The events of the objects are shared like their attributes, but the
+        copy keeps the events of its objects in the collection. The columnar
+        store is copied without copying the event arrays, since the views of
+        the objects refer to the store of the collection. The interval tree
+        is cloned before the collection is changed the next time.
+        """
+        other = super()._snapshot(read_only)
+        if self.columnar:
+            other._events = self._events.copy()
+        return other
+
+    def _unshare(self) -> None:
+        """Helper function to clone the stores shared with a snapshot."""
+        shared = self._shared
+        super()._unshare()
+        if shared and not self.columnar:
+            self._events = IntervalTree(self._events)
+
+    def _restore(self, objs: list, counts: Iterable[int]) -> None:
+        """Helper function to fill an empty collection in one pass.
+
+        The events of the objects are moved into the event store, the
+        interval tree of the collection has to be restored by the caller.
+        """
+        super()._restore(objs, counts)
+        if self.columnar:
+            for obj in objs:
+                self._events.attach(obj)
 
     def _add(self, obj: Any, **kwargs: Any) -> None:
-        """Add an node to the set of nodes."""
+        """Add an object to the collection."""
         super()._add(obj, **kwargs)
+        if self.columnar:
+            self._events.attach(obj)
+            return
         start, end, _ = obj.last()
-        self._events[start:end] = obj.uid
+        self._events.add(_UidInterval(start, end, obj.uid))
+
+    def _add_events(self, objs: list, new: list, ids: np.ndarray,
+                    start: np.ndarray, end: np.ndarray,
+                    columns: Dict[str, np.ndarray]) -> None:
+        """Helper function to add the events of many objects in one pass.
+
+        The event ``j`` belongs to the object ``objs[ids[j]]``. The new
+        objects are created without events (see _without_events) and are
+        stored first. The events are added to the event store or to the
+        interval trees of the objects and of the collection at once.
+        """
+        self._unshare()
+        for obj in new:
+            super()._add(obj)
+
+        fresh = {id(obj) for obj in new}
+        if self.columnar:
+            store = self._events
+            index = np.array([store.register(obj.uid) for obj in objs],
+                             dtype=np.int64)
+            for obj, i in zip(objs, index.tolist()):
+                if id(obj) in fresh:
+                    obj._events = EventView(store, i)
+            store.extend(index[ids], start, end, columns)
+        else:
+            data = [dict(zip(columns, values))
+                    for values in zip(*columns.values())] if columns else \
+                [{} for _ in range(len(ids))]
+            order = np.argsort(ids, kind='stable')
+            bounds = np.searchsorted(ids[order], np.arange(len(objs) + 1))
+            begins, ends = start.tolist(), end.tolist()
+            for obj, low, high in zip(objs, bounds[:-1].tolist(),
+                                      bounds[1:].tolist()):
+                intervals = [Interval(begins[row], ends[row], data[row])
+                             for row in order[low:high].tolist()]
+                if id(obj) in fresh:
+                    obj._events = IntervalTree(intervals)
+                else:
+                    obj._events.update(intervals)
+            uids = [obj.uid for obj in objs]
+            self._events.update(
+                _UidInterval(begin, stop, uids[i])
+                for begin, stop, i in zip(begins, ends, ids.tolist()))
+
+        for obj in objs:
+            obj._start = obj._events.begin()
+            obj._end = obj._events.end()
+            obj._dirty = len(obj._events) > 1
 
     def _if_exist(self, obj: Any, **kwargs: Any) -> None:
-        """Helper function if node already exists."""
+        """Helper function if the object already exists."""
+        self._unshare()
         count: int = kwargs.pop('count', 1)
         element = self[obj.relations]
+
+        # without new events the events of another object are taken over
+        if not kwargs and obj is not element:
+            for start, end, data in sorted(obj._events):
+                element.event(start=start, end=end, **data)
+                if not self.columnar:
+                    self._events.add(_UidInterval(start, end, element.uid))
+            return
+
         element.event(**kwargs)
+        if self.columnar:
+            return
         start, end, _ = obj.last()
-        self._events[start:end] = element.uid
+        self._events.add(_UidInterval(start, end, element.uid))
 
     def _remove(self, obj) -> None:
-        """Add an edge to the set of edges."""
-        for interval in sorted(self._events):
-            if interval.data == obj.uid:
-                self._events.remove(interval)
-        super()._remove(obj)
+        """Remove an object from the collection."""
+        self._remove_many((obj,))
+
+    def _remove_many(self, objs: Iterable[Any]) -> None:
+        """Helper function to remove multiple objects in one sweep."""
+        self._unshare()
+        objs = list(objs)
+        if self.columnar:
+            self._events.detach(objs)
+        else:
+            uids = {obj.uid for obj in objs}
+            self._events.difference_update(
+                [interval for interval in self._events
+                 if interval.data in uids])
+        for obj in objs:
+            super()._remove(obj)
+
+
+class TemporalNodeCollection(BaseTemporalCollection, NodeCollection):
+    """A collection of temporal nodes"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the NodeCollection object."""
+
+        # initialize the base class
+        super().__init__(*args, **kwargs)
+
+        # class of objects
+        self._default_class: Any = TemporalNode
+
+    def window(self, start: Any = None, end: Any = None) -> EventWindow:
+        """Return an immutable view on the node events within a period.
+
+        Parameters
+        ----------
+        start : Any, optional (default = None)
+
+            Start of the period (unbounded if None).
+
+        end : Any, optional (default = None)
+
+            End of the period (unbounded if None).
+
+        Returns
+        -------
+        EventWindow
 
+            Read-only arrays of the start times, end times and uids of the
+            events which overlap the period.
 
-class TemporalEdgeCollection(EdgeCollection):
+        """
+        if self.columnar:
+            _clean_events(self)
+            return EventWindow.from_store(self, start, end)
+        return EventWindow.from_tree(self, start, end)
+
+    @singledispatchmethod
+    def add(self, *args, **kwargs: Any) -> None:
+        """Add multiple nodes. """
+        super().add(*args, **kwargs)
+
+
+class TemporalEdgeCollection(BaseTemporalCollection, EdgeCollection):
     """A collection of temporal edges"""
 
     def __init__(self, *args, **kwargs) -> None:
@@ -163,75 +368,133 @@ class TemporalEdgeCollection(EdgeCollection):
         super().__init__(*args, **kwargs)
 
         # indicator whether the network has multi-edges
-        self._multiple: bool = kwargs.pop('multiedges', False)
-
-        # initialize an intervaltree to save events
-        self._events = IntervalTree()
+        self._multiple: bool = kwargs.get('multiedges', False)
 
         # class of objects
         self._default_class: Any = TemporalEdge
 
-    @singledispatchmethod
-    def __getitem__(self, key: Any) -> Any:
-        return super().__getitem__(key)
+    def window(self, start: Any = None,
+               end: Any = None) -> TemporalEdgeWindow:
+        """Return an immutable view on the edge events within a period.
 
-    @__getitem__.register(slice)  # type: ignore
-    @__getitem__.register(int)  # type: ignore
-    @__getitem__.register(float)  # type: ignore
-    def _(self, key: Union[int, float, slice]) -> Any:
-        # pylint: disable=arguments-differ
-        start, end, _ = _get_start_end(key)
-        for start, end, uid in sorted(self._events[start:end]):
-            for obj in self[uid][start:end]:
-                yield obj
+        Unlike slicing the collection, which yields the same edge objects
+        with temporarily changed attributes, the window stores the events in
+        read-only arrays and is therefore safe to use in parallel iterations.
 
-    @property
-    def start(self):
-        """start of the object"""
-        return self._events.begin()
+        Parameters
+        ----------
+        start : Any, optional (default = None)
 
-    @property
-    def end(self):
-        """end of the object"""
-        return self._events.end()
+            Start of the period (unbounded if None).
 
-    @property
-    def events(self):
-        """Temporal events"""
-        return self._events
+        end : Any, optional (default = None)
+
+            End of the period (unbounded if None).
+
+        Returns
+        -------
+        TemporalEdgeWindow
+
+            Read-only arrays of the start times, end times, edge uids and
+            node uids (``v`` and ``w``) of the events which overlap the
+            period.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> net = pp.TemporalNetwork()
+        >>> net.add_edge('a', 'b', timestamp=1)
+        >>> net.add_edge('b', 'c', timestamp=3)
+        >>> window = net.edges.window(0, 5)
+        >>> window.v, window.w, window.start
+        (array(['a', 'b'], dtype=object), array(['b', 'c'], dtype=object),
+         array([1, 3]))
+        >>> [(edge.uid, start) for edge, start, end in window]
+        [('a-b', 1), ('b-c', 3)]
+
+        """
+        if self.columnar:
+            _clean_events(self)
+            return TemporalEdgeWindow.from_store(self, start, end)
+        return TemporalEdgeWindow.from_tree(self, start, end)
+
+    def arrays(self, *keys: str) -> Dict[str, np.ndarray]:
+        """Return the events as parallel arrays sorted by the start times.
+
+        Parameters
+        ----------
+        keys : str
+
+            Event attributes which are returned as additional columns
+            (``None`` marks missing values).
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+
+            The uids of the source nodes (``'src'``), target nodes
+            (``'dst'``) and edges (``'edge'``), the start and end times and
+            the requested attribute columns.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> net = pp.TemporalNetwork(events='columnar')
+        >>> net.add_edge('a', 'b', timestamp=3, color='red')
+        >>> net.add_edge('b', 'c', timestamp=1)
+        >>> arrays = net.edges.arrays('color')
+        >>> arrays['src'], arrays['start'], arrays['color']
+        (array(['b', 'a'], dtype=object), array([1., 3.]),
+         array([None, 'red'], dtype=object))
+
+        """
+        store = self._events
+        if not self.columnar:
+            store = EventStore()
+            for obj in self.values():
+                i = store.register(obj.uid)
+                for start, end, data in obj._events:
+                    store.append(i, start, end, data)
+
+        arrays = store.arrays(*keys)
+        ids = arrays.pop('id')
+        edges = [self._store.get(uid, None) for uid in store.uids]
+        uids, src, dst = (np.empty(len(edges), dtype=object) for _ in range(3))
+        uids[:] = store.uids
+        src[:] = [e.v.uid if e is not None else None for e in edges]
+        dst[:] = [e.w.uid if e is not None else None for e in edges]
+        return {'src': src[ids], 'dst': dst[ids], 'edge': uids[ids], **arrays}
 
     @singledispatchmethod
     def add(self, *args, **kwargs: Any) -> None:
         """Add multiple nodes. """
+        # new events of existing edges are directly added to the store
+        if (self.columnar and len(args) == 2 and not self._multiple and
+                kwargs.get('uid', None) is None and args in self):
+            self._unshare()
+            kwargs.pop('uid', None)
+            kwargs.pop('count', None)
+            self[args].event(**kwargs)
+            return
         super().add(*args, **kwargs)
 
-    def _add(self, obj: Any, **kwargs: Any) -> None:
-        """Add an edge to the set of edges."""
-        super()._add(obj, **kwargs)
-        start, end, _ = obj.last()
-        self._events[start:end] = obj.uid
-
-    def _if_exist(self, obj: Any, **kwargs: Any) -> None:
-        """Helper function if node already exists."""
-        count: int = kwargs.pop('count', 1)
-        element = self[obj.relations]
-        element.event(**kwargs)
-        start, end, _ = obj.last()
-        self._events[start:end] = element.uid
 
-    def _remove(self, obj) -> None:
-        """Add an edge to the set of edges."""
-        for interval in sorted(self._events):
-            if interval.data == obj.uid:
-                self._events.remove(interval)
-        super()._remove(obj)
+class TemporalNetwork(BaseTemporalNetwork, Network):
+    """Base class for a temporal networks.
 
+    Per default the events of each node and edge are stored in an interval
+    tree. With ``events='columnar'`` the events of all nodes and of all edges
+    are stored in columnar :py:class:`EventStore` objects, which need much
+    less memory for networks with many events and find time slices via
+    binary search.
+    """
 
-class TemporalNetwork(BaseTemporalNetwork, Network):
-    """Base class for a temporal networks."""
+    # node and edge classes which can be pickled in the compact format
+    _compact_classes = (TemporalNode, TemporalEdge)
 
     def __init__(self, uid: Optional[str] = None, directed: bool = True,
-                 multiedges: bool = False, **kwargs: Any) -> None:
+                 multiedges: bool = False, events: str = 'tree',
+                 **kwargs: Any) -> None:
         """Initialize the temporal network object."""
 
         # initialize the base class
@@ -239,11 +502,13 @@ class TemporalNetwork(BaseTemporalNetwork, Network):
                          multiedges=multiedges, **kwargs)
 
         # a container for node objects
-        self._nodes: TemporalNodeCollection = TemporalNodeCollection()
+        self._nodes: TemporalNodeCollection = TemporalNodeCollection(
+            track_changes=True, events=events)
 
         # a container for edge objects
         self._edges: TemporalEdgeCollection = TemporalEdgeCollection(
-            directed=directed, multiedges=multiedges)
+            directed=directed, multiedges=multiedges, track_changes=True,
+            events=events)
 
     @property
     def nodes(self) -> TemporalNodeCollection:
@@ -255,6 +520,161 @@ class TemporalNetwork(BaseTemporalNetwork, Network):
         """Return the associated edges of the network."""
         return self._edges
 
+    def extend_events(self, v: Iterable, w: Iterable, start: Any, end: Any,
+                      columns: Optional[Dict[str, Any]] = None,
+                      times: Optional[Dict[str, Any]] = None) -> None:
+        """Add many edge events at once.
+
+        The events are grouped by their node pairs, i.e. one edge is created
+        per new pair and one node per new uid, and all events are added in
+        one pass instead of calling :py:meth:`add_edge` per event. Events of
+        existing pairs are added to their edges. As with
+        :py:meth:`add_edge`, the edges keep the attributes of their last
+        event.
+
+        Parameters
+        ----------
+        v : Iterable
+
+            Uids of the source nodes of the events.
+
+        w : Iterable
+
+            Uids of the target nodes of the events.
+
+        start : Any
+
+            Start times of the events (array-like).
+
+        end : Any
+
+            End times of the events (array-like).
+
+        columns : Dict[str, Any], optional (default = None)
+
+            Attributes of the events as columns.
+
+        times : Dict[str, Any], optional (default = None)
+
+            Time columns the events were given with (e.g. ``timestamp``),
+            which new edges with a single event keep as attributes like
+            edges added via :py:meth:`add_edge`.
+
+        Examples
+        --------
+        >>> import pathpy as pp
+        >>> net = pp.TemporalNetwork(events='columnar')
+        >>> net.extend_events(['a', 'b', 'a'], ['b', 'c', 'b'], [1, 2, 3],
+        ...                   [2, 3, 4], columns={'color': ['r', 'g', 'b']})
+        >>> net.shape
+        (3, 2)
+        >>> net.edges['a', 'b']['color']
+        'b'
+
+        """
+        # pylint: disable=too-many-locals
+        if self.multiedges:
+            LOG.error('Events can only be added at once to networks '
+                      'without multi-edges!')
+            raise NotImplementedError
+
+        start, end = np.asarray(start), np.asarray(end)
+        columns = {key: np.asarray(column, dtype=object)
+                   for key, column in (columns or {}).items()}
+        values = {**{key: np.asarray(column, dtype=object)
+                     for key, column in (times or {}).items()}, **columns}
+
+        # map the node uids to integer codes in order of appearance
+        codes, uids = pd.factorize(np.column_stack((
+            np.asarray(v, dtype=object), np.asarray(w, dtype=object)
+        )).ravel())
+        _v, _w = codes[0::2], codes[1::2]
+
+        # group the events by their (sorted) node pairs
+        _a, _b = (_v, _w) if self.directed else (
+            np.minimum(_v, _w), np.maximum(_v, _w))
+        groups, _ = pd.factorize(_a * len(uids) + _b)
+        _, rows = np.unique(groups, return_index=True)
+        _, last = np.unique(groups[::-1], return_index=True)
+        last = len(groups) - 1 - last
+        counts = np.bincount(groups)
+
+        # new nodes get an unbounded event like nodes added via add_node
+        new = [_without_events(self.nodes._default_class, uid)
+               for uid in uids.tolist() if uid not in self.nodes._store]
+        for node in new:
+            node._replace_attributes({})
+        self.nodes._add_events(
+            new, new, np.arange(len(new)), np.full(len(new), float('-inf')),
+            np.full(len(new), float('inf')), {})
+        nodes = [self.nodes._store[uid] for uid in uids.tolist()]
+
+        # the edges keep the attributes of their last event
+        edges, new = [], []
+        stored = len(self.edges) > 0
+        for _i, _j, _l, _n in zip(_v[rows].tolist(), _w[rows].tolist(),
+                                  last.tolist(), counts.tolist()):
+            pair = (nodes[_i].uid, nodes[_j].uid)
+            if stored and pair in self.edges:
+                edge = self.edges[pair]
+                edge._replace_attributes(
+                    {key: columns[key][_l] for key in columns})
+            else:
+                edge = _without_events(self.edges._default_class,
+                                       nodes[_i], nodes[_j],
+                                       directed=self.directed)
+                edge._replace_attributes(
+                    {key: column[_l] for key, column in
+                     (values if _n == 1 else columns).items()})
+                new.append(edge)
+            edges.append(edge)
+
+        self.edges._add_events(edges, new, groups, start, end, columns)
+        self._add_edge_properties()
+
+    def fork(self) -> TemporalNetwork:
+        """Return a copy of the temporal network which can be changed.
+
+        New events of existing nodes and edges are stored in the objects,
+        which a copy-on-write copy would share with the network. Hence, the
+        temporal network is copied (see :py:meth:`copy`).
+        """
+        return self.copy()
+
+    def _new(self, uid: Optional[str] = None) -> TemporalNetwork:
+        """Helper function to create an empty network of the same kind."""
+        return self.__class__(
+            uid=uid, directed=self.directed, multiedges=self.multiedges,
+            events='columnar' if self.edges.columnar else 'tree',
+            **self.attributes)
+
+    def _pack(self) -> dict:
+        """Helper function to return the compact state of the network."""
+        data = super()._pack()
+        data['nodes']['events'] = _pack_events(self.nodes)
+        data['edges']['events'] = _pack_events(self.edges)
+        return data
+
+    def _unpack(self, data: dict) -> None:
+        """Helper function to rebuild the network from its compact state."""
+        super()._unpack(data)
+        for key, collection in (('nodes', self.nodes), ('edges', self.edges)):
+            if isinstance(collection.events, EventStore):
+                continue
+            uids = list(collection.keys())
+            owners, begins, ends = data[key]['events']['collection']
+            collection._events = IntervalTree(
+                _UidInterval(begin, end, uids[i]) for i, begin, end in zip(
+                    _unpack_values(owners), _unpack_values(begins),
+                    _unpack_values(ends)))
+
+    def _unpack_objects(self, data: dict) -> tuple:
+        """Helper function to create the node and edge objects."""
+        nodes, edges = super()._unpack_objects(data)
+        _unpack_events(nodes, data['nodes']['events'])
+        _unpack_events(edges, data['edges']['events'])
+        return nodes, edges
+
     @property
     def start(self):
         """start of the object"""
@@ -358,6 +778,93 @@ class TemporalNetwork(BaseTemporalNetwork, Network):
                             start=current_interval[0], end=current_interval[1])
         return tn
 
+
+def _clean_events(collection: Any) -> None:
+    """Helper function to normalise the changed events in a columnar store."""
+    store = collection.events
+    changed = store.pop_changed()
+    overlapping = set(store.overlapping(changed))
+    for i in changed:
+        obj = collection._store.get(store.uids[i], None)
+        if obj is None:
+            continue
+        if i in overlapping:
+            obj._dirty = True
+            obj._clean_events()
+        else:
+            obj._dirty = False
+
+
+def _window(collection: Any, start: Any, end: Any) -> Any:
+    """Helper function to iterate over the events in a columnar store."""
+    store = collection.events
+
+    # overlapping events of the changed objects are normalised first
+    _clean_events(collection)
+
+    for begin, stop, uid, data in store.rows(start, end):
+        obj = collection[uid]
+        obj._attributes = {**{'start': begin, 'end': stop}, **data}
+        yield obj
+        obj._attributes.pop('start', None)
+        obj._attributes.pop('end', None)
+
+
+def _pack_events(collection: Any) -> dict:
+    """Helper function to return the events of the objects as columns."""
+    objs = collection._values_by_index()
+    index = {obj.uid: i for i, obj in enumerate(objs)}
+
+    owners, begins, ends, values = [], [], [], []
+    for i, obj in enumerate(objs):
+        for begin, end, data in obj._events:
+            owners.append(i)
+            begins.append(begin)
+            ends.append(end)
+            values.append(data)
+
+    # sparse columns of the event attributes {key: (indices, values)}
+    columns: dict = {}
+    for j, data in enumerate(values):
+        for key, value in data.items():
+            column = columns.setdefault(key, ([], []))
+            column[0].append(j)
+            column[1].append(value)
+
+    tree = list(collection.events)
+    return {
+        'objects': (_pack_values(owners), _pack_values(begins),
+                    _pack_values(ends), len(values),
+                    {key: (_pack_values(idx), _pack_values(column))
+                     for key, (idx, column) in columns.items()},
+                    _pack_mask([obj._dirty for obj in objs])),
+        'collection': (_pack_values([index[i.data] for i in tree]),
+                       _pack_values([i.begin for i in tree]),
+                       _pack_values([i.end for i in tree])),
+    }
+
+
+def _unpack_events(objs: list, events: dict) -> None:
+    """Helper function to restore the events of the objects."""
+    owners, begins, ends, size, columns, dirty = events['objects']
+
+    values: list = [{} for _ in range(size)]
+    for key, (idx, column) in columns.items():
+        for j, value in zip(_unpack_values(idx), _unpack_values(column)):
+            values[j][key] = value
+
+    intervals: list = [[] for _ in objs]
+    for i, begin, end, data in zip(_unpack_values(owners),
+                                   _unpack_values(begins),
+                                   _unpack_values(ends), values):
+        intervals[i].append(Interval(begin, end, data))
+
+    for obj, events, flag in zip(objs, intervals, _unpack_mask(dirty)):
+        obj._events = IntervalTree(events)
+        obj._dirty = flag
+        obj._start = obj._events.begin()
+        obj._end = obj._events.end()
+
 # =============================================================================
 # eof
 #
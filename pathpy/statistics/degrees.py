@@ -60,10 +60,9 @@ def degree_sequence(network: Network, weight: Weight = None) -> np.array:
     >>> s
     array([3.1, 2.1, 1.0])
     """
-    _degrees = np.zeros(network.number_of_nodes(), dtype=float)
-    for v in network.nodes.uids:
-        _degrees[network.nodes.index[v]] = network.degrees(weight=weight)[v]
-    return _degrees
+    # the degrees are returned in the order of the node index
+    _degrees = network.degrees(weight=weight)
+    return np.fromiter(_degrees.values(), dtype=float, count=len(_degrees))
 
 
 def degree_distribution(degrees: Union[Network, Iterable],
@@ -113,8 +112,8 @@ def degree_distribution(degrees: Union[Network, Iterable],
     cnt: defaultdict = defaultdict(float)
     if isinstance(degrees, BaseModel):
         n = degrees.number_of_nodes()
-        for v in degrees.nodes.uids:
-            cnt[degrees.degrees(weight=weight)[v]] += 1.0 / n
+        for d in degrees.degrees(weight=weight).values():
+            cnt[d] += 1.0 / n
     else:
         n = len(degrees)
         for d in degrees:
@@ -133,13 +132,13 @@ def mean_neighbor_degree(network, weight: Weight = None, exclude_neighbor=False)
     """Calculates the mean (weighted degree of a network)
     """
     neighbor_degrees = []
+    _degrees = network.degrees(weight=weight)
     for v in network.nodes.uids:
         for w in network.successors[v]:
             if exclude_neighbor:
-                neighbor_degrees.append(
-                    network.degrees(weight=weight)[w.uid] - 1)
+                neighbor_degrees.append(_degrees[w.uid] - 1)
             else:
-                neighbor_degrees.append(network.degrees(weight=weight)[w.uid])
+                neighbor_degrees.append(_degrees[w.uid])
     return np.mean(neighbor_degrees)
 
 
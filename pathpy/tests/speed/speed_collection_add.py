@@ -0,0 +1,72 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : speed_collection_add.py -- Scaling of PathPyCollection.add
+# Author    : Pathpy Developers
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+import time
+import pytest
+
+from pathpy import Node, Edge
+from pathpy.core.node import NodeCollection
+from pathpy.core.edge import EdgeCollection
+
+SIZES = [10**3, 10**4, 10**5, 10**6]
+
+
+def add_nodes(nodes):
+    """Add nodes to a NodeCollection"""
+    collection = NodeCollection()
+    for node in nodes:
+        collection.add(node)
+    return len(collection)
+
+
+def add_edges(edges):
+    """Add edges to an EdgeCollection"""
+    collection = EdgeCollection()
+    for edge in edges:
+        collection.add(edge)
+    return len(collection)
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_add_nodes_collection(benchmark, size):
+    """Test the insertion of nodes into a NodeCollection"""
+    nodes = [Node(str(i)) for i in range(size)]
+    result = benchmark.pedantic(add_nodes, args=(nodes,), rounds=1)
+    assert result == size
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_add_edges_collection(benchmark, size):
+    """Test the insertion of edges into an EdgeCollection"""
+    edges = [Edge(str(i), str(i+1)) for i in range(size)]
+    result = benchmark.pedantic(add_edges, args=(edges,), rounds=1)
+    assert result == size
+
+
+def test_add_edges_linear_scaling():
+    """Test that the time per inserted edge does not grow with the size"""
+    times = []
+    for size in (10**4, 10**5):
+        edges = [Edge(str(i), str(i+1)) for i in range(size)]
+        start = time.perf_counter()
+        add_edges(edges)
+        times.append((time.perf_counter() - start) / size)
+
+    # a quadratic insert would be ~10 times slower per edge
+    assert times[1] < 3 * times[0]
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
@@ -0,0 +1,80 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : speed_from_arrays.py -- Scaling of Network.from_arrays
+# Author    : Pathpy Developers
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+import time
+import numpy as np
+import pytest
+
+from pathpy import Network
+
+SIZES = [10**5, 10**6, 10**7]
+
+
+def create_columns(size):
+    """Create the columns of random weighted edges"""
+    rng = np.random.default_rng(0)
+    uids = np.array(['n{}'.format(i) for i in range(size // 10)], dtype=object)
+    return (uids[rng.integers(0, len(uids), size)],
+            uids[rng.integers(0, len(uids), size)],
+            rng.random(size))
+
+
+def from_arrays(v, w, weight):
+    """Create a network from arrays and access its structure"""
+    net = Network.from_arrays(v, w, weight=weight)
+    net.compile()
+    net.degrees()
+    net.adjacency_matrix(weight=True)
+
+    # the structure is served without creating the objects
+    return net.shape if '_packed' in net.__dict__ else None
+
+
+def access(v, w, weight):
+    """Create a network from arrays and create its objects"""
+    net = Network.from_arrays(v, w, weight=weight)
+    return len(net.edges)
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_from_arrays(benchmark, size):
+    """Test the creation of a network from arrays and its first access"""
+    result = benchmark.pedantic(from_arrays, args=create_columns(size),
+                                rounds=1)
+    assert result is not None and result[1] <= size
+
+
+@pytest.mark.parametrize('size', SIZES[:2])
+def test_from_arrays_access(benchmark, size):
+    """Test the creation of the objects on the first access"""
+    result = benchmark.pedantic(access, args=create_columns(size), rounds=1)
+    assert result <= size
+
+
+def test_from_arrays_linear_scaling():
+    """Test that the time per row does not grow with the size"""
+    times = []
+    for size in SIZES[:2]:
+        columns = create_columns(size)
+        start = time.perf_counter()
+        from_arrays(*columns)
+        times.append((time.perf_counter() - start) / size)
+
+    # no objects are created, i.e. 10^7 rows are compiled in seconds
+    assert times[1] < 3 * times[0]
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
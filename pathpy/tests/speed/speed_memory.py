@@ -0,0 +1,97 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : speed_memory.py -- Memory footprint of nodes and edges
+# Author    : Pathpy Developers
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+import tracemalloc
+import pytest
+
+from pathpy import Node, Edge, Network
+
+SIZES = [10**4, 10**5]
+
+# upper bounds of the allocated bytes per object
+BYTES_PER_EDGE = 450
+BYTES_PER_NODE = 450
+
+# upper bound of the allocated bytes per edge stored in a network
+# (incl. the counter, relations and neighbourhood properties of the network)
+# below the 2830 bytes per edge before the index and the interning table
+BYTES_PER_NETWORK_EDGE = 2700
+
+
+def allocated(function, *args):
+    """Return the result and the bytes allocated by a function"""
+    tracemalloc.start()
+    result = function(*args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def create_nodes(size):
+    """Create nodes"""
+    return [Node(str(i)) for i in range(size)]
+
+
+def create_edges(nodes):
+    """Create edges between consecutive nodes"""
+    return [Edge(v, w) for v, w in zip(nodes[:-1], nodes[1:])]
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_bytes_per_node(size):
+    """Test the memory footprint of nodes"""
+    nodes, size = allocated(create_nodes, size)
+    print('bytes per node:', size / len(nodes))
+    assert size / len(nodes) < BYTES_PER_NODE
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_bytes_per_edge(size):
+    """Test the memory footprint of edges"""
+    nodes = create_nodes(size + 1)
+    edges, size = allocated(create_edges, nodes)
+    print('bytes per edge:', size / len(edges))
+    assert size / len(edges) < BYTES_PER_EDGE
+
+
+def test_bytes_per_edge_network():
+    """Test the memory footprint of edges stored in a network"""
+    nodes = create_nodes(10**4 + 1)
+    edges = create_edges(nodes)
+    net = Network()
+    _, size = allocated(net.add_edges, *edges)
+    print('bytes per edge in a network:', size / len(edges))
+    assert net.number_of_edges() == len(edges)
+    assert size / len(edges) < BYTES_PER_NETWORK_EDGE
+
+
+def read_attributes(objs):
+    """Read the attributes of all objects"""
+    for obj in objs:
+        _ = obj.attributes['weight'] if 'weight' in obj.attributes else None
+
+
+def test_bytes_read_attributes():
+    """Test that reading empty attributes does not allocate dicts"""
+    nodes = create_nodes(10**4 + 1)
+    edges = create_edges(nodes)
+    _, size = allocated(read_attributes, edges)
+    print('bytes per edge after reading the attributes:', size / len(edges))
+    assert size / len(edges) < 1
+    assert all(edge._attributes is None for edge in edges)
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
@@ -0,0 +1,112 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : speed_pickle.py -- Speed of the compact pickling of networks
+# Author    : Pathpy Developers
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+import gc
+import pickle
+import time
+import numpy as np
+import pytest
+
+from pathpy import Network
+
+SIZES = [2 * 10**4, 2 * 10**5]
+
+
+def create_network(size):
+    """Create a network with random weighted edges"""
+    rng = np.random.default_rng(0)
+    nodes = size // 4
+    net = Network.from_arrays(rng.integers(0, nodes, size).astype(str),
+                              rng.integers(0, nodes, size).astype(str),
+                              weight=rng.random(size))
+
+    # the stores of the network are built on access
+    _ = net.edges
+    return net
+
+
+def round_trip(data):
+    """Unpickle a network and access its structure"""
+    net = pickle.loads(data)
+    net.compile()
+    net.degrees()
+
+    # the structure is served from the packed state
+    return net.shape if '_packed' in net.__dict__ else None
+
+
+def rebuild(data):
+    """Unpickle a network and rebuild its stores"""
+    net = pickle.loads(data)
+    return len(net.edges)
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_dumps_network(benchmark, size):
+    """Test the compact pickling of a network"""
+    net = create_network(size)
+    data = benchmark.pedantic(pickle.dumps, args=(net,), rounds=1)
+    assert pickle.loads(data).shape == net.shape
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_loads_network(benchmark, size):
+    """Test the unpickling of a network (the stores are rebuilt on access)"""
+    data = pickle.dumps(create_network(size))
+    net = benchmark.pedantic(pickle.loads, args=(data,), rounds=1)
+    assert '_packed' in net.__dict__
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_round_trip_network(benchmark, size):
+    """Test the unpickling of a network and the access of its structure"""
+    net = create_network(size)
+    data = pickle.dumps(net)
+    result = benchmark.pedantic(round_trip, args=(data,), rounds=1)
+    assert result == net.shape
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_rebuild_network(benchmark, size):
+    """Test the unpickling of a network including the rebuild of its stores"""
+    net = create_network(size)
+    data = pickle.dumps(net)
+    result = benchmark.pedantic(rebuild, args=(data,), rounds=1)
+    assert result == net.number_of_edges()
+
+
+def test_round_trip_network_default():
+    """Test that the round trip is 10x faster than the default unpickling"""
+    net = create_network(SIZES[0])
+    compact = pickle.dumps(net)
+    default = pickle.dumps(object.__reduce_ex__(net, 4))
+
+    # the objects of the previous tests should not be collected in between
+    gc.collect()
+    start = time.perf_counter()
+    pickle.loads(default)
+    expected = time.perf_counter() - start
+
+    gc.collect()
+    start = time.perf_counter()
+    round_trip(compact)
+    result = time.perf_counter() - start
+
+    print('round trip vs default unpickling:', result / expected)
+    assert 10 * result < expected
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
@@ -0,0 +1,68 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : speed_temporal_io.py -- Scaling of temporal data frame imports
+# Author    : Pathpy Developers
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+import time
+import numpy as np
+import pandas as pd
+import pytest
+
+import pathpy as pp
+
+SIZES = [10**4, 10**5]
+
+# number of nodes and of distinct timestamps of the events
+NUMBER_OF_NODES = 2000
+NUMBER_OF_TIMESTAMPS = 10
+
+
+def create_events(size, timestamps=NUMBER_OF_TIMESTAMPS):
+    """Create a data frame of random events at repeated timestamps"""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'v': rng.integers(0, NUMBER_OF_NODES, size).astype(str),
+        'w': rng.integers(0, NUMBER_OF_NODES, size).astype(str),
+        'timestamp': rng.integers(0, timestamps, size)})
+
+
+def read_events(df, events):
+    """Read a temporal network from a data frame"""
+    return pp.io.to_temporal_network(df, events=events).number_of_edges()
+
+
+@pytest.mark.parametrize('events', ('tree', 'columnar'))
+@pytest.mark.parametrize('size', SIZES)
+def test_read_temporal_network(benchmark, size, events):
+    """Test the import of events at repeated timestamps"""
+    df = create_events(size)
+    result = benchmark.pedantic(read_events, args=(df, events), rounds=1)
+    assert result <= NUMBER_OF_NODES**2
+
+
+@pytest.mark.parametrize('events', ('tree', 'columnar'))
+def test_read_temporal_network_linear_scaling(events):
+    """Test that the time per event does not grow with repeated timestamps"""
+    times = []
+    for size in (10**4, 5 * 10**4):
+        df = create_events(size)
+        start = time.perf_counter()
+        read_events(df, events)
+        times.append((time.perf_counter() - start) / size)
+
+    # a quadratic insert would be ~5 times slower per event
+    assert times[1] < 2.5 * times[0]
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End:
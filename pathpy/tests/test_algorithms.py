@@ -48,6 +48,14 @@ def test_adjacency_matrix():
     assert A2[n['a'], n['b']] == 1.0
     assert A2[n['b'], n['c']] == 1.0
 
+    # the weights follow changes of the edge attributes
+    net.edges['a', 'b']['weight'] = 2.5
+    net.edges['b', 'c']['length'] = 4
+    A3 = net.adjacency_matrix(weight='weight')
+    assert A3[n['a'], n['b']] == 2.5
+    assert A3[n['b'], n['c']] == 1.0
+    assert net.adjacency_matrix(weight='length')[n['b'], n['c']] == 4.0
+
 
 def test_distance_matrix():
     """Test the distance matrix of a network."""
@@ -185,7 +193,84 @@ def test_largest_connected_component():
     net.add_edge('b', 'c')
     net.add_edge('x', 'y')
     lcc = pp.algorithms.components.largest_connected_component(net)
-    # print(lcc)
+    assert lcc.shape == (3, 2)
+
+    # the component is independent of the network
+    assert lcc.nodes['a'] is not net.nodes['a']
+    assert lcc.edges['a', 'b'].v is lcc.nodes['a']
+    lcc.edges['a', 'b']['weight'] = 5
+    assert net.edges['a', 'b']['weight'] is None
+
+
+def test_incremental_components():
+    """Test the incrementally updated components."""
+    net = Network(directed=False)
+    net.add_edge('a', 'b')
+    components = pp.algorithms.IncrementalComponents(net)
+    assert components.number_of_components() == 1
+
+    net.add_edges(('b', 'c'), ('x', 'y'))
+    net.add_node('z')
+    assert sorted(components.component_sizes()) == [1, 2, 3]
+    assert components.component('a') == components.component('c')
+
+    net.add_edge('c', 'x')
+    assert components.largest_component_size() == 5
+
+    net.remove_edge('c', 'x')
+    assert sorted(map(len, components.components().values())) == [1, 2, 3]
+
+    net.remove_node('z')
+    assert components.number_of_components() == 2
+
+    components.close()
+    net.add_edge('y', 'w')
+    assert components.largest_component_size() == 3
+    assert 'w' not in components._parent
+
+
+@pytest.mark.parametrize('events', ('tree', 'columnar'))
+def test_rolling_time_window(events):
+    """Test the incremental rolling time window."""
+    tn = pp.TemporalNetwork(events=events)
+    tn.add_edge('a', 'b', timestamp=1)
+    tn.add_edge('b', 'c', timestamp=2)
+    tn.add_edge('a', 'b', timestamp=3)
+    tn.add_edge('c', 'd', timestamp=5, color='red')
+    tn.add_edge('a', 'b', timestamp=7)
+
+    windows = pp.algorithms.RollingTimeWindow(
+        tn, window_size=3, step_size=2, return_window=True)
+    for net, (start, end) in windows:
+        if ('c', 'd') in net.edges:
+            assert net.edges['c', 'd']['color'] == 'red'
+            assert net.edges['c', 'd']['start'] == 5
+        ref = Network.from_temporal_network(tn, min_time=start, max_time=end)
+        assert set(net.nodes.keys()) == set(ref.nodes.keys())
+        assert {(e.v.uid, e.w.uid) for e in net.edges} == \
+            {(e.v.uid, e.w.uid) for e in ref.edges}
+        if start == 1:
+            assert net.edges.counter[net.edges['a', 'b'].uid] == 2
+
+    # the networks of earlier steps are not changed by later steps
+    windows = list(pp.algorithms.RollingTimeWindow(
+        tn, window_size=3, step_size=2, return_window=True))
+    assert [w for _, w in windows] == [[1, 4], [3, 6], [5, 8]]
+    assert len({id(net) for net, _ in windows}) == 3
+    for net, (start, end) in windows:
+        ref = Network.from_temporal_network(tn, min_time=start, max_time=end)
+        assert {(e.v.uid, e.w.uid) for e in net.edges} == \
+            {(e.v.uid, e.w.uid) for e in ref.edges}
+    assert [sorted((e.v.uid, e.w.uid, net.edges.counter[e.uid])
+                   for e in net.edges) for net, _ in windows] == [
+                       [('a', 'b', 2), ('b', 'c', 1)],
+                       [('a', 'b', 1), ('c', 'd', 1)],
+                       [('a', 'b', 1), ('c', 'd', 1)]]
+
+    snapshots = list(pp.algorithms.RollingTimeWindow(
+        tn, window_size=3, step_size=2, compiled=True))
+    assert [s.shape for s in snapshots] == [(4, 2)] * 3
+    assert snapshots[0].count.tolist() == [2, 1]
 
 # =============================================================================
 # eof
@@ -8,6 +8,9 @@
 # Copyright (c) 2016-2021 Pathpy Developers
 # =============================================================================
 
+import gc
+import pickle
+from copy import deepcopy
 import pytest
 from collections import Counter
 from pathpy.core.core import (
@@ -242,6 +245,189 @@ def test_PathPyCollection_iadd():
 
     c1 += c3
     assert c1.counter['ab'] == 30
+
+
+def test_PathPyCollection_index():
+    """Test the index of the collection"""
+    col = PathPyCollection()
+    for uid in 'abcd':
+        col.add(uid, uid=uid)
+
+    # the index is only built on the first read
+    assert not col._index_valid and not col._inverse
+
+    index = col.index
+    assert dict(index) == {'a': 0, 'b': 1, 'c': 2, 'd': 3}
+    assert list(col.inverse_index) == ['a', 'b', 'c', 'd']
+    assert col.inverse_index[2] == 'c'
+
+    with pytest.raises(TypeError):
+        index['x'] = 4
+
+    col.add('e', uid='e')
+    assert index['e'] == 4
+
+    # the elements after a removed element move up
+    col.remove('e')
+    col.remove('b')
+    assert col._index_hole == 1
+    assert dict(col.index) == {'a': 0, 'c': 1, 'd': 2}
+    assert index['d'] == 2
+    assert list(col.inverse_index) == ['a', 'c', 'd']
+    assert list(index) == ['a', 'c', 'd']
+    assert col._index_hole is None
+
+    # several removals are compacted at once
+    col.add('b', uid='b')
+    col.remove('a')
+    col.remove('d')
+    col.add('e', uid='e')
+    assert col.index == {'c': 0, 'b': 1, 'e': 2}
+    assert list(col.inverse_index) == list(col.keys())
+
+    # the columns follow the order of the index
+    col['c']['size'], col['e']['size'] = 1, 3
+    assert col.attrs['size'][0] == 1 and col.attrs['size'][2] == 3
+
+
+def test_PathPyCollection_extend():
+    """Test to add a batch of objects"""
+    paths = PathPyCollection()
+    p1 = PathPyPath('a', 'b', uid='p1')
+    p2 = PathPyPath('b', 'c', uid='p2')
+    p3 = PathPyPath('a', 'b')
+    paths.extend([p1, p2, p1, p3])
+
+    assert len(paths) == 2
+    assert paths.counter['p1'] == 3
+    assert list(paths.index) == ['p1', 'p2']
+
+    # the batch is validated before any object is added
+    with pytest.raises(KeyError):
+        paths.extend([PathPyPath('c', 'd', uid='p4'),
+                      PathPyPath('a', 'c', uid='p2')])
+    assert len(paths) == 2 and 'p4' not in paths
+
+    with pytest.raises(KeyError):
+        paths.extend([PathPyPath('a', 'b', uid='p5')])
+
+    with pytest.raises(AttributeError):
+        paths.extend([p1], validate='unknown')
+
+    paths.extend([p1], validate='eager', count=2)
+    assert paths.counter['p1'] == 5
+
+    # unchecked objects are all added
+    paths = PathPyCollection()
+    paths.add(p1, p2, checking=False)
+    assert len(paths) == 2
+
+
+def test_PathPyCollection_restore():
+    """Test to fill an empty collection in one pass"""
+    objs = [PathPyPath('a', 'b', uid='p1'), PathPyPath('b', 'a', uid='p2'),
+            PathPyPath('b', 'c', uid='p3')]
+
+    added = PathPyCollection(directed=False, multiple=True)
+    for obj, count in zip(objs, (1, 2, 3)):
+        added.add(obj, count=count)
+
+    restored = PathPyCollection(directed=False, multiple=True)
+    restored._restore(objs, [1, 2, 3])
+
+    assert list(restored.index) == list(added.index)
+    assert restored.counter == added.counter
+    assert restored.counter['b', 'c'] == 3
+    assert restored['a', 'b'] == added['a', 'b'] == {objs[0], objs[1]}
+    assert dict(restored._mapping) == dict(added._mapping)
+    assert restored.nodes == added.nodes
+
+    # the restored collection can be changed as usual
+    restored.remove(objs[0])
+    assert restored['a', 'b'] == {objs[1]}
+    assert list(restored.index) == ['p2', 'p3']
+
+
+def test_PathPyRelation_key():
+    """Test the canonical keys of the relations"""
+    assert PathPyRelation.key(('b', 'a')) == ('b', 'a')
+    assert PathPyRelation.key(('b', 'a'), directed=False) == ('a', 'b')
+    assert PathPyRelation.key(('c', 'b', 'a'), directed=False) == (
+        'a', 'b', 'c')
+    assert PathPyRelation.key(('b', 'a'), ordered=False) == {'a', 'b'}
+
+    paths = PathPyCollection(directed=False)
+    p1 = PathPyPath('a', 'b', uid='p1', directed=False)
+    p2 = PathPyPath('b', 'c', uid='p2', directed=False)
+    paths.add(p1, p2)
+
+    # relations are interned with dense integer keys
+    assert paths._key(('b', 'a')) == paths._key(('a', 'b')) == 0
+    assert paths._key(('c', 'b')) == 1
+    assert paths._key(('a', 'c')) is None
+
+    assert ('b', 'a') in paths and ('a', 'c') not in paths
+    assert paths['b', 'a'] == p1
+    assert paths.counter['c', 'b'] == 1
+
+    # keys are dropped with the last object of a relation
+    paths.remove(p1)
+    assert ('a', 'b') not in paths
+    assert paths._key(('a', 'b')) is None
+    paths.add(p1)
+    assert paths['a', 'b'] == p1
+    assert paths._key(('a', 'b')) == 2
+
+    # the table does not grow if relations are added and removed (churn)
+    for i in range(100):
+        path = PathPyPath('x', str(i), uid='x' + str(i), directed=False)
+        paths.add(path)
+        paths.remove(path)
+    assert len(paths._keys) == len(paths._relations) == 2
+
+    # snapshots keep their keys if relations are removed on the other side
+    snapshot = paths._snapshot()
+    paths.remove(p2)
+    assert snapshot['c', 'b'] == p2 and snapshot.counter['b', 'c'] == 1
+    assert ('b', 'c') not in paths and paths._key(('b', 'c')) is None
+
+
+def test_PathPyCollection_attribute_log():
+    """Test the log of the attribute changes of a collection"""
+    col = PathPyCollection()
+    p1 = PathPyPath('a', 'b', uid='p1', color='red')
+    p2 = PathPyPath('b', 'c', uid='p2')
+    col.add(p1, p2)
+
+    # objects do not log their changes without a consumer
+    p1['color'] = 'blue'
+    assert p1._logs is None and col._changes.position == 0
+
+    assert list(col.attrs['color']) == ['blue', None]
+    p2['color'] = 'green'
+    assert col._changes.position == 1
+    assert list(col.attrs['color']) == ['blue', 'green']
+
+    # removed objects are no longer observed
+    col.remove(p2)
+    assert p2._logs is None
+
+    # the objects do not keep the collection alive
+    ref = col._log_ref
+    del col
+    gc.collect()
+    assert ref() is None
+    p1['color'] = 'red'
+    assert p1._logs is None
+
+    # the refs to the logs are neither copied nor pickled
+    other = PathPyCollection()
+    other.add(p1)
+    assert other.attrs['color'][0] == 'red'
+    for obj in (deepcopy(p1), pickle.loads(pickle.dumps(p1))):
+        assert obj._logs is None and obj['color'] == 'red'
+
+
 # =============================================================================
 # eof
 #
@@ -65,6 +65,23 @@ def test_dag_node_creation():
     dag.add_edge('a', 'b')
     assert dag.nodes['b'] in dag.successors['a']
 
+def test_dag_remove_node():
+    """Test roots and leafs after removing nodes."""
+    dag = DirectedAcyclicGraph()
+    dag.add_edge('a', 'b')
+    dag.add_edge('b', 'c')
+    dag.add_node('d')
+
+    assert dag.roots == {dag.nodes['a'], dag.nodes['d']}
+    assert dag.leafs == {dag.nodes['c'], dag.nodes['d']}
+
+    dag.remove_node('a')
+    dag.remove_node('d')
+
+    assert dag.roots == {dag.nodes['b']}
+    assert dag.leafs == {dag.nodes['c']}
+
+
 def test_from_temporal_network():
     """Test converter from temporal networks"""
     tn = TemporalNetwork()
@@ -9,6 +9,7 @@
 # =============================================================================
 
 import pytest
+import numpy as np
 
 from pathpy import Edge, Node
 from pathpy.core.edge import EdgeCollection
@@ -80,6 +81,15 @@ def test_setitem(nodes):
 
     assert vw['capacity'] == 5.5
 
+    # the attribute dict is only stored on the first write
+    vw = Edge(v, w)
+    assert vw.attributes == {}
+    assert vw._attributes is None
+
+    vw.attributes['capacity'] = 2
+    assert vw['capacity'] == 2
+    assert vw.attributes == {'capacity': 2}
+
 
 def test_getitem(nodes):
     """Test the extraction of attributes."""
@@ -337,6 +347,42 @@ def test_EdgeCollection_undirected():
     assert ('a', 'b') in edges
     assert ('b', 'a') in edges
 
+
+def test_EdgeCollection_lookup_many():
+    """Test the batch lookup of edges"""
+    a, b, c = Node('a'), Node('b'), Node('c')
+    edges = EdgeCollection(directed=False)
+    edges.add(Edge(a, b, uid='ab'))
+    edges.add(Edge(b, c, uid='bc', weight=3))
+    edges.counter['bc'] += 1
+    pairs = [('b', 'a'), (c, b), ('a', 'c')]
+
+    assert list(edges.lookup_many(pairs)) == [0, 1, -1]
+    assert list(edges.lookup_many(pairs, values='uid')) == ['ab', 'bc', None]
+    assert list(edges.lookup_many(pairs, values='count')) == [1, 2, 0]
+    assert list(edges.lookup_many(pairs[:2], values='weight')) == [1.0, 3.0]
+
+    # pairs of integer indices
+    uids = ['a', 'b', 'c']
+    assert list(edges.lookup_many([[2, 1], [0, 2]], nodes=uids)) == [1, -1]
+
+    with pytest.raises(AttributeError):
+        edges.lookup_many(pairs, values='unknown')
+
+    # the first of multiple edges is returned
+    edges = EdgeCollection(multiedges=True)
+    edges.add(Edge(a, b, uid='x'))
+    edges.add(Edge(a, b, uid='y'))
+    assert list(edges.lookup_many([('a', 'b'), ('b', 'a')])) == [0, -1]
+    assert list(edges.lookup_many(np.array([['a', 'b'], ['a', 'x']]),
+                                  values='uid')) == ['x', None]
+
+    # the keys follow added and removed edges
+    edges.remove('x')
+    assert list(edges.lookup_many([('a', 'b')], values='uid')) == ['y']
+    assert list(EdgeCollection().lookup_many([('a', 'b')])) == [-1]
+
+
 # =============================================================================
 # eof
 #
@@ -346,3 +392,10 @@ def test_EdgeCollection_undirected():
 # mode: auto-fill
 # fill-column: 79
 # End:
+
+    # an empty batch returns an empty result of the requested values
+    for values, dtype in (('index', np.int64), ('uid', object),
+                          ('count', np.int64), ('weight', float)):
+        result = edges.lookup_many([], values=values)
+        assert len(result) == 0 and result.dtype == dtype
+    assert len(edges.lookup_many([], nodes=uids)) == 0
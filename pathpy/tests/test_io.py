@@ -9,6 +9,7 @@
 # =============================================================================
 
 import pytest
+import pandas as pd
 from pathpy import Network, TemporalNetwork
 import pathpy as pp
 
@@ -35,30 +36,35 @@ import pathpy as pp
 #     assert net.number_of_edges() == 701
 
 
-def test_sql_write_network():
+def test_sql_write_network(tmp_path):
     """Write network to sql database."""
     net = Network()
     net.add_edges(('a', 'b'), ('a', 'c'))
-    pp.io.sql.write(net, filename='network.db',
+    pp.io.sql.write(net, filename=str(tmp_path / 'network.db'),
                     table='test', if_exists='replace')
 
-    net = pp.io.sql.read_network(db_file='network.db', table='test')
+    net = pp.io.sql.read_network(db_file=str(tmp_path / 'network.db'),
+                                 table='test')
 
     assert isinstance(net, Network)
     assert net.number_of_nodes() == 3
     assert net.number_of_edges() == 2
 
 
-def test_csv_write_network():
+def test_csv_write_network(tmp_path):
     """Write network to csv."""
     net = Network()
     net.add_edges(('a', 'b'), ('a', 'c'))
-    pp.io.csv.write(net, 'network.csv')
+    pp.io.csv.write(net, str(tmp_path / 'network.csv'))
 
 
-def test_csv_read_network():
+def test_csv_read_network(tmp_path):
     """Read network from csv."""
-    net = pp.io.csv.read_network('network.csv')
+    net = Network()
+    net.add_edges(('a', 'b'), ('a', 'c'))
+    pp.io.csv.write(net, str(tmp_path / 'network.csv'))
+
+    net = pp.io.csv.read_network(str(tmp_path / 'network.csv'))
 
     assert isinstance(net, Network)
     assert net.number_of_nodes() == 3
@@ -94,6 +100,67 @@ def test_pandas_temporal():
     te2 = len([e for e in tn2.edges[:]])
     assert te1 == te2
 
+
+@pytest.mark.parametrize('events', ('tree', 'columnar'))
+def test_pandas_temporal_bulk(events):
+    """Read temporal networks from data frames in bulk."""
+    df = pd.DataFrame({'v': ['a', 'b', 'a', 'c'], 'w': ['b', 'c', 'b', 'a'],
+                       'timestamp': [1, 2, 3, 3], 'color': ['r', 'g', 'b', 'r']})
+    tn = pp.io.to_temporal_network(df, events=events)
+    assert tn.shape == (3, 3)
+    assert tn.edges.columnar == (events == 'columnar')
+    # the order of events with the same times depends on the backend
+    rows = [(e.start, e.end, e.v.uid, e.w.uid, e.attributes['color'])
+            for e in tn.edges[:]]
+    assert rows == sorted(rows, key=lambda row: row[:2])
+    assert sorted(rows) == [
+        (1, 2, 'a', 'b', 'r'), (2, 3, 'b', 'c', 'g'),
+        (3, 4, 'a', 'b', 'b'), (3, 4, 'c', 'a', 'r')]
+    assert tn.edges['a', 'b']['color'] == 'b'
+    assert (tn.start, tn.end) == (1, 4)
+
+    df = pd.DataFrame({'v': ['a', 'b'], 'w': ['b', 'a'], 'timestamp': [1, 2]})
+    tn = pp.io.to_temporal_network(df, directed=False, events=events)
+    assert tn.shape == (2, 1)
+    assert len(tn.edges.events) == 2
+
+    df = pd.DataFrame({'v': ['a', 'b'], 'w': ['b', 'c'],
+                       'start': ['2021-01-01', '2021-01-02 12:00'],
+                       'duration': [60, 30]})
+    tn = pp.io.to_temporal_network(df, events=events)
+    edge = tn.edges['b', 'c']
+    assert edge.attributes['start'] == '2021-01-02 12:00'
+    assert tn.end == pd.Timestamp('2021-01-02 12:00:30')
+
+
+@pytest.mark.parametrize('events', ('tree', 'columnar'))
+@pytest.mark.parametrize('frame', (
+    {'timestamp': [1, 2, 3, 4], 'color': ['r', 'g', 'b', 'r']},
+    {'start': [1.0, 2.0, 3.0, 1.0], 'end': [2.0, 4.0, 5.0, 3.0]},
+    {'timestamp': [1, 2, 3, 4], 'duration': [2, 1, 1, 5]},
+))
+def test_pandas_temporal_bulk_rows(events, frame):
+    """Compare the bulk import with the import of single rows."""
+    df = pd.DataFrame({'v': ['a', 'b', 'a', 'c'], 'w': ['b', 'c', 'b', 'a'],
+                       **frame})
+    bulk = pp.io.to_temporal_network(df, events=events)
+
+    rows = TemporalNetwork(events=events)
+    for row in df.to_dict(orient='records'):
+        rows.add_edge(row.pop('v'), row.pop('w'), **row)
+
+    def edges(net):
+        return {(e.v.uid, e.w.uid): dict(e.attributes) for e in net.edges}
+
+    def temporal_edges(net):
+        return sorted((e.v.uid, e.w.uid, e.start, e.end, e['color'])
+                      for e in net.edges[:])
+
+    assert edges(bulk) == edges(rows)
+    assert edges(bulk)['b', 'c'] == {key: values[1]
+                                     for key, values in frame.items()}
+    assert temporal_edges(bulk) == temporal_edges(rows)
+
 # =============================================================================
 # eof
 #
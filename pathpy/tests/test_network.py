@@ -12,6 +12,8 @@ import pytest
 import pathpy as pp
 import numpy as np
 import random
+import pickle
+from copy import deepcopy
 from pathpy import Node, Edge, Network
 # Test network
 # ------------
@@ -458,6 +460,506 @@ def test_remove_node():
     assert net.shape == (4, 3)
 
 
+def test_remove_nodes_and_edges():
+    """Test to remove multiple nodes and edges in one sweep."""
+
+    net = Network(directed=True)
+    net.add_edges(('a', 'b'), ('a', 'c'), ('b', 'd'), ('b', 'e'),
+                  ('d', 'b'), ('d', 'e'), ('e', 'd'))
+    net.edges['d', 'e']['weight'] = 3
+    net.indegrees(weight=True)
+
+    net.remove_nodes('b', net.nodes['c'], 'x')
+    assert net.shape == (3, 2)
+    assert net.successors['a'] == set()
+    assert net.degrees() == {'a': 0, 'd': 2, 'e': 2}
+    assert net.indegrees(weight=True) == {'a': 0, 'd': 1.0, 'e': 3.0}
+
+    # the properties of the removed nodes are deleted
+    assert all(n.uid in net.nodes.keys() for n in net._properties['degrees'])
+
+    net.remove_edges(('d', 'e'), net.edges['e', 'd'], 'x')
+    assert net.shape == (3, 0)
+    assert net.degrees() == {'a': 0, 'd': 0, 'e': 0}
+
+    # two nodes are the pair of nodes of an edge
+    net = Network()
+    net.add_edges(('a', 'b'), ('b', 'c'), uid=None)
+    net.remove_edges('a', 'b')
+    assert net.shape == (3, 1)
+    net.remove_edges(net.nodes['b'], net.nodes['c'])
+    assert net.shape == (3, 0)
+
+    net.add_edge('a', 'b', uid='a-b')
+    net.add_edge('b', 'c', uid='b-c')
+    net.remove_edges('a-b', 'b-c')
+    assert net.shape == (3, 0)
+
+    with pytest.raises(AttributeError):
+        net.remove_edges(net.nodes['a'])
+
+
+def test_edge_change_log():
+    """Test the pending changes used to update the network properties."""
+    net = Network()
+    net.add_edge('a', 'b', uid='a-b')
+    net.add_edge('b', 'c', uid='b-c', update_properties=False)
+
+    assert net.successors['b'] == set()
+    assert list(net.edges._added) == [net.edges['b-c']]
+
+    net.remove_edge('a-b')
+    net._add_edge_properties()
+
+    assert not net.edges._added and not net.edges._removed
+    assert net.successors['a'] == set()
+    assert net.successors['b'] == {net.nodes['c']}
+    assert net.degrees() == {'a': 0, 'b': 1, 'c': 1}
+
+    # adding and removing before the update cancels out
+    net.add_edge('c', 'd', uid='c-d', update_properties=False)
+    net.edges.remove('c-d')
+    assert not net.edges._added and not net.edges._removed
+
+
+def test_property_views():
+    """Test the read-only views of the network properties."""
+    net = Network()
+    net.add_edge('a', 'b', uid='a-b')
+
+    successors = net.successors
+    assert successors is net.successors
+    assert successors['a'] == {net.nodes['b']}
+    assert successors == {'a': {net.nodes['b']}, 'b': set()}
+    assert len(successors) == 2 and 'c' not in successors
+
+    net.add_edge('b', 'c', uid='b-c')
+    assert successors['b'] == {net.nodes['c']}
+    assert set(successors) == {'a', 'b', 'c'}
+    assert net.incident_edges['b'] == {net.edges['a-b'], net.edges['b-c']}
+
+    with pytest.raises(KeyError):
+        successors['x']
+
+    with pytest.raises(TypeError):
+        successors['a'] = set()
+
+    # the values are read-only and reading does not insert properties
+    net.add_node('x')
+    size = len(net._properties['successors'])
+    assert len(successors['x']) == 0
+    assert len(net._properties['successors']) == size
+    assert not hasattr(successors['a'], 'add')
+    assert successors['a'] | {'y'} == {net.nodes['b'], 'y'}
+
+    snap = net.snapshot()
+    with pytest.raises(AttributeError):
+        snap.successors['a'].add(net.nodes['c'])
+    assert successors['a'] == {net.nodes['b']}
+
+
+def test_index_removal():
+    """Test the index of the network after removing nodes and edges."""
+    net = Network()
+    net.add_edges(('a', 'b'), ('b', 'c'), ('c', 'd'), ('d', 'a'))
+    net.edges['c', 'd']['weight'] = 3
+    net.remove_node('b')
+
+    # the index keeps the order of the nodes
+    assert list(net.nodes.inverse_index) == ['a', 'c', 'd']
+    assert list(net.nodes.index.values()) == [0, 1, 2]
+    assert list(net.nodes.inverse_index) == list(net.nodes.keys())
+
+    csr = net.compile()
+    assert list(csr.uids) == ['a', 'c', 'd']
+    assert list(csr.edge_uids) == list(net.edges.inverse_index)
+    assert {(csr.uids[v], csr.uids[w]) for v, w in zip(csr.v, csr.w)} == \
+        {('c', 'd'), ('d', 'a')}
+    assert list(pp.statistics.degrees.degree_sequence(net)) == [1, 1, 2]
+    assert list(net.edges.weights()) == [
+        net.edges[uid].weight() for uid in net.edges.inverse_index]
+
+    # the index is kept by the compact pickle
+    other = pickle.loads(pickle.dumps(net))
+    assert list(other.nodes.inverse_index) == ['a', 'c', 'd']
+    assert list(other.edges.inverse_index) == list(net.edges.inverse_index)
+
+
+def test_compile():
+    """Test the compiled snapshot of the network."""
+    net = Network()
+    net.add_edges(('a', 'b'), ('b', 'c'), ('a', 'c'))
+    net.edges['a', 'c']['weight'] = 2
+
+    csr = net.compile()
+    assert csr is net.csr
+    assert csr.shape == (3, 3)
+    assert list(csr.uids) == ['a', 'b', 'c']
+    assert list(csr.indptr) == [0, 2, 3, 3]
+    assert set(csr.uids[csr.successors(0)]) == {'b', 'c'}
+    assert list(csr.uids[csr.predecessors(2)]) == ['b', 'a']
+    assert list(csr.weight) == [1.0, 1.0, 2.0]
+    assert list(csr.outdegrees()) == [2, 1, 0]
+
+    with pytest.raises(ValueError):
+        csr.v[0] = 1
+
+    # changes of the counts or the structure invalidate the snapshot
+    net.edges.counter[net.edges['a', 'b'].uid] += 1
+    assert net.compile() is not csr
+    assert list(net.compile().count) == [2.0, 1.0, 1.0]
+
+    # changes of the weights invalidate the snapshot, other attributes not
+    csr = net.compile()
+    net.edges['b', 'c']['color'] = 'red'
+    assert net.compile() is csr
+    net.edges['b', 'c']['weight'] = 3
+    assert net.compile() is not csr
+    assert list(net.compile().weight) == [1.0, 3.0, 2.0]
+
+    csr = net.compile()
+    net.remove_edge('a', 'b')
+    assert net.compile() is not csr
+    assert list(net.compile().indptr) == [0, 1, 2, 2]
+
+    net = Network(directed=False)
+    net.add_edges(('a', 'b'), ('b', 'b'))
+    csr = net.compile()
+    assert list(csr.indptr) == [0, 1, 3]
+    assert sorted(csr.successors(1)) == [0, 1]
+
+
+def test_compile_share():
+    """Test to share the compiled network via shared memory."""
+    net = Network()
+    net.add_edges(('a', 'b'), ('b', 'c'), ('a', 'c'))
+    net.edges['a', 'c']['weight'] = 2
+    csr = net.compile()
+
+    with csr.share(size=np.array([1, 2, 3])) as shared:
+        # the handle is passed to the workers
+        other = pickle.loads(pickle.dumps(shared))
+        assert other.name == shared.name
+        assert other.attributes == ('size',)
+
+        attached = other.attach()
+        assert attached is other.attach()
+        assert attached.shape == (3, 3)
+        assert list(attached.uids) == ['a', 'b', 'c']
+        assert list(attached.edge_uids) == list(csr.edge_uids)
+        assert attached.index == csr.index
+        assert list(attached.weight) == [1.0, 1.0, 2.0]
+        assert list(attached.successors(0)) == list(csr.successors(0))
+        assert list(other['size']) == [1, 2, 3]
+
+        with pytest.raises(ValueError):
+            attached.v[0] = 1
+        with pytest.raises(KeyError):
+            other['color']
+        with pytest.raises(AttributeError):
+            other.unlink()
+
+        del attached
+        other.close()
+
+    with pytest.raises(AttributeError):
+        csr.share(color=np.array(['red', None, 'blue'], dtype=object))
+
+    # the uids are stored as bytes and not as fixed-width strings
+    net = Network()
+    net.add_edge('a', 'b' * 1000)
+    with net.compile().share() as shared:
+        assert all(dtype[1] != 'U' for _, dtype, _ in shared._layout.values())
+        other = pickle.loads(pickle.dumps(shared))
+        assert list(other.attach().uids) == ['a', 'b' * 1000]
+        other.close()
+
+
+def test_from_arrays():
+    """Test to create a network from arrays."""
+    net = Network.from_arrays(np.array(['a', 'b', 'a']),
+                              np.array(['b', 'c', 'b']),
+                              weight=np.array([1., 2., 3.]))
+    assert net.shape == (3, 2)
+    assert list(net.nodes.keys()) == ['a', 'b', 'c']
+    assert net.edges['a', 'b']['weight'] == 3.0
+    assert net.edges.counter[net.edges['a', 'b'].uid] == 2
+    assert net.successors['a'] == {net.nodes['b']}
+    assert net.degrees() == {'a': 1, 'b': 2, 'c': 1}
+    assert net.edges['a', 'b'].has_python_uid
+
+    # the objects are created when the network is accessed
+    net = Network.from_arrays(['a', 'b'], ['b', 'c'], weight=[1., 2.])
+    assert '_packed' in net.__dict__
+    net.add_edge('c', 'a')
+    assert '_packed' not in net.__dict__
+    assert net.shape == (3, 3)
+    assert list(net.edges.attrs['weight'][:2]) == [1., 2.]
+
+    net = Network.from_arrays([1, 2, 1], [2, 1, 2], directed=False,
+                              count=[2, 3, 4], attributes={'x': [1, 2, 3]})
+    assert net.shape == (2, 1)
+    assert net.edges['2', '1']['x'] == 3
+    assert net.edges.counter[net.edges['1', '2'].uid] == 9
+
+    net = Network.from_arrays([0, 1, 0], [1, 0, 1], nodes=['a', 'b', 'c'],
+                              multiedges=True, edge_uids=['x', 'y', 'z'])
+    assert net.shape == (3, 3)
+    assert list(net.edges.keys()) == ['x', 'y', 'z']
+    assert net.outdegrees() == {'a': 2, 'b': 1, 'c': 0}
+
+    net = Network.from_edge_index(np.array([[0, 1], [1, 2]]),
+                                  nodes=['a', 'b', 'c'], directed=False)
+    assert net.neighbors['b'] == {net.nodes['a'], net.nodes['c']}
+
+    # nodes with the same uid are merged
+    a = Node('a')
+    net = Network.from_arrays([1, 0, 2], [0, 1, 1], nodes=[a, 'b', a],
+                              directed=False)
+    assert net.shape == (2, 1)
+    assert net.nodes['a'] is a
+    assert net.edges.counter[net.edges['a', 'b'].uid] == 3
+
+    # the structure is compiled from the columns without creating objects
+    for directed in (True, False):
+        columns = (['a', 'b', 'a', 'c'], ['b', 'c', 'b', 'c'])
+        net = Network.from_arrays(*columns, weight=[1., None, 3., 4.],
+                                  directed=directed)
+        other = Network.from_arrays(*columns, weight=[1., None, 3., 4.],
+                                    directed=directed)
+        other._rebuild()
+        csr = net.compile()
+        assert net.shape == other.shape == (3, 3)
+        assert net.degrees() == other.degrees()
+        assert net.indegrees() == other.indegrees()
+        assert net.outdegrees() == other.outdegrees()
+        assert (net.adjacency_matrix(weight=True) !=
+                other.adjacency_matrix(weight=True)).nnz == 0
+        assert list(csr.weight) == list(other.compile().weight)
+        assert list(csr.count) == list(other.compile().count)
+        assert '_packed' in net.__dict__
+
+        # the python uids of the edges are requested from the network
+        assert list(csr.edge_uids) == list(net.edges.keys())
+        assert net.compile() is csr
+        net.add_edge('c', 'd')
+        assert net.compile().shape == (4, 4)
+
+    # observers are not notified about the created edges
+    added: list = []
+    net = Network.from_arrays(['a', 'b'], ['b', 'c'])
+    net.subscribe('add_edge', lambda network, edge: added.append(edge))
+    net.add_edge('c', 'd')
+    assert len(added) == 1
+
+    # edges with the same uid are checked right away
+    with pytest.raises(KeyError):
+        Network.from_arrays(['a', 'b'], ['b', 'c'], edge_uids=['x', 'x'])
+
+    with pytest.raises(Exception):
+        Network.from_arrays([1, 2], [1])
+
+    with pytest.raises(Exception):
+        Network.from_edge_index(np.array([1, 2]))
+
+
+def test_add_edges_deferred():
+    """Test to add edges in bulk."""
+    net = Network(directed=False)
+    net.add_edges(('a', 'b'), ('b', 'a'), Edge('b', 'c'), validate='deferred')
+    assert net.shape == (3, 2)
+    assert net.edges.counter[net.edges['a', 'b'].uid] == 2
+    assert net.degrees() == {'a': 1, 'b': 2, 'c': 1}
+
+    with pytest.raises(KeyError):
+        net.add_edges(Edge('x', 'y', uid='e1'), Edge('x', 'z', uid='e1'),
+                      validate='deferred')
+    assert net.shape == (3, 2)
+
+    net = Network(multiedges=True)
+    net.add_edges(('a', 'b'), ('a', 'b'), validate='deferred')
+    assert net.shape == (2, 2)
+
+
+def test_snapshot():
+    """Test the read-only snapshot of the network."""
+    net = Network()
+    net.add_edges(('a', 'b'), ('b', 'c'), ('c', 'd'))
+    csr = net.compile()
+
+    snap = net.snapshot()
+    assert snap.shape == net.shape
+    assert snap.compile() is csr
+    assert snap.nodes['a'] is net.nodes['a']
+
+    net.remove_edge('a', 'b')
+    net.add_edge('d', 'e')
+    assert net.shape == (5, 3)
+    assert snap.shape == (4, 3)
+    assert net.successors['a'] == set()
+    assert snap.successors['a'] == {snap.nodes['b']}
+    assert 'e' not in snap.nodes and ('a', 'b') in snap.edges
+    assert snap.compile() is csr
+
+    net.edges.counter[net.edges['b', 'c'].uid] += 1
+    assert snap.edges.counter[snap.edges['b', 'c'].uid] == 1
+
+    net.remove_node('c')
+    assert net.degrees() == {'a': 0, 'b': 0, 'd': 1, 'e': 1}
+    assert snap.degrees() == {'a': 1, 'b': 2, 'c': 2, 'd': 1}
+
+    # changes of the snapshot raise an error
+    with pytest.raises(TypeError):
+        snap.add_edge('x', 'y')
+    with pytest.raises(TypeError):
+        snap.remove_edge('a', 'b')
+    with pytest.raises(TypeError):
+        snap.remove_node('a')
+    with pytest.raises(TypeError):
+        snap.edges.counter[snap.edges['b', 'c'].uid] = 5
+    assert snap.shape == (4, 3) and net.shape == (4, 1)
+    assert snap.edges.counter[snap.edges['b', 'c'].uid] == 1
+
+    # the attributes of the network are isolated
+    net = Network(color='red')
+    net.add_edge('a', 'b', weight=1)
+    snap = net.snapshot()
+    snap['color'] = 'blue'
+    assert net['color'] == 'red'
+    net['size'] = 3
+    assert 'size' not in snap.attributes
+
+    # existing edges are not changed via the snapshot
+    with pytest.raises(TypeError):
+        snap.add_edge('a', 'b', weight=100)
+    with pytest.raises(TypeError):
+        snap.edges.extend([net.edges['a', 'b']], weight=100)
+    assert net.edges['a', 'b']['weight'] == 1
+    assert net.edges.counter[net.edges['a', 'b'].uid] == 1
+
+    # the attribute changes of the (shared) objects are seen by the snapshot
+    net.edges['a', 'b']['weight'] = 2
+    assert snap.degrees('weight') == net.degrees('weight') == {
+        'a': 2.0, 'b': 2.0}
+    assert list(snap.edges.attrs['weight']) == [2]
+
+    # copies do not share the objects and can be changed
+    other = snap.copy()
+    other.edges['a', 'b']['weight'] = 5
+    other.add_edge('b', 'c')
+    assert net.edges['a', 'b']['weight'] == 2
+    assert net.shape == snap.shape == (2, 1)
+
+    # the snapshots of temporal networks keep their nodes and edges
+    for events in ('tree', 'columnar'):
+        net = pp.TemporalNetwork(events=events)
+        net.add_edge('a', 'b', timestamp=1)
+        snap = net.snapshot()
+        net.add_edge('a', 'b', timestamp=2)
+        net.add_edge('b', 'c', timestamp=3)
+        assert len(list(net.edges[0:10])) == 3
+        assert [e.uid for e in snap.edges[0:10]] == [net.edges['a', 'b'].uid]
+        assert snap.shape == (2, 1) and net.shape == (3, 2)
+        with pytest.raises(TypeError):
+            snap.add_edge('a', 'b', timestamp=5)
+
+
+def test_fork():
+    """Test the copy-on-write fork of the network."""
+    net = Network()
+    net.add_edges(('a', 'b'), ('b', 'c'), ('c', 'd'))
+    net.edges['a', 'b']['weight'] = 2
+    net.degrees(weight='weight')
+
+    fork = net.fork()
+    assert fork.nodes['a'] is not net.nodes['a']
+    assert fork.edges['a', 'b'].v is fork.nodes['a']
+
+    # the fork can be changed without changing the network
+    fork.remove_edges(('a', 'b'), ('b', 'c'))
+    fork.add_edge('d', 'e')
+    assert fork.shape == (5, 2) and net.shape == (4, 3)
+    assert fork.successors['a'] == set()
+    assert net.successors['a'] == {net.nodes['b']}
+    assert fork.degrees(weight='weight') == {
+        'a': 0.0, 'b': 0.0, 'c': 1.0, 'd': 2.0, 'e': 1.0}
+    assert net.degrees(weight='weight') == {
+        'a': 2.0, 'b': 3.0, 'c': 2.0, 'd': 1.0}
+
+    # and vice versa
+    net.remove_node('d')
+    fork.edges.counter[fork.edges['c', 'd'].uid] += 1
+    assert net.shape == (3, 2) and fork.shape == (5, 2)
+    assert 'd' in fork.nodes and ('c', 'd') in fork.edges
+    assert fork.edges.counter[fork.edges['c', 'd'].uid] == 2
+
+    # the attributes are cloned on the first write
+    fork = net.fork()
+    fork.edges['a', 'b']['weight'] = 99
+    fork.nodes['a'].attributes['color'] = 'red'
+    assert net.edges['a', 'b']['weight'] == 2
+    assert net.nodes['a']['color'] is None
+    net.edges['a', 'b'].update(weight=3)
+    assert fork.edges['a', 'b']['weight'] == 99
+    assert fork.degrees(weight='weight')['a'] == 99.0
+    assert net.degrees(weight='weight')['a'] == 3.0
+    assert pickle.loads(pickle.dumps(net)).edges['a', 'b']['weight'] == 3
+
+    # forks of temporal networks are copies
+    for events in ('tree', 'columnar'):
+        net = pp.TemporalNetwork(events=events)
+        net.add_edge('a', 'b', timestamp=1)
+        fork = net.fork()
+        fork.add_edge('a', 'b', timestamp=2)
+        assert len(list(net.edges[0:10])) == 1
+        assert len(list(fork.edges[0:10])) == 2
+
+
+def test_subgraph():
+    """Test the subgraph views of the network."""
+    net = Network(directed=False)
+    net.add_edges(('a', 'b'), ('b', 'c'), ('c', 'd'), ('x', 'y'))
+
+    view = net.subgraph(['a', 'b', net.nodes['c'], 'z'])
+    assert view.shape == (3, 2)
+    assert list(view.nodes) == ['a', 'b', 'c']
+    assert 'a' in view and 'd' not in view
+
+    sub = view.materialize(uid='sub')
+    assert isinstance(sub, Network) and sub.uid == 'sub'
+    assert sub.shape == (3, 2)
+    assert sub.degrees() == {'a': 1, 'b': 2, 'c': 1}
+    assert net.shape == (6, 4)
+    assert sub.edges['a', 'b'] is net.edges['a', 'b']
+
+    sub = view.materialize(copy=True)
+    assert sub.shape == (3, 2)
+    assert sub.edges['a', 'b'] is not net.edges['a', 'b']
+    assert sub.edges['a', 'b'].w is sub.nodes['b']
+
+    # temporal objects are copied with their events
+    for events in ('tree', 'columnar'):
+        temp = pp.TemporalNetwork(events=events)
+        temp.add_edge('a', 'b', timestamp=1)
+        temp.add_edge('b', 'c', timestamp=2)
+        sub = temp.subgraph(['a', 'b']).materialize()
+        sub.add_edge('a', 'b', timestamp=3)
+        assert len(list(sub.edges[0:10])) == 2
+        assert len(list(temp.edges[0:10])) == 2
+        assert temp.edges['a', 'b'] is not sub.edges['a', 'b']
+
+    view = net.edge_subgraph([net.edges['c', 'd'], net.edges['x', 'y'].uid])
+    assert view.shape == (4, 2)
+    assert list(view.nodes) == ['c', 'd', 'x', 'y']
+
+    # views reflect changes of the network
+    net.remove_edge('c', 'd')
+    assert view.shape == (2, 1)
+
+    lcc = net.largest_connected_component()
+    assert lcc.shape == (3, 2)
+
+
 def test_get_edge():
     """Test to get edges."""
     net = Network(directed=False)
@@ -714,6 +1216,75 @@ def test_isub_networks():
     assert net_2.number_of_edges() == 2
 
 
+def test_network_memory_usage():
+    """Test the memory accounting of networks"""
+    net = Network()
+    net.add_edges(('a', 'b'), ('b', 'c'), ('c', 'a'))
+    net.edges['a', 'b']['label'] = 'x' * 1000
+
+    usage = net.memory_usage()
+    assert set(usage) == {'nodes', 'edges', 'attributes', 'events',
+                          'counters', 'index', 'properties', 'cache', 'other'}
+    assert all(size >= 0 for size in usage.values())
+    assert usage['nodes'] > 0 and usage['edges'] > 0
+    assert usage['attributes'] > 1000
+    assert usage['events'] == 0
+
+    # strings are only counted if deep is enabled
+    shallow = net.memory_usage(deep=False)
+    assert shallow['attributes'] < 1000
+    assert sum(shallow.values()) < sum(usage.values())
+
+    # cached structures are reported separately
+    net.compile()
+    assert net.memory_usage()['cache'] > usage['cache'] + 100
+
+    paths = pp.PathCollection()
+    paths.add('a', 'b', 'c', count=3)
+    usage = paths.memory_usage()
+    assert usage['objects'] > 0 and usage['counter'] > 0
+
+
+def test_network_set_operations():
+    """Test union, difference and intersection of networks"""
+    net_1 = Network()
+    net_1.add_edge('a', 'b', uid='a-b')
+    net_1.add_edge('a', 'b', uid='a-b')
+    net_1.add_edge('b', 'c', uid='b-c')
+
+    net_2 = Network()
+    net_2.add_edge('a', 'b', weight=2)
+    net_2.add_edge('c', 'd', uid='c-d')
+
+    # edges with the same nodes are merged and their counts are added
+    net_3 = net_1 + net_2
+    assert net_3.shape == (4, 3)
+    assert net_3.edges.counter['a-b'] == 3
+    assert net_3.edges['a-b']['weight'] == 2
+    assert net_3.degrees()['c'] == 2
+    assert net_1.edges.counter['a-b'] == 2
+
+    net_1 += net_2
+    assert net_1.shape == (4, 3)
+    assert net_1.edges.counter == net_3.edges.counter
+
+    # the intersection keeps the minimal counts
+    net_4 = net_3 & net_2
+    assert net_4.shape == (4, 2)
+    assert set(net_4.edges.keys()) == {'a-b', 'c-d'}
+    assert net_4.edges.counter['a-b'] == 1
+
+    # the difference removes the edges and the incident edges of the nodes
+    net_5 = Network()
+    net_5.add_edge('a', 'b')
+    net_6 = net_3 - net_5
+    assert net_6.shape == (2, 1)
+    assert 'c-d' in net_6.edges
+
+    net_3 -= net_5
+    assert net_3.shape == net_6.shape
+
+
 def test_network_edges():
     """Test the edges of a network"""
 
@@ -737,6 +1308,214 @@ def test_network_degrees():
     assert isinstance(list(net.nodes.keys())[0], (str, int))
 
 
+def test_network_weighted_degrees():
+    """Test the weighted degrees of a network"""
+    net = Network()
+    net.add_edge('a', 'b', weight=2)
+    net.add_edge('b', 'c', weight=3)
+    net.add_edge('c', 'c', weight=5)
+
+    assert net.degrees('weight') == {'a': 2.0, 'b': 5.0, 'c': 8.0}
+    assert net.indegrees(True) == {'a': 0.0, 'b': 2.0, 'c': 8.0}
+    assert net.outdegrees(True) == {'a': 2.0, 'b': 3.0, 'c': 5.0}
+    assert net.degrees(False) == {'a': 1.0, 'b': 2.0, 'c': 2.0}
+
+    # the degrees are updated on changes of the edges and weights
+    net.edges['a', 'b']['weight'] = 10
+    net.add_edge('c', 'a', weight=1)
+    net.remove_edge('b', 'c')
+    assert net.degrees('weight') == {'a': 11.0, 'b': 10.0, 'c': 6.0}
+    assert net.outdegrees('weight') == {'a': 10.0, 'b': 0.0, 'c': 6.0}
+
+    # direct changes of the attribute dicts are seen as well
+    net.edges['a', 'b'].attributes['weight'] = 7
+    assert net.degrees('weight') == {'a': 8.0, 'b': 7.0, 'c': 6.0}
+    del net.edges['c', 'a'].attributes['weight']
+    net.edges['c', 'c'].attributes.update(weight=2)
+    assert net.degrees('weight') == {'a': 8.0, 'b': 7.0, 'c': 3.0}
+
+    # copies use the attribute log of their own edges
+    other = deepcopy(net)
+    other.edges['a', 'b']['weight'] = 1
+    assert other.degrees('weight') == {'a': 2.0, 'b': 1.0, 'c': 3.0}
+    assert net.degrees('weight') == {'a': 8.0, 'b': 7.0, 'c': 3.0}
+
+    net = Network(directed=False)
+    net.add_edge('a', 'b', weight=2)
+    net.add_edge('b', 'c', weight=3)
+    assert net.indegrees('weight') == {'a': 2.0, 'b': 5.0, 'c': 3.0}
+    assert list(pp.statistics.degree_sequence(net, weight='weight')) == [
+        2.0, 5.0, 3.0]
+
+
+def test_network_attribute_columns():
+    """Test the columnar attributes of nodes and edges."""
+    net = Network()
+    net.add_edge('a', 'b', weight=2)
+    net.add_edge('b', 'c', weight=5)
+    net.add_edge('c', 'd', color='red')
+    net.nodes['a']['partition'] = 1
+
+    assert np.isnan(net.edges.attrs['weight'][2])
+    assert list(net.edges.attrs['weight'][:2]) == [2, 5]
+    assert list(net.edges.attrs['color']) == [None, None, 'red']
+    assert list(net.edges.attrs) == ['weight', 'color']
+    assert list(net.nodes.where(partition=1)) == [0]
+
+    assert list(net.edges.where(weight__gt=2)) == [1]
+    assert list(net.edges.where(weight__ne=2)) == [1]
+    assert list(net.edges.where(weight__in=[2, 5], color=None)) == []
+    assert list(net.edges.where(color='red')) == [2]
+    assert list(net.edges.weights()) == [2.0, 5.0, 1.0]
+    assert list(net.edges.weights(False)) == [1.0, 1.0, 1.0]
+
+    # the columns are updated if the attributes change
+    net.edges['a', 'b']['weight'] = 10
+    assert net.edges.attrs['weight'][0] == 10
+    net.edges['a', 'b'].attributes['weight'] = 7
+    assert net.edges.attrs['weight'][0] == 7
+
+    # changes of other attributes keep the cached column
+    weight = net.edges.attrs['weight']
+    net.edges['a', 'b']['color'] = 'blue'
+    assert net.edges.attrs['weight'] is weight
+    assert list(net.edges.attrs['color']) == ['blue', None, 'red']
+
+    # the type of the column follows the values
+    net.edges['b', 'c']['weight'] = 2.5
+    assert list(net.edges.attrs['weight'][:2]) == [7.0, 2.5]
+    net.edges['c', 'd']['weight'] = 'heavy'
+    assert list(net.edges.attrs['weight']) == [7, 2.5, 'heavy']
+    assert list(weight[:2]) == [7, 5]
+
+    del net.edges['a', 'b'].attributes['color']
+    net.edges['c', 'd'].attributes.pop('color')
+    assert 'color' not in net.edges.attrs
+    assert len(net.edges.attrs) == 1
+    assert list(net.edges.attrs['color']) == [None, None, None]
+    net.edges['b', 'c'].update(color='green', size=3)
+    assert list(net.edges.attrs) == ['weight', 'color', 'size']
+
+    net.edges.attrs['weight'] = np.array([1, 2, 3])
+    assert net.edges['c', 'd'].weight() == 3.0
+    assert list(net.compile().weight) == [1.0, 2.0, 3.0]
+
+    with pytest.raises(AttributeError):
+        net.edges.attrs['weight'] = [1, 2]
+
+
+def test_network_attribute_columns_isolated():
+    """Test that the columns of different networks do not interfere."""
+    busy, other = Network(), Network()
+    busy.add_edge('a', 'b', weight=1)
+    other.add_edge('a', 'b', weight=1)
+    other.add_edge('b', 'c', weight=2)
+    assert busy.edges.attrs['weight'][0] == other.edges.attrs['weight'][0]
+
+    resets = other.edges._attribute_changes[None]
+    column = other.edges.attrs['weight']
+    position = other.edges._changes.position
+
+    # more changes than the log of a collection holds
+    edge = busy.edges['a', 'b']
+    for i in range(2**17):
+        edge['weight'] = i
+    assert busy.edges.attrs['weight'][0] == 2**17 - 1
+
+    # the changes are not logged for the other network
+    assert other.edges._changes.position == position
+    assert other.edges.attrs['weight'] is column
+
+    # and its column is still updated without a rebuild
+    other.edges['b', 'c']['weight'] = 3
+    assert list(other.edges.attrs['weight']) == [1, 3]
+    assert other.edges._attribute_changes[None] == resets
+
+
+def test_network_subscribe():
+    """Test the observers of the network changes."""
+    net = Network()
+    events: list = []
+
+    def observer(network, obj):
+        events.append((network, obj.uid))
+
+    for event in ('add_node', 'remove_node', 'add_edge', 'remove_edge'):
+        net.subscribe(event, observer)
+
+    net.add_edge('a', 'b', uid='a-b')
+    net.add_node('c')
+    assert [uid for _, uid in events] == ['a-b', 'a', 'b', 'c']
+    assert all(network is net for network, _ in events)
+
+    events.clear()
+    net.remove_node('a')
+    assert [uid for _, uid in events] == ['a-b', 'a']
+
+    # snapshots cannot be changed and do not notify the observers
+    events.clear()
+    snap = net.snapshot()
+    with pytest.raises(TypeError):
+        snap.add_edge('b', 'c')
+    assert events == []
+
+    net.unsubscribe('add_node', observer)
+    net.add_node('d')
+    assert events == []
+
+    with pytest.raises(AttributeError):
+        net.subscribe('unknown', observer)
+
+
+def test_network_pickle():
+    """Test the compact pickling of networks."""
+    net = Network(uid='net', directed=False, multiedges=True)
+    net.add_edge('a', 'b', uid='a-b', weight=2.5)
+    net.add_edge('b', 'c', weight=3)
+    net.add_edge('b', 'c', color='red')
+    net.add_node('d', color='blue')
+    net['name'] = 'test'
+
+    other = pickle.loads(pickle.dumps(net))
+
+    # the structure is compiled from the packed state
+    assert '_packed' in other.__dict__
+    assert other.shape == net.shape
+    assert other.degrees() == net.degrees()
+    csr = other.compile()
+    for key in ('uids', 'edge_uids', 'v', 'w', 'weight', 'count', 'indptr'):
+        assert list(getattr(csr, key)) == list(getattr(net.compile(), key))
+
+    # packed networks are pickled without rebuilding them
+    assert pickle.loads(pickle.dumps(other)).shape == net.shape
+    assert '_packed' in other.__dict__
+
+    # the network is rebuilt on the first access of its objects
+    assert len(other.edges) == 3
+    assert '_packed' not in other.__dict__
+    assert other.compile() is csr
+
+    assert other.uid == 'net' and other['name'] == 'test'
+    assert not other.directed and other.multiedges
+    assert list(other.nodes.keys()) == list(net.nodes.keys())
+    assert list(other.edges.keys()) == list(net.edges.keys())
+    assert other.edges['a-b']['weight'] == 2.5
+    assert other.nodes['d']['color'] == 'blue'
+    assert other.degrees() == net.degrees()
+    assert other.edges.counter == net.edges.counter
+    assert [e.has_python_uid for e in other.edges.values()] == \
+        [e.has_python_uid for e in net.edges.values()]
+
+    # other node classes are pickled as usual
+    net = Network()
+    net.add_node(pp.core.path.Path('a', 'b', uid='a-b'))
+    assert not net._compact()
+    assert pickle.loads(pickle.dumps(net)).nodes.keys() == net.nodes.keys()
+
+    # empty networks
+    assert pickle.loads(pickle.dumps(Network())).shape == (0, 0)
+
+
 def test_network_undirected():
     """Test undirected networks"""
     net = Network(directed=False)
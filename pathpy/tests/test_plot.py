@@ -20,14 +20,15 @@ def test_plot_empty_network_plot():
     net.plot()
 
 
-def test_network_plot():
+def test_network_plot(tmp_path):
     """Test the plot function on a network."""
     net = Network()
     net.add_node('a', color='red')
     net.add_node('b', size=40)
     net.add_edge('a', 'b', uid='a-b', color='blue')
 
-    net.plot(filename='simple_plot.html', node_color={'a': 'green'})
+    net.plot(filename=str(tmp_path / 'simple_plot.html'),
+             node_color={'a': 'green'})
 
 
 # def test_parse_config():
@@ -178,7 +179,7 @@ def test_network_plot():
 #     net.plot(filename='d3js_test.html', **style)
 
 
-def test_temporal_network():
+def test_temporal_network(tmp_path):
     """Test to plot a temporal network."""
     tn = TemporalNetwork(directed=False)
     #tn.add_node('a', color='blue', size=20)
@@ -209,7 +210,7 @@ def test_temporal_network():
     }
 
     # print('xxxxxxxx')
-    tn.plot(filename='d3js_test.html', **style)
+    tn.plot(filename=str(tmp_path / 'd3js_test.html'), **style)
     # # print(tn.nodes['a'][0, 'color'])
     # x = tn.nodes['a']._events
     # print(x)
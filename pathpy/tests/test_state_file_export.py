@@ -25,9 +25,9 @@ def paths():
     return pc
 
 
-def test_state_file_export(paths):
-    pp.io.infomap.to_state_file(paths, 'pathpy/tests/data/test.state', max_memory=1)
-    with io.open('pathpy/tests/data/test.state', 'r') as f:
+def test_state_file_export(paths, tmp_path):
+    pp.io.infomap.to_state_file(paths, str(tmp_path / 'test.state'), max_memory=1)
+    with io.open(str(tmp_path / 'test.state'), 'r') as f:
         lines1 = f.readlines()
     # cross check with ground truth for toy example
     with io.open('pathpy/tests/data/correct.state', 'r') as f:
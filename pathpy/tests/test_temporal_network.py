@@ -8,6 +8,7 @@
 # Copyright (c) 2016-2020 Pathpy Developers
 # =============================================================================
 
+import pickle
 import pytest
 import pathpy as pp
 from pathpy import Node, Edge
@@ -21,7 +22,7 @@ from pathpy.models.temporal_network import (
     TemporalNetwork
 )
 
-from pathpy.core.temporal import TemporalPathPyObject
+from pathpy.core.temporal import TemporalPathPyObject, EventStore, EventView
 from pathpy.models.temporal_network import TemporalNodeCollection, TemporalEdgeCollection
 
 
@@ -172,6 +173,248 @@ def test_temporal_edge_collection():
     edges.add('a', 'b', uid='ab', start=8, end=10, color='red')
 
 
+@pytest.mark.parametrize('events', ('tree', 'columnar'))
+def test_temporal_edges_extend(events):
+    """Test to extend the edges with duplicate temporal edges"""
+    a, b = TemporalNode('a'), TemporalNode('b')
+    net = TemporalNetwork(events=events)
+    net.edges.extend([TemporalEdge(a, b, timestamp=1, color='red'),
+                      TemporalEdge(a, b, timestamp=3, color='blue')])
+    assert len(net.edges) == 1
+    assert [(e.start, e.end, e.attributes['color'])
+            for e in net.edges[:]] == [(1, 2, 'red'), (3, 4, 'blue')]
+    assert [e.start for e in net.edges[2:4]] == [3]
+
+    net = TemporalNetwork(events=events)
+    net.add_edges(TemporalEdge(a, b, timestamp=1),
+                  TemporalEdge(a, b, timestamp=5), validate='deferred')
+    assert net.shape == (2, 1)
+    assert [e.start for e in net.edges[:]] == [1, 5]
+
+
+def test_temporal_network_remove_nodes():
+    """Test to remove nodes and their events from a temporal network"""
+    net = TemporalNetwork()
+    net.add_edge('a', 'b', timestamp=1)
+    net.add_edge('b', 'c', timestamp=2)
+    net.add_edge('c', 'd', timestamp=3)
+    net.add_edge('a', 'b', timestamp=4)
+
+    net.remove_nodes('b', 'x')
+    assert net.shape == (3, 1)
+    assert len(net.edges.events) == 1
+    assert [e.uid for e in net.edges[0:10]] == [net.edges['c', 'd'].uid]
+
+
+def test_temporal_network_pickle():
+    """Test the compact pickling of temporal networks"""
+    net = TemporalNetwork()
+    net.add_edge('a', 'b', uid='ab', start=1, end=4, color='blue')
+    net.add_edge('b', 'c', uid='bc', timestamp=3, size=0.5)
+    net.add_edge('a', 'b', uid='ab', start=7, end=9, color='green')
+
+    other = pickle.loads(pickle.dumps(net))
+    assert other.shape == net.shape
+    assert sorted(other.edges.events) == sorted(net.edges.events)
+    assert sorted(other.nodes.events) == sorted(net.nodes.events)
+    assert other.edges['ab'][7, 'color'] == 'green'
+    assert other.edges['ab'][1, 'color'] == 'blue'
+    assert other.edges['bc']['size'] == 0.5
+    assert [e.uid for e in other.edges[2:4]] == [e.uid for e in net.edges[2:4]]
+    assert (other.start, other.end) == (net.start, net.end)
+
+    # slices without events of restored objects without attributes
+    for events in ('tree', 'columnar'):
+        net = TemporalNetwork(events=events)
+        net.add_edge(TemporalEdge(TemporalNode('a'), TemporalNode('b'),
+                                  uid='ab', start=1, end=2))
+        other = pickle.loads(pickle.dumps(net))
+        assert list(other.edges['ab'][10:20]) == []
+        assert list(other.edges[10:20]) == []
+        assert [e.start for e in other.edges['ab'][0:5]] == [1]
+
+
+def test_temporal_network_columnar():
+    """Test the columnar event store of temporal networks"""
+    nets = []
+    for events in ('tree', 'columnar'):
+        net = TemporalNetwork(events=events)
+        net.add_edge('a', 'b', uid='ab', start=1, end=4, color='blue')
+        net.add_edge('b', 'c', uid='bc', start=3, end=6, color='red')
+        net.add_edge('a', 'b', uid='ab', start=7, end=9, color='green')
+        nets.append(net)
+
+    tree, net = nets
+    assert net.edges.columnar and not tree.edges.columnar
+    assert net.nodes.columnar and not tree.nodes.columnar
+    assert [n.uid for n in net.nodes[0:10]] == [n.uid for n in tree.nodes[0:10]]
+    assert net.shape == tree.shape
+    assert (net.start, net.end) == (tree.start, tree.end)
+    assert [(e.uid, e['color']) for e in net.edges[2:8]] == \
+        [(e.uid, e['color']) for e in tree.edges[2:8]]
+    assert net.edges['ab'][7, 'color'] == 'green'
+
+    arrays = net.edges.arrays('color')
+    for key, values in tree.edges.arrays('color').items():
+        assert list(arrays[key]) == list(values)
+    assert list(arrays['src']) == ['a', 'b', 'a']
+    assert list(arrays['start']) == [1, 3, 7]
+
+    # overlapping events are merged
+    net.add_edge('a', 'b', uid='ab', start=8, end=10, size=3)
+    assert [(e.start, e.end) for e in net.edges['ab'][8:9]] == [(8, 9)]
+    assert net.edges['ab'][8, 'size'] == 3
+    assert net.edges['ab'][8, 'color'] == 'green'
+
+    other = pickle.loads(pickle.dumps(net))
+    assert other.edges.columnar
+    assert sorted(other.edges.events) == sorted(net.edges.events)
+
+    net.remove_edge('bc')
+    assert [e.uid for e in net.edges[0:10]] == ['ab'] * 4
+
+    with pytest.raises(AttributeError):
+        TemporalNetwork(events='list')
+
+    # the snapshots keep the events of the collections
+    for events in ('tree', 'columnar'):
+        net = TemporalNetwork(events=events)
+        net.add_edge('a', 'b', timestamp=1)
+        net.add_edge('a', 'b', timestamp=2)
+
+        tmp = TemporalNetwork(events=events)
+        tmp.add_edge('a', 'b', timestamp=1)
+        tmp.add_edge('a', 'b', timestamp=2)
+        edges, nodes = tmp.edges._snapshot(), tmp.nodes._snapshot()
+        tmp.add_edge('b', 'c', timestamp=3)
+        tmp.remove_edge('a', 'b')
+        assert sorted(i.begin for i in edges.events) == [1, 2]
+        assert len(list(edges[0:10])) == 2 and len(list(tmp.edges[0:10])) == 1
+        assert 'c' not in nodes and len(nodes.events) == 2
+
+        other = net.copy()
+        net.add_edge('a', 'b', timestamp=10)
+        assert len(list(net.edges[0:20])) == 3
+        assert len(list(other.edges[0:20])) == 2
+        assert other.edges['a', 'b'] is not net.edges['a', 'b']
+        assert not net.edges._shared and not net.nodes._shared
+
+
+def test_event_store():
+    """Test the merge and the removal of events in the columnar store"""
+    store = EventStore()
+    a, b, c = (store.register(uid) for uid in 'abc')
+    for i, (start, end) in enumerate(((5, 6), (1, 3), (3, 4))):
+        store.append(i, start, end, {'n': i})
+    assert [(i.begin, i.data) for i in store] == [(1, 'b'), (3, 'c'), (5, 'a')]
+
+    # new events are merged after the stored events with equal starts
+    store.append(c, 3, 9, {})
+    store.append(a, 0, 1, {'n': 3})
+    assert [(i.begin, i.end, i.data) for i in store] == [
+        (0, 1, 'a'), (1, 3, 'b'), (3, 4, 'c'), (3, 9, 'c'), (5, 6, 'a')]
+    assert list(store.arrays('n')['n']) == [3, 1, 2, None, 0]
+
+    # integer times are kept (as in the interval trees)
+    assert store.arrays()['start'].dtype.kind == 'i'
+    assert all(type(i.begin) is int for i in store)
+
+    # the events of removed objects are masked until the next flush
+    store._replace(a, [(7, 8, {'n': 4})])
+    store._drop([b])
+    assert len(store) == 3 and store._deleted == 3
+    assert [(i.begin, i.end) for i in EventView(store, c)] == [(3, 4), (3, 9)]
+    assert store._dead is not None
+    assert [(i.begin, i.data) for i in EventView(store, a)] == [(7, {'n': 4})]
+    assert store._dead is None and len(store) == 3
+    assert [(i.begin, i.data) for i in store] == [(3, 'c'), (3, 'c'), (7, 'a')]
+    assert (store.begin(), store.end()) == (3, 9)
+
+    # mixed integer and float times are stored as floats
+    store.append(b, 0.5, 2, {})
+    assert store.arrays()['start'].dtype.kind == 'f'
+    assert [i.begin for i in store] == [0.5, 3, 3, 7]
+
+
+def test_temporal_network_extend_events():
+    """Test the bulk insertion of edge events"""
+    for events in ('tree', 'columnar'):
+        net = TemporalNetwork(events=events)
+        net.add_edge('a', 'b', start=0, end=1, color='red')
+        net.extend_events(['a', 'b', 'a'], ['b', 'c', 'b'],
+                          np.array([1, 3, 7]), np.array([4, 6, 9]),
+                          columns={'color': ['blue', 'green', 'black']})
+
+        ref = TemporalNetwork(events=events)
+        for v, w, start, end, color in [('a', 'b', 0, 1, 'red'),
+                                        ('a', 'b', 1, 4, 'blue'),
+                                        ('b', 'c', 3, 6, 'green'),
+                                        ('a', 'b', 7, 9, 'black')]:
+            ref.add_edge(v, w, start=start, end=end, color=color)
+
+        assert net.shape == ref.shape
+        assert (net.start, net.end) == (ref.start, ref.end)
+        assert net.edges['a', 'b']['color'] == 'black'
+        assert net.edges['a', 'b'][3, 'color'] == 'blue'
+        assert sorted((e.uid, e.start) for e in net.nodes[0:10]) == \
+            sorted((e.uid, e.start) for e in ref.nodes[0:10])
+        assert [(e.start, e['color']) for e in net.edges['a', 'b'][0:10]] == \
+            [(e.start, e['color']) for e in ref.edges['a', 'b'][0:10]]
+        assert len(list(net.edges[2:8])) == len(list(ref.edges[2:8]))
+
+
+def test_temporal_network_window():
+    """Test immutable windows of temporal events"""
+    for events in ('tree', 'columnar'):
+        net = TemporalNetwork(events=events)
+        net.add_edge('a', 'b', uid='ab', start=1, end=4, color='blue')
+        net.add_edge('b', 'c', uid='bc', start=3, end=6, color='red')
+        net.add_edge('a', 'b', uid='ab', start=7, end=9, color='green')
+
+        window = net.edges.window(2, 8)
+        assert len(window) == 3
+        assert list(window.v) == ['a', 'b', 'a']
+        assert list(window.w) == ['b', 'c', 'b']
+        assert list(window.start) == [1, 3, 7]
+        assert list(window.end) == [4, 6, 9]
+        assert list(window['color']) == ['blue', 'red', 'green']
+        assert list(window['size']) == [None, None, None]
+        assert [(e.uid, s) for e, s, _ in window] == \
+            [('ab', 1), ('bc', 3), ('ab', 7)]
+        assert [e.uid for e in window.objects()] == ['ab', 'bc']
+
+        # the window is not affected by later changes
+        net.add_edge('c', 'd', uid='cd', start=2, end=3)
+        assert len(window) == 3
+        with pytest.raises(ValueError):
+            window.start[0] = 0
+
+        assert list(net.edges.window(end=2).uids) == ['ab']
+        assert len(net.edges.window()) == 4
+
+
+@pytest.mark.parametrize('events', ('tree', 'columnar'))
+def test_temporal_events_normalisation(events):
+    """Test the lazy normalisation of overlapping events"""
+    net = TemporalNetwork(events=events)
+    net.add_edge('a', 'b', uid='ab', start=1, end=4, color='blue')
+    net.add_edge('a', 'b', uid='ab', start=5, end=6, color='red')
+    edge = net.edges['ab']
+
+    # events which do not overlap are not normalised
+    assert not edge._dirty
+
+    net.add_edge('a', 'b', uid='ab', start=3, end=5, size=2)
+    assert edge._dirty
+    assert [(e.start, e.end, e.attributes.get('color'),
+             e.attributes.get('size')) for e in edge[0:10]] == [
+                 (1, 3, 'blue', None), (3, 4, 'blue', 2),
+                 (4, 5, None, 2), (5, 6, 'red', None)]
+    assert not edge._dirty
+    assert edge[3.5, 'color'] == 'blue'
+    assert len(net.edges.window()) == 4
+
+
 def test_temporal_network():
     """Test a temporal network"""
 
@@ -0,0 +1,120 @@
+#!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+# =============================================================================
+# File      : memory.py -- Helper functions to measure the memory usage
+# Author    : Pathpy Developers
+#
+# Copyright (c) 2016-2021 Pathpy Developers
+# =============================================================================
+import sys
+from collections import deque
+from types import (BuiltinFunctionType, FunctionType, MethodType, ModuleType)
+from typing import Any, Optional
+
+import numpy as np
+
+# types which are not counted and whose references are not followed
+_SKIP = (type, ModuleType, FunctionType, MethodType, BuiltinFunctionType,
+         type(None))
+
+# types without references
+_SCALARS = (str, bytes, int, float, complex, bool)
+
+
+def sizeof(*objs: Any, seen: Optional[set] = None, deep: bool = True) -> int:
+    """Return the number of bytes used by objects and their references.
+
+    The references of containers, numpy arrays and objects with a
+    ``__dict__`` or ``__slots__`` are followed. Objects whose ids are in
+    ``seen`` are not counted (again), the ids of the counted objects are
+    added to ``seen``. Hence, a shared ``seen`` set can be used to assign
+    each object to the first component it is reached from.
+
+    Parameters
+    ----------
+    objs : Any
+
+        Objects which are measured.
+
+    seen : set, optional (default = None)
+
+        Ids of the objects which are already counted.
+
+    deep : bool, optional (default = True)
+
+        If ``False`` strings and numbers (e.g. uids and attribute values) are
+        not counted.
+
+    Returns
+    -------
+    int
+
+        Number of bytes.
+
+    """
+    if seen is None:
+        seen = set()
+
+    size = 0
+    stack = list(objs)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SKIP):
+            continue
+        if isinstance(obj, _SCALARS):
+            if deep:
+                seen.add(id(obj))
+                size += sys.getsizeof(obj)
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        stack.extend(_references(obj))
+
+    return size
+
+
+def _references(obj: Any) -> list:
+    """Helper function to return the objects referred to by an object."""
+    if isinstance(obj, np.ndarray):
+        return _array_references(obj)
+    return _container_references(obj) + _attribute_references(obj)
+
+
+def _array_references(array: np.ndarray) -> list:
+    """Helper function to return the base and the objects of an array."""
+    refs = [array.base] if array.base is not None else []
+    if array.dtype == object:
+        refs.extend(array.ravel().tolist())
+    return refs
+
+
+def _container_references(obj: Any) -> list:
+    """Helper function to return the items of a container."""
+    if isinstance(obj, dict):
+        return list(obj.keys()) + list(obj.values())
+    if isinstance(obj, (list, tuple, set, frozenset, deque)):
+        return list(obj)
+    return []
+
+
+def _attribute_references(obj: Any) -> list:
+    """Helper function to return the ``__dict__`` and slots of an object."""
+    refs = [vars(obj)] if hasattr(obj, '__dict__') else []
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ('__dict__', '__weakref__'):
+                refs.append(getattr(obj, name, None))
+    return refs
+
+
+# =============================================================================
+# eof
+#
+# Local Variables:
+# mode: python
+# mode: linum
+# mode: auto-fill
+# fill-column: 79
+# End: